@@ -0,0 +1,18 @@
+"""One blueprint per area of the app, registered in create_app().
+
+CLI commands attach to the blueprint of their section and stay top-level
+(`flask rebuild-health-summary`).
+"""
+
+from blueprints.athletes import athletes_bp
+from blueprints.calendar import calendar_bp
+from blueprints.goals import goals_bp
+from blueprints.health import health_bp
+from blueprints.main import main_bp
+from blueprints.motivation import motivation_bp
+from blueprints.plan import plan_bp
+from blueprints.schedule import schedule_bp
+from blueprints.tournament import tournament_bp
+from blueprints.videos import videos_bp
+
+BLUEPRINTS = (main_bp, athletes_bp, goals_bp, plan_bp, schedule_bp, calendar_bp, health_bp, tournament_bp, motivation_bp, videos_bp)
@@ -0,0 +1,172 @@
+"""Sign-in, sign-up and API tokens; resolves the acting athlete for every request."""
+
+import hashlib
+import secrets
+
+import click
+from flask import Blueprint, render_template, request, redirect, url_for, flash, g, session
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from extensions import db
+from models import UserProfile
+from blueprints.tournament import get_leaderboard, link_system_challenges
+
+athletes_bp = Blueprint('athletes', __name__, cli_group=None)
+
+# --- Current user ---
+# The acting athlete is resolved once per request into g.user: from an API token
+# (Authorization: Bearer ...) when one is sent, otherwise from the session, which
+# only holds an athlete after they signed in with their password. Anonymous
+# requests can only reach the sign-in and sign-up endpoints.
+# Routes read g.user instead of querying UserProfile themselves.
+
+# Endpoints served without a signed-in athlete
+PUBLIC_ENDPOINTS = {'static', 'athletes.login', 'athletes.add_athlete'}
+MIN_PASSWORD_LENGTH = 8
+
+def hash_api_token(token):
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+@athletes_bp.before_app_request
+def load_current_user():
+    g.user = None
+    if request.endpoint == 'static':
+        return None
+
+    authorization = request.headers.get('Authorization', '')
+    if authorization.startswith('Bearer '):
+        token = authorization[len('Bearer '):].strip()
+        g.user = UserProfile.query.filter_by(api_token_hash=hash_api_token(token)).first()
+        if g.user is None:
+            return {'error': 'Invalid API token.'}, 401
+        return None
+
+    user_id = session.get('user_id')
+    if user_id is not None:
+        g.user = db.session.get(UserProfile, user_id)
+        if g.user is None:
+            session.pop('user_id')
+    if g.user is None and request.endpoint not in PUBLIC_ENDPOINTS:
+        if request.path.startswith('/api/'):
+            return {'error': 'Sign in or send an API token.'}, 401
+        return redirect(url_for('athletes.login', next=request.full_path))
+    return None
+
+def check_password(athlete, password):
+    return bool(athlete.password_hash and password) and check_password_hash(athlete.password_hash, password)
+
+def safe_next_url(target):
+    """`target` if it is a path on this site, so ?next= cannot send the browser elsewhere."""
+    if target and target.startswith('/') and not target.startswith('//') and '\\' not in target:
+        return target
+    return None
+
+def default_user():
+    """The first profile, created if there is none. Seed scripts attach their rows to it."""
+    user = UserProfile.query.order_by(UserProfile.id).first()
+    if user is None:
+        # Create a default profile on first run, to prevent errors on every page
+        user = UserProfile(level=1, experience_points=0, name='Athlete')
+        db.session.add(user)
+        db.session.commit()
+    return user
+
+@athletes_bp.app_context_processor
+def inject_current_user():
+    return {'current_user': g.get('user')}
+
+@athletes_bp.route('/athletes')
+def athletes():
+    return render_template('athletes.html', active_page='athletes', min_password_length=MIN_PASSWORD_LENGTH)
+
+@athletes_bp.route('/login', methods=['GET', 'POST'])
+def login():
+    """Signs an athlete in by name and password; signing in as someone else switches athlete."""
+    next_url = safe_next_url(request.values.get('next'))
+    if request.method == 'POST':
+        name = request.form.get('name', '').strip()
+        password = request.form.get('password', '')
+        # Names are not unique in older data, so the password picks the profile
+        athlete = next((candidate for candidate in UserProfile.query.filter_by(name=name).order_by(UserProfile.id)
+                        if check_password(candidate, password)), None)
+        if athlete is None:
+            flash('Unknown name or wrong password.', 'danger')
+            return redirect(url_for('athletes.login', next=next_url))
+
+        session.clear()
+        session['user_id'] = athlete.id
+        flash(f'Welcome back, {athlete.name}!', 'success')
+        return redirect(next_url or url_for('main.index'))
+
+    return render_template('login.html', next_url=next_url, min_password_length=MIN_PASSWORD_LENGTH)
+
+@athletes_bp.route('/logout', methods=['POST'])
+def logout():
+    session.clear()
+    flash('You have been signed out.', 'success')
+    return redirect(url_for('athletes.login'))
+
+@athletes_bp.route('/athletes/add', methods=['POST'])
+def add_athlete():
+    """Signs up a new athlete and signs them in."""
+    form_page = url_for('athletes.athletes') if g.user else url_for('athletes.login')
+    name = request.form.get('name', '').strip()
+    password = request.form.get('password', '')
+    if not name:
+        flash('Name is required.', 'danger')
+        return redirect(form_page)
+    if len(password) < MIN_PASSWORD_LENGTH:
+        flash(f'Password must be at least {MIN_PASSWORD_LENGTH} characters.', 'danger')
+        return redirect(form_page)
+    if UserProfile.query.filter_by(name=name).first():
+        flash('That name is taken; please choose another.', 'danger')
+        return redirect(form_page)
+
+    athlete = UserProfile(name=name, level=1, experience_points=0, password_hash=generate_password_hash(password))
+    db.session.add(athlete)
+    db.session.flush()
+    link_system_challenges([athlete.id])
+    db.session.commit()
+    get_leaderboard().update(athlete.id, athlete.level, athlete.experience_points)
+    session.clear()
+    session['user_id'] = athlete.id
+    flash(f'Welcome, {name}! Your profile has been created.', 'success')
+    return redirect(url_for('main.index'))
+
+@athletes_bp.route('/athletes/token', methods=['POST'])
+def regenerate_api_token():
+    """Issues a new bearer token for the current athlete; only its hash is stored.
+
+    Requires the athlete's password, so neither a borrowed session nor an
+    existing token can mint a new token.
+    """
+    if not check_password(g.user, request.form.get('password', '')):
+        flash('Wrong password; no new token was issued.', 'danger')
+        return redirect(url_for('athletes.athletes'))
+    token = secrets.token_urlsafe(32)
+    g.user.api_token_hash = hash_api_token(token)
+    db.session.commit()
+    flash(f'New API token (shown once): {token}', 'success')
+    return redirect(url_for('athletes.athletes'))
+
+@athletes_bp.cli.command('set-password')
+@click.argument('user_id', type=int)
+@click.option('--name', help='Sign-in name to set as well.')
+@click.password_option()
+def set_password(user_id, name, password):
+    """Sets an athlete's password, and optionally their name, e.g. for profiles created before sign-in existed."""
+    athlete = db.session.get(UserProfile, user_id)
+    if athlete is None:
+        raise SystemExit(f"No athlete with id {user_id}.")
+    if len(password) < MIN_PASSWORD_LENGTH:
+        raise SystemExit(f"Password must be at least {MIN_PASSWORD_LENGTH} characters.")
+    if name is not None:
+        name = name.strip()
+        if not name:
+            raise SystemExit("Name cannot be empty.")
+        if UserProfile.query.filter(UserProfile.name == name, UserProfile.id != user_id).first():
+            raise SystemExit(f"The name {name!r} is taken.")
+        athlete.name = name
+    athlete.password_hash = generate_password_hash(password)
+    db.session.commit()
+    print(f"Password set for {athlete.name}; they sign in with that name.")
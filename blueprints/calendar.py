@@ -0,0 +1,157 @@
+"""Workout calendar and its per-day events API."""
+
+from datetime import datetime, timedelta
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify, g
+from sqlalchemy import func
+
+from extensions import db
+from models import Event
+from helpers import is_supported_month, month_window
+
+calendar_bp = Blueprint('calendar', __name__, cli_group=None)
+
+def calendar_stats(window_start, window_end):
+    """Workout and rest-day counts for a date window, computed in one grouped query."""
+    counts = db.session.query(Event.category, Event.status, func.count(Event.id)).filter(
+        Event.start_time >= window_start,
+        Event.start_time < window_end,
+        Event.category.in_(['workout', 'rest'])
+    ).group_by(Event.category, Event.status).all()
+
+    total_workouts = sum(n for category, status, n in counts if category == 'workout')
+    completed_workouts = sum(n for category, status, n in counts if category == 'workout' and status == 'completed')
+    rest_days = sum(n for category, status, n in counts if category == 'rest')
+    return {
+        'total_workouts': total_workouts,
+        'completed_workouts': completed_workouts,
+        'planned_workouts': total_workouts - completed_workouts,
+        'rest_days': rest_days,
+        'completion_percentage': round((completed_workouts / total_workouts) * 100) if total_workouts > 0 else 0
+    }
+
+@calendar_bp.route('/calendar')
+def calendar():
+    now = datetime.utcnow()
+    view_year = request.args.get('year', now.year, type=int)
+    view_month = request.args.get('month', now.month, type=int)
+    if not is_supported_month(view_year, view_month):
+        view_year, view_month = now.year, now.month
+    window_start, window_end = month_window(view_year, view_month)
+
+    # 1. Calculate overview stats for the requested month
+    #    (the grid itself is filled lazily from /api/calendar)
+    stats = calendar_stats(window_start, window_end)
+
+    # 2. NEW: Fetch upcoming events for the next 5 days
+    today = now.date()
+    five_days_later = today + timedelta(days=5)
+    upcoming_events = Event.query.filter(
+        Event.start_time >= today,
+        Event.start_time < five_days_later,
+        Event.status == 'scheduled'
+    ).order_by(Event.start_time.asc()).all()
+
+    # 3. Pass all data to the template
+    return render_template(
+        'calander.html',
+        active_page='calendar',
+        view_year=view_year, view_month=view_month,
+        upcoming_events=upcoming_events,  # Pass the new data
+        **stats
+    )
+
+@calendar_bp.route('/api/calendar')
+def calendar_api():
+    """Events grouped per day for [from, to), plus the overview stats for that range."""
+    try:
+        range_start = datetime.strptime(request.args.get('from', ''), '%Y-%m-%d')
+        range_end = datetime.strptime(request.args.get('to', ''), '%Y-%m-%d')
+    except ValueError:
+        return {'error': 'from and to must be dates in YYYY-MM-DD format.'}, 400
+    # Compared as a difference, since range_start + the limit can pass datetime.max
+    if not 0 < (range_end - range_start).days <= current_app.config['CALENDAR_API_MAX_DAYS']:
+        return {'error': f"The range must be between 1 and {current_app.config['CALENDAR_API_MAX_DAYS']} days."}, 400
+
+    events = Event.query.filter(
+        Event.start_time >= range_start,
+        Event.start_time < range_end
+    ).order_by(Event.start_time.asc(), Event.id.asc()).all()
+
+    # Several events can share a day, so each day maps to a list
+    days = {}
+    for calendar_event in events:
+        days.setdefault(calendar_event.start_time.strftime('%Y-%m-%d'), []).append({
+            'id': calendar_event.id, 'type': calendar_event.category, 'name': calendar_event.title,
+            'time': calendar_event.start_time.strftime('%I:%M %p'), 'status': calendar_event.status
+        })
+
+    response = jsonify({
+        'from': range_start.strftime('%Y-%m-%d'),
+        'to': range_end.strftime('%Y-%m-%d'),
+        'days': days,
+        'stats': calendar_stats(range_start, range_end)
+    })
+    response.cache_control.no_cache = True  # Always revalidate; the ETag makes that cheap
+    response.add_etag()
+    return response.make_conditional(request)
+
+@calendar_bp.route('/calendar/add', methods=['POST'])
+def add_event():
+    title = request.form.get('title')
+    category = request.form.get('category')
+    start_time_str = request.form.get('start_time')
+
+    if not all([title, category, start_time_str]):
+        flash('All fields are required.', 'danger')
+        return redirect(url_for('calendar.calendar'))
+
+    # Convert the string from the form into a Python datetime object
+    start_time = datetime.strptime(start_time_str, '%Y-%m-%dT%H:%M')
+
+    new_event = Event(user_id=g.user.id, title=title, category=category, start_time=start_time)
+    db.session.add(new_event)
+    db.session.commit()
+
+    flash('Plan added successfully!', 'success')
+    return redirect(url_for('calendar.calendar'))
+
+@calendar_bp.route('/calendar/delete/<int:event_id>', methods=['POST'])
+def delete_event(event_id):
+    event_to_delete = Event.query.get_or_404(event_id)
+    db.session.delete(event_to_delete)
+    db.session.commit()
+    flash('Plan deleted successfully.', 'success')
+    return redirect(url_for('calendar.calendar'))
+
+@calendar_bp.route('/calendar/edit/<int:event_id>', methods=['GET', 'POST'])
+def edit_event(event_id):
+    event = Event.query.get_or_404(event_id)
+    
+    if request.method == 'POST':
+        title = request.form.get('title')
+        category = request.form.get('category')
+        start_time_str = request.form.get('start_time')
+
+        if not all([title, category, start_time_str]):
+            flash('All fields are required.', 'danger')
+            return redirect(url_for('calendar.edit_event', event_id=event.id))
+        
+        event.title = title
+        event.category = category
+        event.start_time = datetime.strptime(start_time_str, '%Y-%m-%dT%H:%M')
+        
+        db.session.commit()
+        flash('Plan updated successfully!', 'success')
+        return redirect(url_for('calendar.calendar'))
+    
+    # For GET request, render the edit page
+    return render_template('edit_event.html', event=event, active_page='calendar')
+
+@calendar_bp.route('/calendar/complete/<int:event_id>', methods=['POST'])
+def complete_event(event_id):
+    event = Event.query.get_or_404(event_id)
+    event.status = 'completed'
+    db.session.commit()
+    flash(f'Workout "{event.title}" marked as complete!', 'success')
+    return redirect(url_for('calendar.calendar'))
@@ -0,0 +1,130 @@
+"""Goals with their progress photos."""
+
+import os
+import uuid
+from datetime import datetime
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, g
+from werkzeug.utils import secure_filename
+
+from extensions import db
+from models import Goal, GoalMedia
+
+goals_bp = Blueprint('goals', __name__, cli_group=None)
+
+# --- GOALS SECTION START ---
+
+@goals_bp.route('/goals')
+def goals():
+    # 1. Fetch user and all their goals
+    user = g.user
+
+    all_goals = Goal.query.filter_by(user_id=user.id).order_by(Goal.target_date.asc()).all()
+
+    # 2. Calculate overview statistics
+    total_goals = len(all_goals)
+    completed_goals = Goal.query.filter_by(user_id=user.id, status='completed').count()
+    completion_percentage = round((completed_goals / total_goals) * 100) if total_goals > 0 else 0
+
+    # 3. Fetch Before/After gallery photos
+    before_photo_media = GoalMedia.query.filter_by(is_before_photo=True).join(Goal).filter(Goal.user_id == user.id).first()
+    after_photo_media = GoalMedia.query.filter_by(is_after_photo=True).join(Goal).filter(Goal.user_id == user.id).first()
+    
+    # 4. Pass data to the template
+    return render_template(
+        'Goals.html',
+        active_page='goals',
+        all_goals=all_goals,
+        total_goals=total_goals,
+        completed_goals=completed_goals,
+        completion_percentage=completion_percentage,
+        before_photo=before_photo_media,
+        after_photo=after_photo_media
+    )
+
+@goals_bp.route('/goals/add', methods=['POST'])
+def add_goal():
+    user = g.user
+
+    title = request.form.get('title')
+    description = request.form.get('description')
+    target_date_str = request.form.get('target_date')
+    notes = request.form.get('notes')
+    
+    if not all([title, target_date_str]):
+        flash('Goal Title and Target Date are required.', 'danger')
+        return redirect(url_for('goals.goals'))
+
+    target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+
+    new_goal = Goal(
+        title=title,
+        description=description,
+        target_date=target_date,
+        notes=notes,
+        status='pending',
+        user_id=user.id
+    )
+    db.session.add(new_goal)
+    db.session.flush() # To get the new_goal.id for media linking
+
+    # Handle file uploads
+    files = request.files.getlist('media_files[]')
+    for file in files:
+        if file and file.filename != '':
+            filename = secure_filename(file.filename)
+            unique_filename = f"{uuid.uuid4().hex}_{filename}"
+            file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], unique_filename)
+            file.save(file_path)
+            
+            media_type = 'image' if file.mimetype.startswith('image/') else 'video'
+            
+            # Note: For a real app, logic to set is_before/is_after would be needed here
+            new_media = GoalMedia(
+                goal_id=new_goal.id,
+                file_path=os.path.join('uploads', 'goals', unique_filename), # Store relative path for URL
+                media_type=media_type
+            )
+            db.session.add(new_media)
+
+    db.session.commit()
+    flash('New goal created successfully!', 'success')
+    return redirect(url_for('goals.goals'))
+
+@goals_bp.route('/goals/delete/<int:goal_id>', methods=['POST'])
+def delete_goal(goal_id):
+    goal_to_delete = Goal.query.get_or_404(goal_id)
+
+    # Delete associated media files from the server
+    for media in goal_to_delete.media:
+        try:
+            # Construct the full path to the file
+            full_path = os.path.join('static', media.file_path)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+        except Exception as e:
+            print(f"Error deleting file {media.file_path}: {e}") # Log error
+
+    db.session.delete(goal_to_delete)
+    db.session.commit()
+    flash('Goal deleted successfully.', 'success')
+    return redirect(url_for('goals.goals'))
+
+@goals_bp.route('/goals/toggle_status/<int:goal_id>', methods=['POST'])
+def toggle_goal_status(goal_id):
+    goal = Goal.query.get_or_404(goal_id)
+    
+    if goal.status == 'completed':
+        goal.status = 'in_progress'
+        goal.completed_date = None
+        flash(f'Goal "{goal.title}" marked as in-progress.', 'info')
+    else:
+        goal.status = 'completed'
+        goal.current_progress = goal.target_progress # Auto-complete progress
+        goal.completed_date = datetime.utcnow()
+        flash(f'Congratulations on completing "{goal.title}"!', 'success')
+        
+    db.session.commit()
+    return redirect(url_for('goals.goals'))
+
+# --- GOALS SECTION END ---
@@ -0,0 +1,456 @@
+"""Health records, the cached /health summary, trends and the weight chart."""
+
+import json
+import threading
+from datetime import datetime, timedelta, date
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, abort, jsonify, g
+from sqlalchemy import func
+
+from extensions import db
+from models import UserProfile, HealthRecord, HealthSummary, HealthPlanItem
+from helpers import is_supported_month, month_window
+from exports import export_response
+
+health_bp = Blueprint('health', __name__, cli_group=None)
+
+# --- Health summary cache ---
+# /health reads the athlete's HealthSummary row instead of scanning HealthRecord. Writes
+# patch the row: the chart series is edited in place and the latest/rolling
+# stats are only re-queried (over the date index) when the change can affect them.
+
+def health_chart_cutoff():
+    return (datetime.utcnow() - timedelta(days=current_app.config['HEALTH_CHART_DAYS'])).date()
+
+def refresh_health_bmi(summary, profile):
+    summary.bmi = None
+    if profile and profile.height and summary.latest_weight:
+        height_in_meters = profile.height / 100
+        summary.bmi = round(summary.latest_weight / (height_in_meters ** 2), 1)
+
+def refresh_latest_health_stats(summary):
+    latest = HealthRecord.query.filter_by(user_id=summary.user_id).order_by(HealthRecord.date.desc(), HealthRecord.id.desc()).first()
+    summary.latest_record_id = latest.id if latest else None
+    summary.latest_date = latest.date if latest else None
+    summary.latest_weight = latest.weight if latest else None
+    summary.latest_body_fat = latest.body_fat if latest else None
+    summary.avg_weight_7d = summary.avg_weight_30d = None
+    if latest:
+        for days, attribute in ((7, 'avg_weight_7d'), (30, 'avg_weight_30d')):
+            average = db.session.query(func.avg(HealthRecord.weight)).filter(
+                HealthRecord.user_id == summary.user_id,
+                HealthRecord.date > latest.date - timedelta(days=days),
+                HealthRecord.date <= latest.date
+            ).scalar()
+            setattr(summary, attribute, round(average, 1) if average is not None else None)
+
+def rebuild_health_summary(summary, user):
+    """Recomputes every field of the athlete's summary from HealthRecord."""
+    summary.record_count = HealthRecord.query.filter_by(user_id=user.id).count()
+    refresh_latest_health_stats(summary)
+    refresh_health_bmi(summary, user)
+    chart_records = db.session.query(HealthRecord.date, HealthRecord.weight, HealthRecord.id).filter(
+        HealthRecord.user_id == user.id,
+        HealthRecord.date >= health_chart_cutoff(),
+        HealthRecord.weight.isnot(None)
+    ).order_by(HealthRecord.date, HealthRecord.id).all()
+    summary.chart_series = json.dumps([[d.isoformat(), weight, record_id] for d, weight, record_id in chart_records])
+    summary.history_revision = (summary.history_revision or 0) + 1
+    summary.updated_at = datetime.utcnow()
+
+def get_health_summary(user):
+    """Returns the athlete's summary row, building it the first time it is needed."""
+    summary = HealthSummary.query.filter_by(user_id=user.id).first()
+    if summary is None:
+        summary = HealthSummary(user_id=user.id)
+        db.session.add(summary)
+        rebuild_health_summary(summary, user)
+        db.session.commit()
+    return summary
+
+def apply_health_record_change(user, old=None, new=None):
+    """Patches the summary after a record is added (new), edited (old and new) or deleted (old).
+
+    `old` is the (id, date) of the record before the change; `new` is the flushed record.
+    """
+    summary = HealthSummary.query.filter_by(user_id=user.id).first()
+    if summary is None:
+        get_health_summary(user) # the first build already sees this change
+        return
+    # A new latest record only extends the cached trends; anything else rewrites history
+    if not (old is None and new is not None and (summary.latest_date is None or new.date >= summary.latest_date)):
+        summary.history_revision += 1
+
+    summary.record_count += (new is not None) - (old is not None)
+
+    cutoff = health_chart_cutoff()
+    series = [point for point in json.loads(summary.chart_series)
+              if point[0] >= cutoff.isoformat() and not (old and point[2] == old[0])]
+    if new is not None and new.weight is not None and new.date >= cutoff:
+        series.append([new.date.isoformat(), new.weight, new.id])
+        series.sort(key=lambda point: (point[0], point[2]))
+    summary.chart_series = json.dumps(series)
+
+    # Only changes inside the 30-day rolling window (or past it) can move the latest stats
+    touched_dates = [changed_date for changed_date in (old[1] if old else None, new.date if new else None) if changed_date]
+    if summary.latest_date is None or any(d > summary.latest_date - timedelta(days=30) for d in touched_dates):
+        refresh_latest_health_stats(summary)
+        refresh_health_bmi(summary, user)
+    summary.updated_at = datetime.utcnow()
+
+@health_bp.cli.command('rebuild-health-summary')
+def rebuild_health_summary_command():
+    """Recomputes every athlete's cached /health summary from scratch."""
+    users = UserProfile.query.order_by(UserProfile.id).all()
+    for user in users:
+        rebuild_health_summary(get_health_summary(user), user)
+    db.session.commit()
+    print(f"Health summary rebuilt for {len(users)} athlete(s).")
+
+# --- Health trends ---
+# Moving averages, weekly aggregates, trend lines and projections come from
+# health_trends.py. The arrays are built in batch once per process and cached
+# per athlete against the summary's history_revision. Records appended since
+# (by any worker) are fetched by id and extend the cached arrays in place; only
+# an edit, a delete or a backdated record bumps the revision and forces a
+# rebuild. health_trends (and with it NumPy) is imported on first use rather
+# than with the app.
+
+# The cache is current_app.extensions['health_trend_cache'], an LRU of
+# user id -> {'revision': ..., 'count': ..., 'last_id': ..., 'states': {metric: TrendState}}
+
+HEALTH_TREND_METRICS = {'weight': HealthRecord.weight, 'body_fat': HealthRecord.body_fat}
+
+# Serializes in-place appends, so two requests cannot extend the same arrays at once
+health_trend_lock = threading.Lock()
+
+def health_summary_token(summary):
+    return (summary.record_count, summary.latest_record_id, summary.updated_at)
+
+def health_record_rows(user, after_id=None):
+    """(date, id, weight, body_fat) of the athlete's records in trend order, optionally only ids after `after_id`."""
+    query = db.session.query(HealthRecord.date, HealthRecord.id, *HEALTH_TREND_METRICS.values()).filter(HealthRecord.user_id == user.id)
+    if after_id is not None:
+        query = query.filter(HealthRecord.id > after_id)
+    return query.order_by(HealthRecord.date, HealthRecord.id).all()
+
+def load_health_trend_states(user, summary):
+    from health_trends import TrendState
+    rows = health_record_rows(user)
+    states = {}
+    for position, metric in enumerate(HEALTH_TREND_METRICS, start=2):
+        measured = [(row[0].toordinal(), row[position]) for row in rows if row[position] is not None]
+        states[metric] = TrendState([day for day, _ in measured], [value for _, value in measured])
+    return {
+        'revision': summary.history_revision,
+        'count': summary.record_count,
+        'last_id': max((row[1] for row in rows), default=0),
+        'states': states,
+    }
+
+def append_health_trend_rows(cached, rows):
+    """Extends the cached states with newer records. Returns False (leaving them untouched) if a row is out of order."""
+    states = cached['states']
+    # The rows are in date order, so only the first measurement of each metric can be out of order
+    for position, metric in enumerate(HEALTH_TREND_METRICS, start=2):
+        first = next((row for row in rows if row[position] is not None), None)
+        if first is not None and not states[metric].can_append(first[0].toordinal()):
+            return False
+    for row in rows:
+        for position, metric in enumerate(HEALTH_TREND_METRICS, start=2):
+            if row[position] is not None:
+                states[metric].append(row[0].toordinal(), row[position])
+    cached['count'] += len(rows)
+    cached['last_id'] = max(cached['last_id'], *(row[1] for row in rows))
+    return True
+
+def get_health_trend_states(user):
+    """Returns the athlete's cached TrendState per metric, catching up on appended records or rebuilding."""
+    summary = get_health_summary(user)
+    trend_cache = current_app.extensions['health_trend_cache']
+    cached = trend_cache.get(user.id)
+    if cached is not None and cached['revision'] == summary.history_revision and summary.record_count >= cached['count']:
+        with health_trend_lock:
+            if summary.record_count == cached['count']:
+                return cached['states']
+            rows = health_record_rows(user, after_id=cached['last_id'])
+            if len(rows) == summary.record_count - cached['count'] and append_health_trend_rows(cached, rows):
+                return cached['states']
+
+    cached = load_health_trend_states(user, summary)
+    trend_cache.set(user.id, cached)
+    return cached['states']
+
+def health_trend_report(state, target=None, weeks=52):
+    """JSON-ready trend data for one metric."""
+    from health_trends import weekly_aggregates, loess, project_target_day
+    if state.size == 0:
+        return {'points': 0}
+    days, values = state.days, state.values
+    fit = state.linear_trend()
+    weekly = weekly_aggregates(days, values)
+    # Smooth the weekly means (weighted by weigh-ins) rather than every raw point
+    grid, fitted = loess(weekly['week_start'] + 3, weekly['mean'], counts=weekly['count'])
+    projected_day = project_target_day(days, values, target)
+    return {
+        'points': state.size,
+        'latest': {'date': date.fromordinal(int(days[-1])).isoformat(), 'value': float(values[-1])},
+        'ema': {str(span): round(float(state.ema(span)[-1]), 2) for span in state.spans},
+        'trend_per_week': round(fit[0] * 7, 3) if fit else None,
+        'weekly': [
+            {'week_start': date.fromordinal(int(week_start)).isoformat(), 'mean': round(float(mean), 2),
+             'min': float(low), 'max': float(high), 'count': int(count)}
+            for week_start, mean, low, high, count in list(zip(
+                weekly['week_start'], weekly['mean'], weekly['min'], weekly['max'], weekly['count']))[-weeks:]
+        ],
+        'loess': [[date.fromordinal(int(round(day))).isoformat(), round(float(value), 2)] for day, value in zip(grid, fitted)],
+        'target': target,
+        'projected_date': date.fromordinal(projected_day).isoformat() if projected_day else None,
+    }
+
+@health_bp.route('/api/health/trends')
+def health_trends_api():
+    metric = request.args.get('metric', 'weight')
+    if metric not in HEALTH_TREND_METRICS:
+        abort(400, description="metric must be 'weight' or 'body_fat'.")
+    report = health_trend_report(
+        get_health_trend_states(g.user)[metric],
+        target=request.args.get('target', type=float),
+        weeks=request.args.get('weeks', 52, type=int)
+    )
+    report['metric'] = metric
+    return report
+
+# --- Downsampled weight chart ---
+# Long ranges are reduced to HEALTH_CHART_POINTS with LTTB so Chart.js gets a
+# fixed-size series. Results are cached per range until a record is written
+# (the summary token changes) or the day rolls over. The cache is
+# current_app.extensions['health_chart_cache'], an LRU of (user id, range) -> (token, payload)
+
+def health_chart_payload(user, chart_range):
+    from health_trends import lttb
+    token = (health_summary_token(get_health_summary(user)), datetime.utcnow().date())
+    chart_cache = current_app.extensions['health_chart_cache']
+    cached = chart_cache.get((user.id, chart_range))
+    if cached and cached[0] == token:
+        return cached[1]
+
+    weight_trend = get_health_trend_states(user)['weight']
+    days, values, ema_values = weight_trend.days, weight_trend.values, weight_trend.ema(7)
+    range_days = current_app.config['HEALTH_CHART_RANGES'][chart_range]
+    if range_days is not None:
+        in_range = days >= token[1].toordinal() - range_days
+        days, values, ema_values = days[in_range], values[in_range], ema_values[in_range]
+
+    kept = lttb(days, values, current_app.config['HEALTH_CHART_POINTS'])
+    kept_dates = [date.fromordinal(int(day)) for day in days[kept]]
+    payload = {
+        'range': chart_range,
+        'total_points': int(len(days)),
+        'dates': [d.isoformat() for d in kept_dates],
+        'labels': [d.strftime('%b %d, %Y') for d in kept_dates],
+        'data': [float(value) for value in values[kept]],
+        'ema': [round(float(value), 2) for value in ema_values[kept]],
+    }
+    chart_cache.set((user.id, chart_range), (token, payload))
+    return payload
+
+@health_bp.route('/api/health/chart')
+def health_chart_api():
+    chart_range = request.args.get('range', '180d')
+    if chart_range not in current_app.config['HEALTH_CHART_RANGES']:
+        abort(400, description=f"range must be one of {', '.join(current_app.config['HEALTH_CHART_RANGES'])}.")
+
+    response = jsonify(health_chart_payload(g.user, chart_range))
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+# --- Measurement calendar ---
+
+def health_records_by_day(user, year, month):
+    """One month of the athlete's records keyed by ISO date; a day can hold several records."""
+    window_start, window_end = month_window(year, month)
+    records = HealthRecord.query.filter(
+        HealthRecord.user_id == user.id,
+        HealthRecord.date >= window_start.date(),
+        HealthRecord.date < window_end.date()
+    ).order_by(HealthRecord.date.asc(), HealthRecord.id.asc()).all()
+
+    days = {}
+    for record in records:
+        days.setdefault(record.date.isoformat(), []).append({
+            'id': record.id, 'weight': record.weight,
+            'body_fat': record.body_fat, 'notes': record.notes
+        })
+    return days
+
+@health_bp.route('/api/health/calendar')
+def health_calendar_api():
+    year = request.args.get('year', type=int)
+    month = request.args.get('month', type=int)
+    if year is None or month is None or not is_supported_month(year, month):
+        return {'error': 'year and month are required, with month between 1 and 12 (up to November 9999).'}, 400
+
+    response = jsonify({'year': year, 'month': month, 'days': health_records_by_day(g.user, year, month)})
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+@health_bp.route('/health')
+def health():
+    from health_trends import lttb
+    # --- 1. Fetch Core Data ---
+    profile = g.user
+    health_plan_items = HealthPlanItem.query.order_by(HealthPlanItem.id).all()
+
+    # --- 2. Precomputed Stats (latest weight, BMI, rolling averages) ---
+    summary = get_health_summary(profile)
+
+    # --- 3. Weight Chart from the cached series ---
+    cutoff = health_chart_cutoff().isoformat()
+    chart_points = [point for point in json.loads(summary.chart_series) if point[0] >= cutoff]
+    # The chart points are the tail of the weight trend series, so the EMA lines up with them
+    weight_trend = get_health_trend_states(profile)['weight']
+    tail_ema = weight_trend.ema(7)[weight_trend.size - len(chart_points):] if chart_points else []
+    kept = lttb([date.fromisoformat(point[0]).toordinal() for point in chart_points],
+                [point[1] for point in chart_points], current_app.config['HEALTH_CHART_POINTS'])
+    chart_labels = [date.fromisoformat(chart_points[i][0]).strftime('%b %d, %Y') for i in kept]
+    chart_data = [chart_points[i][1] for i in kept]
+    chart_ema = [round(float(tail_ema[i]), 2) for i in kept]
+    trend_fit = weight_trend.linear_trend()
+    trend_per_week = round(trend_fit[0] * 7, 2) if trend_fit else None
+
+    # --- 4. Measurement calendar: only the viewed month is inlined ---
+    now = datetime.utcnow()
+    view_year = request.args.get('year', now.year, type=int)
+    view_month = request.args.get('month', now.month, type=int)
+    if not is_supported_month(view_year, view_month):
+        view_year, view_month = now.year, now.month
+    records_by_day = health_records_by_day(profile, view_year, view_month)
+
+    # --- 5. Pass All Data to Template ---
+    return render_template(
+        'Health.html',
+        active_page='health',
+        profile=profile,
+        summary=summary,
+        health_plan_items=health_plan_items,
+        chart_labels=json.dumps(chart_labels),
+        chart_data=json.dumps(chart_data),
+        chart_ema=json.dumps(chart_ema),
+        chart_range=f"{current_app.config['HEALTH_CHART_DAYS']}d",
+        chart_ranges=list(current_app.config['HEALTH_CHART_RANGES']),
+        trend_per_week=trend_per_week,
+        view_year=view_year, view_month=view_month,
+        records_by_day=records_by_day,
+        today_iso=now.date().isoformat()
+    )
+
+@health_bp.route('/profile/update', methods=['POST'])
+def update_profile():
+    profile = g.user
+    
+    profile.height = request.form.get('height', type=float)
+    profile.age = request.form.get('age', type=int)
+    profile.gender = request.form.get('gender')
+    refresh_health_bmi(get_health_summary(profile), profile)
+    
+    db.session.commit()
+    flash('Profile updated successfully!', 'success')
+    return redirect(url_for('health.health'))
+
+@health_bp.route('/health/add', methods=['POST'])
+def add_health_record():
+    date_str = request.form.get('date')
+    weight = request.form.get('weight', type=float)
+    body_fat = request.form.get('body_fat', type=float)
+    notes = request.form.get('notes')
+
+    if not date_str or not weight:
+        flash('Date and Weight are required fields.', 'danger')
+        return redirect(url_for('health.health'))
+
+    record_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+    
+    new_record = HealthRecord(
+        user_id=g.user.id, date=record_date, weight=weight,
+        body_fat=body_fat, notes=notes
+    )
+    db.session.add(new_record)
+    db.session.flush()
+    apply_health_record_change(g.user, new=new_record)
+    db.session.commit()
+    flash('Health record added successfully!', 'success')
+    return redirect(url_for('health.health'))
+
+# Note: UI for edit/delete is not the focus of this part, but the backend is ready.
+@health_bp.route('/health/delete/<int:record_id>', methods=['POST'])
+def delete_health_record(record_id):
+    record = HealthRecord.query.get_or_404(record_id)
+    old = (record.id, record.date)
+    db.session.delete(record)
+    db.session.flush()
+    apply_health_record_change(g.user, old=old)
+    db.session.commit()
+    flash('Health record deleted.', 'success')
+    return redirect(url_for('health.health'))
+
+@health_bp.route('/health-plan/add', methods=['POST'])
+def add_health_plan_item():
+    title = request.form.get('title')
+    description = request.form.get('description')
+    if title:
+        new_item = HealthPlanItem(user_id=g.user.id, title=title, description=description)
+        db.session.add(new_item)
+        db.session.commit()
+        flash('Health plan item added.', 'success')
+    return redirect(url_for('health.health'))
+
+@health_bp.route('/health-plan/toggle/<int:item_id>', methods=['POST'])
+def toggle_health_plan_item(item_id):
+    item = HealthPlanItem.query.get_or_404(item_id)
+    item.status = 'completed' if item.status == 'pending' else 'pending'
+    db.session.commit()
+    return redirect(url_for('health.health'))
+
+@health_bp.route('/health-plan/delete/<int:item_id>', methods=['POST'])
+def delete_health_plan_item(item_id):
+    item = HealthPlanItem.query.get_or_404(item_id)
+    db.session.delete(item)
+    db.session.commit()
+    flash('Health plan item deleted.', 'success')
+    return redirect(url_for('health.health'))
+
+@health_bp.route('/health-plan/edit/<int:item_id>', methods=['GET', 'POST'])
+def edit_health_plan_item(item_id):
+    item = HealthPlanItem.query.get_or_404(item_id)
+    if request.method == 'POST':
+        item.title = request.form.get('title')
+        item.description = request.form.get('description')
+        db.session.commit()
+        flash('Health plan item updated.', 'success')
+        return redirect(url_for('health.health'))
+    return render_template('edit_health_plan_item.html', item=item, active_page='health')
+
+@health_bp.route('/health/export')
+def export_health_data():
+    return export_response('health', request.args.get('format', 'csv'))
+
+@health_bp.route('/health/edit/<int:record_id>', methods=['GET', 'POST'])
+def edit_health_record(record_id):
+    record = HealthRecord.query.get_or_404(record_id)
+    if request.method == 'POST':
+        old = (record.id, record.date)
+        record.date = datetime.strptime(request.form.get('date'), '%Y-%m-%d').date()
+        record.weight = request.form.get('weight', type=float)
+        record.body_fat = request.form.get('body_fat', type=float)
+        record.notes = request.form.get('notes')
+        db.session.flush()
+        apply_health_record_change(g.user, old=old, new=record)
+        
+        db.session.commit()
+        flash('Health record updated successfully!', 'success')
+        return redirect(url_for('health.health'))
+        
+    return render_template('edit_health_record.html', record=record, active_page='health')
@@ -0,0 +1,76 @@
+"""Dashboard, workouts and the site-wide export."""
+
+from flask import Blueprint, render_template, request, redirect, url_for, flash, g
+
+from extensions import db
+from models import Workout
+from exports import export_response
+from page_cache import cached_page
+
+main_bp = Blueprint('main', __name__, cli_group=None)
+
+# --- Main Application Routes ---
+
+@main_bp.route('/')
+def index():
+    return render_template('index.html', active_page='index')
+
+@main_bp.route('/workouts')
+@cached_page('workouts')
+def workouts():
+    all_workouts = Workout.query.order_by(Workout.id).all()
+    return render_template('Workouts.html', workouts=all_workouts, active_page='workouts')
+
+# --- Routes for Adding and Deleting Workouts ---
+
+@main_bp.route('/workouts/add', methods=['POST'])
+def add_workout():
+    if request.method == 'POST':
+        name = request.form['name']
+        difficulty = request.form['difficulty']
+        sets = request.form['sets']
+        reps = request.form['reps']
+        rest = request.form['rest']
+        instructions = request.form['instructions']
+        
+        # Basic validation
+        if name and difficulty and sets and reps and rest and instructions:
+            # Check if workout already exists
+            existing_workout = Workout.query.filter_by(name=name).first()
+            if existing_workout:
+                flash(f'Workout "{name}" already exists.', 'danger')
+            else:
+                new_workout = Workout(
+                    user_id=g.user.id,
+                    name=name,
+                    difficulty=difficulty,
+                    sets=int(sets),
+                    reps=reps,
+                    rest=rest,
+                    instructions=instructions
+                )
+                db.session.add(new_workout)
+                db.session.commit()
+                flash('Workout added successfully!', 'success')
+        else:
+            flash('All fields are required.', 'danger')
+            
+    return redirect(url_for('main.workouts'))
+
+@main_bp.route('/workouts/delete/<int:workout_id>', methods=['POST'])
+def delete_workout(workout_id):
+    workout_to_delete = Workout.query.get_or_404(workout_id)
+    db.session.delete(workout_to_delete)
+    db.session.commit()
+    flash('Workout deleted successfully.', 'success')
+    return redirect(url_for('main.workouts'))
+
+# --- Placeholder Routes for Other Pages ---
+
+@main_bp.route('/dashboard')
+def dashboard():
+    return render_template('dashboard.html', active_page='index')
+
+@main_bp.route('/export/<dataset>')
+def export_data(dataset):
+    return export_response(dataset, request.args.get('format', 'csv'))
@@ -0,0 +1,121 @@
+"""Motivation board."""
+
+import os
+import uuid
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, g
+from werkzeug.utils import secure_filename
+
+from extensions import db
+from models import MotivationItem
+from helpers import keyset_page, paginated_cards_json
+from page_cache import cached_page
+
+motivation_bp = Blueprint('motivation', __name__, cli_group=None)
+
+# --- MOTIVATION SECTION START ---
+
+@motivation_bp.route('/motivation')
+@cached_page('motivation')
+def motivation():
+    user = g.user
+
+    # Handle category filtering
+    category_filter = request.args.get('category', 'all')
+    
+    query = MotivationItem.query.filter_by(user_id=user.id)
+    
+    if category_filter != 'all':
+        query = query.filter_by(category=category_filter)
+        
+    all_items, next_cursor = keyset_page(
+        query, [MotivationItem.is_favorite, MotivationItem.id],
+        request.args.get('cursor'), current_app.config['PAGE_SIZE']
+    )
+
+    if request.args.get('format') == 'json':
+        return paginated_cards_json('_motivation_card.html', 'item', all_items, next_cursor, category_filter)
+    
+    # Get all unique categories for the filter buttons
+    all_categories = db.session.query(MotivationItem.category).filter_by(user_id=user.id).distinct().all()
+    categories = [cat[0] for cat in all_categories]
+    
+    return render_template(
+        'Motivation.html', 
+        active_page='motivation',
+        motivation_items=all_items,
+        categories=categories,
+        active_category=category_filter,
+        next_cursor=next_cursor
+    )
+
+@motivation_bp.route('/motivation/add', methods=['POST'])
+def add_motivation_item():
+    user = g.user
+
+    title = request.form.get('title')
+    category = request.form.get('category')
+    description = request.form.get('description')
+    author = request.form.get('author')
+    source_url = request.form.get('source_url')
+
+    if not all([title, category]):
+        flash('Title and Category are required.', 'danger')
+        return redirect(url_for('motivation.motivation'))
+
+    new_item = MotivationItem(
+        title=title,
+        category=category,
+        description=description,
+        author=author,
+        source_url=source_url,
+        user_id=user.id
+    )
+
+    # Handle file upload
+    file = request.files.get('cover_image')
+    if file and file.filename != '':
+        filename = secure_filename(file.filename)
+        unique_filename = f"{uuid.uuid4().hex}_{filename}"
+        file_path = os.path.join(current_app.config['MOTIVATION_UPLOAD_FOLDER'], unique_filename)
+        file.save(file_path)
+        # Store the relative path for use in url_for()
+        new_item.cover_image_path = os.path.join('uploads', 'motivation', unique_filename)
+
+    db.session.add(new_item)
+    db.session.commit()
+    flash('New motivational content added!', 'success')
+    return redirect(url_for('motivation.motivation'))
+
+@motivation_bp.route('/motivation/delete/<int:item_id>', methods=['POST'])
+def delete_motivation_item(item_id):
+    item_to_delete = MotivationItem.query.get_or_404(item_id)
+
+    # Delete associated image file from the server if it exists
+    if item_to_delete.cover_image_path:
+        try:
+            full_path = os.path.join('static', item_to_delete.cover_image_path)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+        except Exception as e:
+            print(f"Error deleting file {item_to_delete.cover_image_path}: {e}")
+
+    db.session.delete(item_to_delete)
+    db.session.commit()
+    flash('Motivational item deleted.', 'success')
+    return redirect(url_for('motivation.motivation'))
+
+@motivation_bp.route('/motivation/toggle_favorite/<int:item_id>', methods=['POST'])
+def toggle_motivation_favorite(item_id):
+    item = MotivationItem.query.get_or_404(item_id)
+    item.is_favorite = not item.is_favorite
+    db.session.commit()
+    
+    if item.is_favorite:
+        flash(f'"{item.title}" added to favorites.', 'success')
+    else:
+        flash(f'"{item.title}" removed from favorites.', 'info')
+        
+    return redirect(request.referrer or url_for('motivation.motivation'))
+
+# --- MOTIVATION SECTION END ---
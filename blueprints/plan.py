@@ -0,0 +1,128 @@
+"""Training plans and the plan calendar API."""
+
+from datetime import datetime, timedelta, date
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify, g
+
+from extensions import db
+from models import TrainingPlan
+from helpers import month_window
+
+plan_bp = Blueprint('plan', __name__, cli_group=None)
+
+def plans_overlapping(window_start, window_end):
+    """Training plans whose [start_date, end_date] interval overlaps [window_start, window_end]."""
+    return TrainingPlan.query.filter(
+        TrainingPlan.end_date >= window_start,
+        TrainingPlan.start_date <= window_end
+    ).order_by(TrainingPlan.start_date.asc(), TrainingPlan.id.asc()).all()
+
+@plan_bp.route('/plan')
+def plan():
+    # 1. Fetch all training plans from the database
+    all_plans = TrainingPlan.query.order_by(TrainingPlan.start_date).all()
+
+    # 2. Calculate overview stats (unchanged)
+    total_plans = len(all_plans)
+    completed_plans = TrainingPlan.query.filter_by(status='completed').count()
+    pending_plans = total_plans - completed_plans
+    completion_percentage = round((completed_plans / total_plans) * 100) if total_plans > 0 else 0
+    
+    # 3. Get current date info for calendar highlighting
+    #    (the calendar fetches the plans overlapping this month from /api/plans)
+    today = date.today()
+    month_start, next_month_start = month_window(today.year, today.month)
+
+    # 4. Pass all data to the template
+    return render_template(
+        'Plan.html',
+        active_page='plan',
+        all_plans=all_plans,
+        total_plans=total_plans,
+        completed_plans=completed_plans,
+        pending_plans=pending_plans,
+        completion_percentage=completion_percentage,
+        window_from=month_start.date().isoformat(),
+        window_to=(next_month_start.date() - timedelta(days=1)).isoformat(),
+        today_iso=today.isoformat()
+    )
+
+@plan_bp.route('/api/plans')
+def plans_api():
+    """Plans overlapping the inclusive [from, to] window, as date intervals."""
+    try:
+        window_start = datetime.strptime(request.args.get('from', ''), '%Y-%m-%d').date()
+        window_end = datetime.strptime(request.args.get('to', ''), '%Y-%m-%d').date()
+    except ValueError:
+        return {'error': 'from and to must be dates in YYYY-MM-DD format.'}, 400
+    # Compared as a difference, since window_start + the limit can pass date.max
+    if not 0 <= (window_end - window_start).days < current_app.config['CALENDAR_API_MAX_DAYS']:
+        return {'error': f"The window must be between 1 and {current_app.config['CALENDAR_API_MAX_DAYS']} days."}, 400
+
+    response = jsonify({
+        'from': window_start.isoformat(),
+        'to': window_end.isoformat(),
+        'plans': [{
+            'id': plan.id,
+            'title': plan.title,
+            'status': plan.status,
+            'description': plan.description,
+            'start': plan.start_date.isoformat(),
+            'end': plan.end_date.isoformat()
+        } for plan in plans_overlapping(window_start, window_end)]
+    })
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+@plan_bp.route('/plans/add', methods=['POST'])
+def add_plan():
+    title = request.form.get('title')
+    description = request.form.get('description')
+    start_date_str = request.form.get('start_date')
+    end_date_str = request.form.get('end_date')
+
+    if not all([title, description, start_date_str, end_date_str]):
+        flash('All fields are required.', 'danger')
+        return redirect(url_for('plan.plan'))
+
+    start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+    end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+
+    # Determine status based on dates
+    today = date.today()
+    status = 'pending'
+    if start_date > today:
+        status = 'upcoming'
+    
+    new_plan = TrainingPlan(
+        user_id=g.user.id, title=title, description=description, 
+        start_date=start_date, end_date=end_date, status=status
+    )
+    db.session.add(new_plan)
+    db.session.commit()
+    flash('New training plan added successfully!', 'success')
+    return redirect(url_for('plan.plan'))
+
+@plan_bp.route('/plans/edit/<int:plan_id>', methods=['GET', 'POST'])
+def edit_plan(plan_id):
+    plan = TrainingPlan.query.get_or_404(plan_id)
+    if request.method == 'POST':
+        plan.title = request.form.get('title')
+        plan.description = request.form.get('description')
+        plan.start_date = datetime.strptime(request.form.get('start_date'), '%Y-%m-%d').date()
+        plan.end_date = datetime.strptime(request.form.get('end_date'), '%Y-%m-%d').date()
+        plan.status = request.form.get('status')
+        db.session.commit()
+        flash('Training plan updated successfully!', 'success')
+        return redirect(url_for('plan.plan'))
+    
+    return render_template('edit_plan.html', plan=plan, active_page='plan')
+
+@plan_bp.route('/plans/delete/<int:plan_id>', methods=['POST'])
+def delete_plan(plan_id):
+    plan = TrainingPlan.query.get_or_404(plan_id)
+    db.session.delete(plan)
+    db.session.commit()
+    flash('Training plan deleted successfully.', 'success')
+    return redirect(url_for('plan.plan'))
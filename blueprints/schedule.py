@@ -0,0 +1,138 @@
+"""Weekly schedule and sticky notes."""
+
+from datetime import datetime
+
+from flask import Blueprint, render_template, request, redirect, url_for, flash, g
+
+from extensions import db
+from models import ScheduleItem, StickyNote
+from page_cache import cached_page
+
+schedule_bp = Blueprint('schedule', __name__, cli_group=None)
+
+# ------SCHEDULE SECTION -----‐---
+@schedule_bp.route('/schedule')
+@cached_page('schedule')
+def schedule():
+    all_schedule_items = ScheduleItem.query.order_by(ScheduleItem.time).all()
+    all_sticky_notes = StickyNote.query.order_by(StickyNote.id).all()
+
+    # Group schedule items by day for easy rendering in the template
+    days_of_week = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    schedule_items_by_day = {day: [] for day in days_of_week}
+    for item in all_schedule_items:
+        schedule_items_by_day[item.day_of_week].append(item)
+
+    # Calculate stats
+    total_sessions = len(all_schedule_items)
+    completed_sessions = ScheduleItem.query.filter_by(status='completed').count()
+    workout_sessions = ScheduleItem.query.filter_by(category='workout').count()
+    rest_sessions = ScheduleItem.query.filter_by(category='rest').count()
+    completion_percentage = round((completed_sessions / total_sessions) * 100) if total_sessions > 0 else 0
+    current_day_name = datetime.now().strftime('%A')
+
+    return render_template(
+        'Schedule.html',
+        active_page='schedule',
+        days_of_week=days_of_week,
+        schedule_items_by_day=schedule_items_by_day,
+        sticky_notes=all_sticky_notes,
+        total_sessions=total_sessions,
+        completed_sessions=completed_sessions,
+        workout_sessions=workout_sessions,
+        rest_sessions=rest_sessions,
+        completion_percentage=completion_percentage,
+        current_day_name=current_day_name
+    )
+
+@schedule_bp.route('/schedule/add', methods=['POST'])
+def add_schedule_item():
+    title = request.form.get('title')
+    details = request.form.get('details')
+    day = request.form.get('day_of_week')
+    time_str = request.form.get('time')
+    category = request.form.get('category')
+
+    if not all([title, day, time_str, category]):
+        flash('Required fields are missing.', 'danger')
+        return redirect(url_for('schedule.schedule'))
+
+    # Convert time string from form (HH:MM) to a time object
+    item_time = datetime.strptime(time_str, '%H:%M').time()
+    
+    new_item = ScheduleItem(
+        user_id=g.user.id, title=title, details=details, day_of_week=day,
+        time=item_time, category=category
+    )
+    db.session.add(new_item)
+    db.session.commit()
+    flash('Schedule item added successfully!', 'success')
+    return redirect(url_for('schedule.schedule'))
+
+@schedule_bp.route('/schedule/edit/<int:item_id>', methods=['GET', 'POST'])
+def edit_schedule_item(item_id):
+    item = ScheduleItem.query.get_or_404(item_id)
+    if request.method == 'POST':
+        item.title = request.form.get('title')
+        item.details = request.form.get('details')
+        item.day_of_week = request.form.get('day_of_week')
+        item.time = datetime.strptime(request.form.get('time'), '%H:%M').time()
+        item.category = request.form.get('category')
+        db.session.commit()
+        flash('Schedule item updated successfully!', 'success')
+        return redirect(url_for('schedule.schedule'))
+        
+    return render_template('edit_schedule_item.html', item=item, active_page='schedule')
+
+@schedule_bp.route('/schedule/delete/<int:item_id>', methods=['POST'])
+def delete_schedule_item(item_id):
+    item = ScheduleItem.query.get_or_404(item_id)
+    db.session.delete(item)
+    db.session.commit()
+    flash('Schedule item deleted successfully!', 'success')
+    return redirect(url_for('schedule.schedule'))
+
+@schedule_bp.route('/schedule/complete/<int:item_id>', methods=['POST'])
+def complete_schedule_item(item_id):
+    item = ScheduleItem.query.get_or_404(item_id)
+    item.status = 'completed'
+    db.session.commit()
+    flash(f'"{item.title}" marked as complete!', 'success')
+    return redirect(url_for('schedule.schedule'))
+
+@schedule_bp.route('/notes/add', methods=['POST'])
+def add_note():
+    title = request.form.get('title')
+    content = request.form.get('content')
+    color = request.form.get('color')
+
+    if not all([title, content, color]):
+        flash('All note fields are required.', 'danger')
+        return redirect(url_for('schedule.schedule'))
+
+    new_note = StickyNote(user_id=g.user.id, title=title, content=content, color=color)
+    db.session.add(new_note)
+    db.session.commit()
+    flash('Sticky note added successfully!', 'success')
+    return redirect(url_for('schedule.schedule'))
+
+@schedule_bp.route('/notes/edit/<int:note_id>', methods=['GET', 'POST'])
+def edit_note(note_id):
+    note = StickyNote.query.get_or_404(note_id)
+    if request.method == 'POST':
+        note.title = request.form.get('title')
+        note.content = request.form.get('content')
+        note.color = request.form.get('color')
+        db.session.commit()
+        flash('Sticky note updated successfully!', 'success')
+        return redirect(url_for('schedule.schedule'))
+
+    return render_template('edit_note.html', note=note, active_page='schedule')
+
+@schedule_bp.route('/notes/delete/<int:note_id>', methods=['POST'])
+def delete_note(note_id):
+    note = StickyNote.query.get_or_404(note_id)
+    db.session.delete(note)
+    db.session.commit()
+    flash('Sticky note deleted successfully!', 'success')
+    return redirect(url_for('schedule.schedule'))
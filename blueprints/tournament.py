@@ -0,0 +1,573 @@
+"""Challenges, XP and levels, tournament brackets and the global leaderboard."""
+
+from datetime import datetime
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, g
+from sqlalchemy import literal, case, select, insert, update, true
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import set_committed_value
+
+from extensions import db
+from models import UserProfile, Challenge, UserChallenge, Badge, UserBadge, Tournament, TournamentEntry, Match, TournamentStats
+from page_cache import cached_page
+from progression import level_after_xp, level_progress, upcoming_levels, rank_title
+
+tournament_bp = Blueprint('tournament', __name__, cli_group=None)
+
+# --- Challenge progression engine ---
+# Level changes and new links drive challenge availability. Whenever an athlete
+# levels up or gains challenge links, one INSERT ... SELECT links the milestone
+# challenges they have reached and one set-based UPDATE unlocks every locked
+# challenge they qualify for (see apply_level_change), so viewing /tournament
+# never writes. Both statements take a list of athletes, which lets
+# `flask sync-challenge-progress` backfill everyone at once.
+
+def unlock_challenges_statement(user_id, level):
+    return update(UserChallenge).where(
+        UserChallenge.user_id == user_id,
+        UserChallenge.status == 'locked',
+        select(Challenge.id).where(Challenge.id == UserChallenge.challenge_id, Challenge.level_requirement <= level).exists()
+    ).values(status='unlocked')
+
+def unlock_challenges(profile):
+    """Unlocks the athlete's locked challenges at or below their current level. Returns the count."""
+    result = db.session.execute(
+        unlock_challenges_statement(profile.id, profile.level).execution_options(synchronize_session=False, all_users=True)
+    )
+    return result.rowcount
+
+def unlock_challenges_for_users(user_ids=None):
+    """Batch form of unlock_challenges() for many athletes (all when user_ids is None)."""
+    level_met = select(Challenge.id).join(UserProfile, UserProfile.id == UserChallenge.user_id).where(
+        Challenge.id == UserChallenge.challenge_id,
+        Challenge.level_requirement <= UserProfile.level
+    ).exists()
+    statement = update(UserChallenge).where(UserChallenge.status == 'locked', level_met)
+    if user_ids is not None:
+        statement = statement.where(UserChallenge.user_id.in_(user_ids))
+    # The athletes are named explicitly, and may not be the one signed in (see add_athlete)
+    result = db.session.execute(statement.values(status='unlocked').execution_options(synchronize_session=False, all_users=True))
+    return result.rowcount
+
+def link_milestone_challenges(user_ids=None):
+    """Links every milestone challenge at or below each athlete's level that they are not linked to yet.
+
+    Levels can jump by more than one at a time, so reached milestones are
+    matched with <= rather than only the milestone at the new level.
+    """
+    already_linked = select(UserChallenge.id).where(
+        UserChallenge.user_id == UserProfile.id,
+        UserChallenge.challenge_id == Challenge.id
+    ).exists()
+    # Linked locked, like every other link; the unlock that follows opens them
+    reached = select(UserProfile.id, Challenge.id, literal('locked')).where(
+        Challenge.is_milestone_challenge == True,
+        Challenge.level_requirement <= UserProfile.level,
+        ~already_linked
+    )
+    if user_ids is not None:
+        reached = reached.where(UserProfile.id.in_(user_ids))
+    result = db.session.execute(
+        insert(UserChallenge).from_select(['user_id', 'challenge_id', 'status'], reached).execution_options(all_users=True)
+    )
+    return result.rowcount
+
+def link_system_challenges(user_ids=None):
+    """Links every system (not user-created) challenge the athletes are missing, then unlocks those within reach.
+
+    New athletes get the whole catalogue, locked above their level. Returns the number of links created.
+    """
+    already_linked = select(UserChallenge.id).where(
+        UserChallenge.user_id == UserProfile.id,
+        UserChallenge.challenge_id == Challenge.id
+    ).exists()
+    # Every athlete against every system challenge, minus the links that exist
+    missing = select(UserProfile.id, Challenge.id, literal('locked')).join(Challenge, true()).where(
+        Challenge.is_user_created == False,
+        ~already_linked
+    )
+    if user_ids is not None:
+        missing = missing.where(UserProfile.id.in_(user_ids))
+    result = db.session.execute(
+        insert(UserChallenge).from_select(['user_id', 'challenge_id', 'status'], missing).execution_options(all_users=True)
+    )
+    unlock_challenges_for_users(user_ids)
+    return result.rowcount
+
+def apply_level_change(profile):
+    """Brings the athlete's challenge links up to date after their level changed or they gained links.
+
+    Milestones are linked first, so the unlock in the same pass also covers
+    them. Returns (unlocked, milestones linked).
+    """
+    db.session.flush()
+    linked = link_milestone_challenges([profile.id])
+    return unlock_challenges(profile), linked
+
+def sync_challenge_links(user_ids=None):
+    """Batch form of apply_level_change() for many athletes (all when user_ids is None)."""
+    db.session.flush()
+    linked = link_milestone_challenges(user_ids)
+    return unlock_challenges_for_users(user_ids), linked
+
+# XP, levels and badges are awarded with single SQL statements rather than a
+# read-modify-write in Python, so concurrent completions (double-clicks, two
+# tabs, two workers) cannot overwrite each other's XP or award a badge twice.
+# The first UPDATE holds the athlete's row (or SQLite's write lock) until
+# commit, so the level written after it is based on the XP it returned.
+
+def update_profile_returning(profile, **values):
+    """Applies `values` to the athlete's row in one UPDATE ... RETURNING and syncs `profile`. Returns (xp, level)."""
+    xp, level = db.session.execute(
+        update(UserProfile).where(UserProfile.id == profile.id).values(**values)
+        .returning(UserProfile.experience_points, UserProfile.level)
+        .execution_options(synchronize_session=False, page_cache_owner=profile.id)
+    ).one()
+    # Committed values, so the next flush does not write them back over other requests' changes
+    set_committed_value(profile, 'experience_points', xp)
+    set_committed_value(profile, 'level', level)
+    return xp, level
+
+def award_xp(profile, xp_reward):
+    """Adds XP atomically and raises the level to match, across several levels if needed. Returns True on a level-up."""
+    xp, level = update_profile_returning(profile, experience_points=UserProfile.experience_points + xp_reward)
+    new_level = level_after_xp(level, xp)
+    if new_level > level:
+        update_profile_returning(profile, level=new_level)
+    return new_level > level
+
+def promote(profile):
+    """Raises the athlete one level atomically (custom challenges promote without XP)."""
+    update_profile_returning(profile, level=UserProfile.level + 1)
+
+def award_badge(user_id, badge_id):
+    """Inserts the UserBadge unless the athlete already has it. Returns True if it was newly awarded."""
+    values = {'user_id': user_id, 'badge_id': badge_id, 'date_earned': datetime.utcnow()}
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        statement = dialect_insert(UserBadge).values(**values).on_conflict_do_nothing(index_elements=['user_id', 'badge_id'])
+        return db.session.execute(statement).rowcount == 1
+
+    # Other backends: let the unique constraint decide, inside a savepoint
+    try:
+        with db.session.begin_nested():
+            db.session.add(UserBadge(**values))
+        return True
+    except IntegrityError:
+        return False
+
+@tournament_bp.cli.command('sync-challenge-progress')
+def sync_challenge_progress():
+    """Unlocks challenges and links milestones for every athlete (backfill after imports or rule changes)."""
+    unlocked, linked = sync_challenge_links()
+    db.session.commit()
+    print(f"Unlocked {unlocked} challenge(s) and linked {linked} milestone challenge(s).")
+
+# --- Tournament brackets ---
+# Single elimination. Starting a tournament seeds the entrants by level and XP,
+# pads the field to a power of two with byes for the top seeds and creates every
+# match up front, so results only ever fill in winners. Each athlete's
+# TournamentStats row is updated with SQL increments as results are recorded,
+# which keeps /tournament at a primary-key lookup instead of aggregating matches.
+
+def bracket_seed_order(size):
+    """Seeds in bracket order for a power-of-two field, e.g. 8 -> [1, 8, 4, 5, 2, 7, 3, 6]."""
+    order = [1]
+    while len(order) < size:
+        order = [seed for s in order for seed in (s, 2 * len(order) + 1 - s)]
+    return order
+
+def tournament_stats_for(user_id):
+    """The athlete's counters row, created empty on first use."""
+    stats = db.session.get(TournamentStats, user_id)
+    if stats is None:
+        stats = TournamentStats(user_id=user_id)
+        db.session.add(stats)
+        db.session.flush()
+    return stats
+
+def bump_tournament_stats(user_id, **values):
+    db.session.execute(
+        update(TournamentStats).where(TournamentStats.user_id == user_id)
+        .values(**values).execution_options(synchronize_session=False)
+    )
+
+def add_tournament_entry(tournament, user_id):
+    db.session.add(TournamentEntry(tournament_id=tournament.id, user_id=user_id))
+    tournament_stats_for(user_id)
+    bump_tournament_stats(user_id, tournaments_entered=TournamentStats.tournaments_entered + 1)
+
+def generate_bracket(tournament):
+    """Seeds the entrants and creates all matches. First-round byes are resolved immediately."""
+    entries = tournament.entries.join(UserProfile, UserProfile.id == TournamentEntry.user_id).order_by(
+        UserProfile.level.desc(), UserProfile.experience_points.desc(), TournamentEntry.joined_at, TournamentEntry.id
+    ).all()
+    for seed, entry in enumerate(entries, start=1):
+        entry.seed = seed
+    players = {entry.seed: entry.user_id for entry in entries}
+
+    size = 1 << (len(entries) - 1).bit_length()
+    tournament.rounds = size.bit_length() - 1
+    order = bracket_seed_order(size)
+    first_round = []
+    for round_number in range(1, tournament.rounds + 1):
+        for position in range(size >> round_number):
+            match = Match(tournament_id=tournament.id, round=round_number, position=position)
+            if round_number == 1:
+                match.player1_id = players.get(order[2 * position])
+                match.player2_id = players.get(order[2 * position + 1])
+                first_round.append(match)
+            db.session.add(match)
+    db.session.flush()
+
+    for match in first_round:
+        if match.player2_id is None:
+            match.status = 'bye'
+            match.winner_id = match.player1_id
+            advance_winner(match)
+
+    tournament.status = 'in_progress'
+    tournament.started_at = datetime.utcnow()
+
+def advance_winner(match):
+    """Moves the match winner into the next round, or finishes the tournament after the final."""
+    tournament = match.tournament
+    if match.round == tournament.rounds:
+        tournament.status = 'completed'
+        tournament.winner_id = match.winner_id
+        tournament.finished_at = datetime.utcnow()
+        bump_tournament_stats(match.winner_id, tournaments_won=TournamentStats.tournaments_won + 1)
+        return
+    next_match = Match.query.filter_by(tournament_id=tournament.id, round=match.round + 1, position=match.position // 2).one()
+    if match.position % 2 == 0:
+        next_match.player1_id = match.winner_id
+    else:
+        next_match.player2_id = match.winner_id
+
+def record_match_result(match, winner_id):
+    """Stores the winner, updates both athletes' counters and advances the bracket."""
+    loser_id = match.player2_id if winner_id == match.player1_id else match.player1_id
+    match.winner_id = winner_id
+    match.status = 'completed'
+    match.completed_at = datetime.utcnow()
+
+    streak = TournamentStats.current_streak + 1
+    bump_tournament_stats(
+        winner_id,
+        matches_played=TournamentStats.matches_played + 1,
+        match_wins=TournamentStats.match_wins + 1,
+        current_streak=streak,
+        best_streak=case((streak > TournamentStats.best_streak, streak), else_=TournamentStats.best_streak)
+    )
+    bump_tournament_stats(loser_id, matches_played=TournamentStats.matches_played + 1, current_streak=0)
+    advance_winner(match)
+
+# --- Global leaderboard ---
+# Every athlete ordered by level, then XP. Ranks come from an in-memory index
+# (leaderboard.RankedIndex) instead of sorting user_profile on every view. The
+# index is loaded on first use, updated in place when this worker changes an
+# athlete's XP or level, and reloaded every LEADERBOARD_REFRESH_SECONDS so
+# changes made by other workers show up too.
+
+def get_leaderboard():
+    board = current_app.extensions['leaderboard']
+    age = board.age()
+    if age is None or age > current_app.config['LEADERBOARD_REFRESH_SECONDS']:
+        board.load(db.session.query(UserProfile.id, UserProfile.level, UserProfile.experience_points).all())
+    return board
+
+def leaderboard_entries(ranked):
+    """Template/JSON rows for [(rank, user_id, level, xp)], with names looked up in one query."""
+    names = dict(db.session.query(UserProfile.id, UserProfile.name).filter(
+        UserProfile.id.in_([user_id for _, user_id, _, _ in ranked])
+    ).all()) if ranked else {}
+    return [
+        {'rank': rank, 'user_id': user_id, 'name': names.get(user_id) or f'Athlete {user_id}',
+         'level': level, 'experience_points': xp, 'title': rank_title(level)}
+        for rank, user_id, level, xp in ranked
+    ]
+
+@tournament_bp.route('/api/leaderboard')
+def leaderboard_api():
+    """Top athletes plus the current athlete's position and neighbours.
+
+    Query params: limit (top N, default 10, max 100) and radius (neighbours on
+    each side, default LEADERBOARD_RADIUS, max 50).
+    """
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
+    radius = min(max(request.args.get('radius', current_app.config['LEADERBOARD_RADIUS'], type=int), 0), 50)
+    board = get_leaderboard()
+    return {
+        'size': len(board),
+        'rank': board.rank(g.user.id),
+        'top': leaderboard_entries(board.top(limit)),
+        'around_me': leaderboard_entries(board.around(g.user.id, radius)),
+    }
+
+#---------TOURNAMENT -------------------------
+
+@tournament_bp.route('/tournament')
+@cached_page('tournament')
+def tournament():
+    # 1. Fetch Core Data
+    profile = g.user
+
+    # 2. Fetch all data for rendering (challenges are unlocked when the level changes, see apply_level_change)
+    all_user_challenges = UserChallenge.query.filter_by(user_id=profile.id).join(Challenge).order_by(Challenge.level_requirement).all()
+    
+    # --- THIS IS THE FIX ---
+    # Explicitly join with Badge to access its columns for sorting
+    earned_badges = UserBadge.query.filter_by(user_id=profile.id).join(Badge).order_by(Badge.challenges_required).all()
+
+    # 4. Calculate Level and XP Bar from the precomputed level table
+    current_level = profile.level
+    xp_for_next_level, xp_percentage = level_progress(current_level, profile.experience_points)
+    
+    # 5. Determine Rank, and the athlete's place on the global leaderboard
+    full_rank = rank_title(current_level)
+    board = get_leaderboard()
+    global_rank = board.rank(profile.id)
+    leaderboard_top = leaderboard_entries(board.top(current_app.config['LEADERBOARD_RADIUS'] * 2 + 1))
+    leaderboard_around = leaderboard_entries(board.around(profile.id, current_app.config['LEADERBOARD_RADIUS']))
+
+    # 6. Tournament stats (maintained as results are recorded) and tournaments to show
+    stats = db.session.get(TournamentStats, profile.id) or TournamentStats(
+        tournaments_entered=0, tournaments_won=0, matches_played=0, match_wins=0, current_streak=0, best_streak=0
+    )
+    open_tournaments = Tournament.query.filter_by(status='registration').order_by(Tournament.created_at.desc()).limit(10).all()
+    my_tournaments = Tournament.query.join(TournamentEntry).filter(
+        TournamentEntry.user_id == profile.id
+    ).order_by(Tournament.created_at.desc()).limit(10).all()
+
+    # 7. Pass all data to the template
+    return render_template(
+        'Tournament.html',
+        active_page='tournament',
+        profile=profile,
+        xp_percentage=xp_percentage,
+        xp_for_next_level=xp_for_next_level,
+        full_rank=full_rank,
+        global_rank=global_rank,
+        leaderboard_size=len(board),
+        leaderboard_top=leaderboard_top,
+        leaderboard_around=leaderboard_around,
+        upcoming_levels=upcoming_levels(current_level),
+        stats=stats,
+        open_tournaments=open_tournaments,
+        my_tournaments=my_tournaments,
+        all_user_challenges=all_user_challenges,
+        earned_badges=earned_badges
+    )
+
+@tournament_bp.route('/challenges/start/<int:user_challenge_id>', methods=['POST'])
+def start_challenge(user_challenge_id):
+    profile = g.user
+        
+    user_challenge = UserChallenge.query.filter_by(id=user_challenge_id, user_id=profile.id).first_or_404()
+
+    if profile.level >= user_challenge.challenge.level_requirement:
+        user_challenge.status = 'active'
+        user_challenge.started_at = datetime.utcnow() # Track start time
+        db.session.commit()
+        flash(f"Challenge '{user_challenge.challenge.title}' started! Good luck!", 'success')
+    else:
+        flash("You do not meet the level requirement for this challenge.", 'danger')
+        
+    return redirect(url_for('tournament.tournament'))
+
+@tournament_bp.route('/challenges/complete/<int:user_challenge_id>', methods=['POST'])
+def complete_challenge(user_challenge_id):
+    profile = g.user
+
+    user_challenge = UserChallenge.query.filter_by(id=user_challenge_id, user_id=profile.id).first_or_404()
+
+    # Claim the completion in the UPDATE itself: of several concurrent requests for
+    # the same challenge, only one still matches the status check
+    claimed = db.session.execute(
+        update(UserChallenge)
+        .where(UserChallenge.id == user_challenge.id, UserChallenge.status.in_(['active', 'unlocked']))
+        .values(status='completed')
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if claimed:
+        set_committed_value(user_challenge, 'status', 'completed')
+        challenge = user_challenge.challenge
+
+        if challenge.is_user_created:
+            promote(profile)
+            levelled_up = True
+            flash(f"Custom challenge '{challenge.title}' completed! You've been promoted to Level {profile.level}!", 'success')
+        else:
+            xp_reward = challenge.xp_reward
+            # A large reward can cross several levels at once
+            levelled_up = award_xp(profile, xp_reward)
+            flash(f"Challenge '{challenge.title}' completed! You earned {xp_reward} XP!", 'success')
+            if levelled_up:
+                flash(f"Congratulations! You've reached Level {profile.level}!", 'info')
+
+        if challenge.is_milestone_challenge and challenge.awards_badge_id:
+            if award_badge(profile.id, challenge.awards_badge_id):
+                flash(f"New Badge Unlocked: {challenge.badge_to_award.name}!", 'success')
+
+        if levelled_up:
+            unlocked, milestones = apply_level_change(profile)
+            if milestones:
+                flash('A new Milestone Challenge is available!', 'info')
+            if unlocked:
+                flash('New challenges have been unlocked!', 'info')
+
+        db.session.commit()
+        get_leaderboard().update(profile.id, profile.level, profile.experience_points)
+    else:
+        flash("This challenge is not currently active.", 'warning')
+
+    return redirect(url_for('tournament.tournament'))
+
+@tournament_bp.route('/challenges/create', methods=['POST'])
+def create_challenge():
+    profile = g.user
+    
+    title = request.form.get('title')
+    task_details = request.form.get('task_details')
+    level_req = request.form.get('level_requirement', type=int)
+    xp_reward = request.form.get('xp_reward', type=int)
+
+    if not all([title, task_details, level_req, xp_reward]):
+        flash('All fields are required to create a challenge.', 'danger')
+        return redirect(url_for('tournament.tournament'))
+
+    new_challenge = Challenge(
+        title=title,
+        task_details=task_details,
+        level_requirement=level_req,
+        xp_reward=xp_reward,
+        is_user_created=True,
+        user_id=profile.id
+    )
+    db.session.add(new_challenge)
+    db.session.flush() 
+    
+    user_challenge_link = UserChallenge(user_id=profile.id, challenge_id=new_challenge.id, status='unlocked')
+    db.session.add(user_challenge_link)
+    
+    db.session.commit()
+    flash('Your custom challenge has been created!', 'success')
+    return redirect(url_for('tournament.tournament'))
+
+@tournament_bp.route('/challenges/edit/<int:challenge_id>', methods=['GET', 'POST'])
+def edit_challenge(challenge_id):
+    challenge = Challenge.query.get_or_404(challenge_id)
+    profile = g.user
+
+    if not challenge.is_user_created or challenge.user_id != profile.id:
+        flash('You do not have permission to edit this challenge.', 'danger')
+        return redirect(url_for('tournament.tournament'))
+
+    if request.method == 'POST':
+        challenge.title = request.form.get('title')
+        challenge.task_details = request.form.get('task_details')
+        challenge.level_requirement = request.form.get('level_requirement', type=int)
+        challenge.xp_reward = request.form.get('xp_reward', type=int)
+        db.session.commit()
+        flash('Your challenge has been updated.', 'success')
+        return redirect(url_for('tournament.tournament'))
+
+    return render_template('edit_challenge.html', challenge=challenge, active_page='tournament')
+
+@tournament_bp.route('/challenges/delete/<int:challenge_id>', methods=['POST'])
+def delete_challenge(challenge_id):
+    challenge = Challenge.query.get_or_404(challenge_id)
+    profile = g.user
+
+    if not challenge.is_user_created or challenge.user_id != profile.id:
+        flash('You do not have permission to delete this challenge.', 'danger')
+        return redirect(url_for('tournament.tournament'))
+    
+    UserChallenge.query.filter_by(challenge_id=challenge.id).delete()
+    db.session.delete(challenge)
+    db.session.commit()
+    flash('Your custom challenge has been deleted.', 'success')
+    return redirect(url_for('tournament.tournament'))
+
+@tournament_bp.route('/tournaments/create', methods=['POST'])
+def create_tournament():
+    name = request.form.get('name', '').strip()
+    required_level = request.form.get('required_level', 1, type=int)
+    if not name:
+        flash('A tournament name is required.', 'danger')
+        return redirect(url_for('tournament.tournament'))
+
+    new_tournament = Tournament(name=name, required_level=max(1, required_level), created_by=g.user.id)
+    db.session.add(new_tournament)
+    db.session.flush()
+    add_tournament_entry(new_tournament, g.user.id)
+    db.session.commit()
+    flash(f"Tournament '{name}' created. Other athletes can join until you start it.", 'success')
+    return redirect(url_for('tournament.tournament_bracket', tournament_id=new_tournament.id))
+
+@tournament_bp.route('/tournaments/<int:tournament_id>')
+def tournament_bracket(tournament_id):
+    tournament_to_show = Tournament.query.get_or_404(tournament_id)
+    entries = tournament_to_show.entries.order_by(TournamentEntry.seed, TournamentEntry.joined_at).all()
+    rounds = {}
+    for match in tournament_to_show.matches.order_by(Match.round, Match.position):
+        rounds.setdefault(match.round, []).append(match)
+    return render_template(
+        'tournament_bracket.html',
+        active_page='tournament',
+        tournament=tournament_to_show,
+        entries=entries,
+        rounds=rounds,
+        is_entered=any(entry.user_id == g.user.id for entry in entries)
+    )
+
+@tournament_bp.route('/tournaments/<int:tournament_id>/join', methods=['POST'])
+def join_tournament(tournament_id):
+    tournament_to_join = Tournament.query.get_or_404(tournament_id)
+    if tournament_to_join.status != 'registration':
+        flash('Registration for this tournament is closed.', 'warning')
+    elif g.user.level < tournament_to_join.required_level:
+        flash(f'You need to reach Level {tournament_to_join.required_level} to join this tournament.', 'danger')
+    elif tournament_to_join.entries.filter_by(user_id=g.user.id).first():
+        flash('You have already joined this tournament.', 'info')
+    else:
+        add_tournament_entry(tournament_to_join, g.user.id)
+        db.session.commit()
+        flash(f"You joined '{tournament_to_join.name}'!", 'success')
+    return redirect(url_for('tournament.tournament_bracket', tournament_id=tournament_id))
+
+@tournament_bp.route('/tournaments/<int:tournament_id>/start', methods=['POST'])
+def start_tournament(tournament_id):
+    tournament_to_start = Tournament.query.get_or_404(tournament_id)
+    if tournament_to_start.created_by != g.user.id:
+        flash('Only the organiser can start this tournament.', 'danger')
+    elif tournament_to_start.status != 'registration':
+        flash('This tournament has already started.', 'warning')
+    elif tournament_to_start.entries.count() < 2:
+        flash('At least two athletes must join before the tournament can start.', 'danger')
+    else:
+        generate_bracket(tournament_to_start)
+        db.session.commit()
+        flash('The bracket is set. Good luck!', 'success')
+    return redirect(url_for('tournament.tournament_bracket', tournament_id=tournament_id))
+
+@tournament_bp.route('/matches/<int:match_id>/result', methods=['POST'])
+def record_match(match_id):
+    match = Match.query.get_or_404(match_id)
+    winner_id = request.form.get('winner_id', type=int)
+    players = (match.player1_id, match.player2_id)
+    if g.user.id not in players:
+        flash('Only the two players can record this result.', 'danger')
+    elif match.status != 'pending' or None in players:
+        flash('This match cannot be decided right now.', 'warning')
+    elif winner_id not in players:
+        flash('The winner must be one of the two players.', 'danger')
+    else:
+        record_match_result(match, winner_id)
+        db.session.commit()
+        flash('Result recorded.', 'success')
+    return redirect(url_for('tournament.tournament_bracket', tournament_id=match.tournament_id))
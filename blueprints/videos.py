@@ -0,0 +1,717 @@
+"""Video library: uploads, background processing, streaming and thumbnails."""
+
+import functools
+import hashlib
+import math
+import mimetypes
+import mmap
+import os
+import shutil
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, Response, abort, send_from_directory, g
+from werkzeug.datastructures import ContentRange
+from werkzeug.utils import secure_filename
+
+from extensions import db
+from models import Video, VideoJob, UploadSession, UploadChunk, VideoRendition
+from helpers import format_duration, keyset_page, paginated_cards_json
+
+videos_bp = Blueprint('videos', __name__, cli_group=None)
+
+# --- VIDEOS SECTION START ---
+
+@videos_bp.route('/videos')
+def videos():
+    user = g.user
+
+    category_filter = request.args.get('category', 'all')
+    
+    query = Video.query.filter_by(user_id=user.id)
+    
+    if category_filter != 'all':
+        query = query.filter_by(category=category_filter)
+        
+    all_videos, next_cursor = keyset_page(
+        query, [Video.upload_date, Video.id],
+        request.args.get('cursor'), current_app.config['PAGE_SIZE']
+    )
+
+    if request.args.get('format') == 'json':
+        return paginated_cards_json('_video_card.html', 'video', all_videos, next_cursor, category_filter)
+    
+    all_categories = db.session.query(Video.category).filter_by(user_id=user.id).distinct().all()
+    categories = [cat[0] for cat in all_categories]
+    
+    return render_template(
+        'videos.html', 
+        active_page='videos',
+        videos=all_videos,
+        categories=categories,
+        active_category=category_filter,
+        next_cursor=next_cursor
+    )
+
+# --- Background video processing ---
+# Probing and thumbnailing run in a process pool so the upload request returns
+# immediately. Each upload gets a VideoJob row so pending work survives restarts.
+# ffmpeg is imported inside the worker functions, so only processes that encode
+# video pay for it.
+
+def get_video_executor():
+    """Lazily creates the app's process pool used for video processing."""
+    if current_app.extensions['video_executor'] is None:
+        current_app.extensions['video_executor'] = ProcessPoolExecutor(max_workers=current_app.config['VIDEO_WORKERS'])
+    return current_app.extensions['video_executor']
+
+def resize_thumbnail(source_path, target_path, width):
+    """Writes a copy of a thumbnail scaled down to the given width."""
+    import ffmpeg
+    (
+        ffmpeg
+        .input(source_path)
+        .output(target_path, vf=f"scale='min({width},iw)':-2", vframes=1)
+        .run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
+    )
+
+def build_thumbnail_sprite(video_full_path, sprite_full_path, vtt_full_path, duration_in_seconds, width, height, settings):
+    """Writes a sprite sheet of evenly spaced frames plus a WebVTT index into it.
+
+    The cues point at "sprite#xywh=...", which browsers resolve relative to the
+    VTT's own URL (/thumbs/<video_id>/vtt -> /thumbs/<video_id>/sprite).
+    """
+    import ffmpeg
+    columns, rows, tile_width = settings['columns'], settings['rows'], settings['tile_width']
+    tile_height = int(round(tile_width * height / width / 2)) * 2
+    interval = max(1, math.ceil(duration_in_seconds / (columns * rows)))
+    (
+        ffmpeg
+        .input(video_full_path)
+        .output(sprite_full_path, vf=f"fps=1/{interval},scale={tile_width}:{tile_height},tile={columns}x{rows}", vframes=1)
+        .run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
+    )
+
+    def timestamp(seconds):
+        return f"{seconds // 3600:02}:{(seconds % 3600) // 60:02}:{seconds % 60:02}.000"
+
+    tiles = min(columns * rows, math.ceil(duration_in_seconds / interval))
+    cues = ['WEBVTT', '']
+    for i in range(tiles):
+        start = i * interval
+        end = min((i + 1) * interval, math.ceil(duration_in_seconds))
+        x, y = (i % columns) * tile_width, (i // columns) * tile_height
+        cues.extend([f"{timestamp(start)} --> {timestamp(end)}", f"sprite#xywh={x},{y},{tile_width},{tile_height}", ''])
+    with open(vtt_full_path, 'w') as vtt:
+        vtt.write('\n'.join(cues))
+
+def process_video_file(video_full_path, thumbnail_full_path, thumbnail_sizes, sprite_settings):
+    """Probes a video, writes its thumbnails and returns the extracted metadata.
+
+    Runs inside a worker process, so it must not touch the database.
+    """
+    import ffmpeg
+    # 1. Probe video to get metadata
+    probe = ffmpeg.probe(video_full_path)
+    video_stream = next((stream for stream in probe['streams'] if stream['codec_type'] == 'video'), None)
+    duration_in_seconds = float(video_stream['duration'])
+    width, height = int(video_stream['width']), int(video_stream['height'])
+
+    # 2. Generate Thumbnail (at the 1-second mark)
+    (
+        ffmpeg
+        .input(video_full_path, ss=1)
+        .output(thumbnail_full_path, vframes=1)
+        .run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
+    )
+
+    # 3. Resized copies for the grid card, hover preview and retina screens
+    thumbnail_stem = os.path.splitext(thumbnail_full_path)[0]
+    for size, target_width in thumbnail_sizes.items():
+        resize_thumbnail(thumbnail_full_path, f"{thumbnail_stem}_{size}.jpg", target_width)
+
+    # 4. Scrub-preview sprite sheet and its WebVTT index
+    build_thumbnail_sprite(
+        video_full_path, f"{thumbnail_stem}_sprite.jpg", f"{thumbnail_stem}_sprite.vtt",
+        duration_in_seconds, width, height, sprite_settings
+    )
+
+    # 5. Get File Size
+    size_in_bytes = os.path.getsize(video_full_path)
+
+    return {
+        'duration': format_duration(duration_in_seconds),
+        'size_mb': round(size_in_bytes / (1024 * 1024), 2),
+        'width': width,
+        'height': height
+    }
+
+def build_hls_renditions(video_full_path, output_dir, ladder, source_width, source_height):
+    """Encodes segmented HLS renditions plus a master playlist for one video.
+
+    Runs inside a worker process. Rungs taller than the source are skipped so
+    nothing is upscaled; the smallest rung is always kept.
+    """
+    import ffmpeg
+    os.makedirs(output_dir, exist_ok=True)
+    rungs = [rung for rung in ladder if rung['height'] <= source_height] or [ladder[-1]]
+
+    renditions = []
+    for rung in rungs:
+        name = f"{rung['height']}p"
+        (
+            ffmpeg
+            .input(video_full_path)
+            .output(
+                os.path.join(output_dir, f"{name}.m3u8"),
+                vf=f"scale=-2:{rung['height']}",
+                format='hls',
+                hls_time=6,
+                hls_playlist_type='vod',
+                hls_segment_filename=os.path.join(output_dir, f"{name}_%03d.ts"),
+                **{'c:v': 'libx264', 'b:v': f"{rung['video_kbps']}k", 'c:a': 'aac', 'b:a': f"{rung['audio_kbps']}k"}
+            )
+            .run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
+        )
+        # Keep the width even, as libx264 requires
+        width = int(round(source_width * rung['height'] / source_height / 2)) * 2
+        renditions.append({
+            'name': name,
+            'width': width,
+            'height': rung['height'],
+            'bandwidth': (rung['video_kbps'] + rung['audio_kbps']) * 1000
+        })
+
+    # Master playlist that lets each client pick the bitrate it can handle
+    lines = ['#EXTM3U', '#EXT-X-VERSION:3']
+    for rendition in renditions:
+        lines.append(f"#EXT-X-STREAM-INF:BANDWIDTH={rendition['bandwidth']},RESOLUTION={rendition['width']}x{rendition['height']}")
+        lines.append(f"{rendition['name']}.m3u8")
+    with open(os.path.join(output_dir, 'master.m3u8'), 'w') as master:
+        master.write('\n'.join(lines) + '\n')
+
+    return renditions
+
+def hls_folder_name(video):
+    """Name of the folder holding a video's HLS renditions."""
+    return os.path.splitext(os.path.basename(video.file_path))[0]
+
+def enqueue_video_job(video, kind='probe'):
+    """Records a processing job for the video and hands it to the worker pool."""
+    job = VideoJob(video_id=video.id, kind=kind)
+    db.session.add(job)
+    db.session.commit()
+
+    # Done-callbacks run on an executor thread, outside this app context
+    app = current_app._get_current_object()
+    unique_filename = os.path.basename(video.file_path)
+    video_full_path = os.path.join(current_app.config['VIDEO_UPLOAD_FOLDER'], unique_filename)
+    if kind == 'hls':
+        future = get_video_executor().submit(
+            build_hls_renditions,
+            video_full_path,
+            os.path.join(current_app.config['HLS_UPLOAD_FOLDER'], hls_folder_name(video)),
+            current_app.config['VIDEO_HLS_LADDER'],
+            video.width,
+            video.height
+        )
+        future.add_done_callback(functools.partial(finish_hls_job, app, job.id))
+    else:
+        unique_thumbnail_name = f"{os.path.splitext(unique_filename)[0]}.jpg"
+        future = get_video_executor().submit(
+            process_video_file,
+            video_full_path,
+            os.path.join(current_app.config['THUMBNAIL_UPLOAD_FOLDER'], unique_thumbnail_name),
+            current_app.config['THUMBNAIL_SIZES'],
+            current_app.config['THUMBNAIL_SPRITE']
+        )
+        future.add_done_callback(functools.partial(finish_video_job, app, job.id, unique_thumbnail_name))
+    return job
+
+def finish_video_job(app, job_id, unique_thumbnail_name, future):
+    """Stores the result of a finished processing job (runs in the parent process)."""
+    with app.app_context():
+        job = db.session.get(VideoJob, job_id)
+        if not job:
+            return
+        video = job.video
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"FFmpeg Error: {e}") # Log the actual error for debugging
+            job.status = 'failed'
+            job.error = str(e)
+            # The upload is kept so the card can retry the job; Delete removes both
+            video.status = 'failed'
+        else:
+            job.status = 'completed'
+            video.status = 'ready'
+            video.duration = result['duration']
+            video.size_mb = result['size_mb']
+            video.width = result['width']
+            video.height = result['height']
+            video.thumbnail_path = os.path.join('uploads', 'thumbnails', unique_thumbnail_name)
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+
+        # Optional adaptive-bitrate stage; the original file stays playable meanwhile
+        if job.status == 'completed' and current_app.config['VIDEO_HLS_ENABLED'] and video.height:
+            enqueue_video_job(video, kind='hls')
+
+def finish_hls_job(app, job_id, future):
+    """Records the renditions produced by a finished HLS job (runs in the parent process)."""
+    with app.app_context():
+        job = db.session.get(VideoJob, job_id)
+        if not job:
+            return
+        video = job.video
+        try:
+            renditions = future.result()
+        except Exception as e:
+            print(f"FFmpeg HLS Error: {e}")
+            job.status = 'failed'
+            job.error = str(e)
+        else:
+            job.status = 'completed'
+            video.renditions.delete()
+            folder = hls_folder_name(video)
+            for rendition in renditions:
+                db.session.add(VideoRendition(
+                    video_id=video.id,
+                    name=rendition['name'],
+                    width=rendition['width'],
+                    height=rendition['height'],
+                    bandwidth=rendition['bandwidth'],
+                    playlist_path=os.path.join('uploads', 'hls', folder, f"{rendition['name']}.m3u8")
+                ))
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+
+@videos_bp.route('/videos/retry/<int:video_id>', methods=['POST'])
+def retry_video(video_id):
+    """Re-runs processing for a video whose last job failed."""
+    video = Video.query.get_or_404(video_id)
+    if video.status != 'failed':
+        flash('Only videos whose processing failed can be retried.', 'warning')
+        return redirect(url_for('videos.videos'))
+    if not os.path.exists(os.path.join(current_app.config['VIDEO_UPLOAD_FOLDER'], os.path.basename(video.file_path))):
+        flash('The uploaded file is missing; delete this video and upload it again.', 'danger')
+        return redirect(url_for('videos.videos'))
+
+    video.status = 'processing'
+    enqueue_video_job(video)
+    flash(f"Processing '{video.title}' again.", 'success')
+    return redirect(url_for('videos.videos'))
+
+@videos_bp.cli.command('resume-video-jobs')
+def resume_video_jobs():
+    """Re-submits video jobs that were still queued when the server stopped."""
+    pending_jobs = VideoJob.query.filter_by(status='queued').all()
+    for job in pending_jobs:
+        job.status = 'failed'
+        job.error = 'Superseded by a resumed job.'
+        job.finished_at = datetime.utcnow()
+        enqueue_video_job(job.video, kind=job.kind)
+    get_video_executor().shutdown(wait=True)
+    print(f"Resumed {len(pending_jobs)} video job(s).")
+
+@videos_bp.route('/videos/upload', methods=['POST'])
+def upload_video():
+    user = g.user
+
+    title = request.form.get('title')
+    category = request.form.get('category')
+    description = request.form.get('description')
+    file = request.files.get('video_file')
+
+    if not all([title, category, file]):
+        flash('Title, Category, and a video file are required.', 'danger')
+        return redirect(url_for('videos.videos'))
+
+    if file.filename == '':
+        flash('No selected file.', 'danger')
+        return redirect(url_for('videos.videos'))
+
+    filename = secure_filename(file.filename)
+    unique_filename = f"{uuid.uuid4().hex}_{filename}"
+    video_full_path = os.path.join(current_app.config['VIDEO_UPLOAD_FOLDER'], unique_filename)
+    file.save(video_full_path)
+
+    new_video = Video(
+        title=title,
+        category=category,
+        description=description,
+        file_path=os.path.join('uploads', 'videos', unique_filename),
+        status='processing',
+        user_id=user.id
+    )
+
+    db.session.add(new_video)
+    db.session.commit()
+
+    # Probe, thumbnail and size calculation happen off the request path
+    enqueue_video_job(new_video)
+    flash('Video uploaded! It will be available as soon as processing finishes.', 'success')
+    return redirect(url_for('videos.videos'))
+
+# --- Resumable chunked uploads ---
+# Create a session, PUT numbered chunks (raw body, optional X-Chunk-SHA256
+# header), then finalize. Each chunk is verified in a temporary buffer and then
+# written at its offset in the final file, so an interrupted upload only needs
+# to resend the chunks that are missing and a bad resend never overwrites good
+# data. Sessions still open after VIDEO_UPLOAD_SESSION_TTL are discarded along
+# with their partial file.
+
+def upload_session_state(upload):
+    return {
+        'session_id': upload.id,
+        'status': upload.status,
+        'chunk_size': upload.chunk_size,
+        'total_chunks': upload.total_chunks,
+        'received_chunks': [chunk.index for chunk in upload.chunks.order_by(UploadChunk.index)],
+        'video_id': upload.video_id
+    }
+
+def upload_session_expired(upload):
+    ttl = timedelta(seconds=current_app.config['VIDEO_UPLOAD_SESSION_TTL'])
+    return upload.status == 'open' and upload.created_at < datetime.utcnow() - ttl
+
+def discard_upload_session(upload):
+    """Deletes the session and its chunk records, plus the partial file if it was never finalized."""
+    if upload.status == 'open':
+        full_path = os.path.join(current_app.config['VIDEO_UPLOAD_FOLDER'], upload.file_name)
+        if os.path.exists(full_path):
+            os.remove(full_path)
+    db.session.delete(upload)
+
+def expire_upload_sessions():
+    """Discards open sessions older than VIDEO_UPLOAD_SESSION_TTL (the current athlete's during a request). Returns the count."""
+    cutoff = datetime.utcnow() - timedelta(seconds=current_app.config['VIDEO_UPLOAD_SESSION_TTL'])
+    expired = UploadSession.query.filter(UploadSession.status == 'open', UploadSession.created_at < cutoff).all()
+    for upload in expired:
+        discard_upload_session(upload)
+    return len(expired)
+
+@videos_bp.route('/videos/uploads', methods=['POST'])
+def create_upload_session():
+    user = g.user
+
+    title = request.form.get('title')
+    category = request.form.get('category')
+    description = request.form.get('description')
+    filename = secure_filename(request.form.get('filename', ''))
+    total_size = request.form.get('total_size', type=int)
+
+    if not all([title, category, filename]) or total_size is None:
+        return {'error': 'Title, Category, filename and total_size are required.'}, 400
+    if not 0 < total_size <= current_app.config['MAX_CONTENT_LENGTH']:
+        return {'error': f"total_size must be between 1 and {current_app.config['MAX_CONTENT_LENGTH']} bytes."}, 400
+
+    expire_upload_sessions()
+    if UploadSession.query.filter_by(status='open').count() >= current_app.config['VIDEO_UPLOAD_MAX_OPEN_SESSIONS']:
+        db.session.commit()
+        return {'error': 'Too many unfinished uploads; finish or cancel one first.'}, 409
+
+    upload = UploadSession(
+        user_id=user.id,
+        title=title,
+        category=category,
+        description=description,
+        file_name=f"{uuid.uuid4().hex}_{filename}",
+        total_size=total_size,
+        chunk_size=current_app.config['VIDEO_UPLOAD_CHUNK_SIZE']
+    )
+
+    # Pre-size the destination so chunks can be written at their offsets in any order
+    with open(os.path.join(current_app.config['VIDEO_UPLOAD_FOLDER'], upload.file_name), 'wb') as f:
+        f.truncate(total_size)
+
+    db.session.add(upload)
+    db.session.commit()
+    return upload_session_state(upload), 201
+
+@videos_bp.route('/videos/uploads/<session_id>', methods=['GET'])
+def get_upload_session(session_id):
+    upload = UploadSession.query.get_or_404(session_id)
+    if upload_session_expired(upload):
+        discard_upload_session(upload)
+        db.session.commit()
+        abort(404)
+    return upload_session_state(upload)
+
+@videos_bp.route('/videos/uploads/<session_id>/chunks/<int:index>', methods=['PUT'])
+def upload_chunk(session_id, index):
+    upload = UploadSession.query.get_or_404(session_id)
+    if upload.status != 'open':
+        return {'error': 'Upload session is already finalized.'}, 409
+    if upload_session_expired(upload):
+        discard_upload_session(upload)
+        db.session.commit()
+        return {'error': 'Upload session has expired, please start the upload again.'}, 410
+    if index < 0 or index >= upload.total_chunks:
+        return {'error': 'Chunk index out of range.'}, 400
+
+    expected_size = upload.expected_chunk_size(index)
+    if request.content_length != expected_size:
+        return {'error': f'Chunk {index} must be exactly {expected_size} bytes.'}, 400
+
+    # Receive the body into memory (at most one chunk, checked above) and hash it; only a
+    # complete chunk with a matching checksum is written, once, to its offset in the final file
+    buffer = memoryview(bytearray(expected_size))
+    written = 0
+    while written < expected_size:
+        block = request.stream.read(min(64 * 1024, expected_size - written))
+        if not block:
+            break
+        buffer[written:written + len(block)] = block
+        written += len(block)
+
+    if written != expected_size:
+        return {'error': 'Chunk body was truncated.'}, 400
+
+    checksum = hashlib.sha256(buffer).hexdigest()
+    client_checksum = request.headers.get('X-Chunk-SHA256')
+    if client_checksum and client_checksum.lower() != checksum:
+        return {'error': 'Checksum mismatch, please resend this chunk.'}, 422
+
+    with open(os.path.join(current_app.config['VIDEO_UPLOAD_FOLDER'], upload.file_name), 'r+b') as f:
+        f.seek(index * upload.chunk_size)
+        f.write(buffer)
+
+    chunk = upload.chunks.filter_by(index=index).first()
+    if chunk:
+        chunk.size, chunk.sha256 = written, checksum
+    else:
+        db.session.add(UploadChunk(session_id=upload.id, index=index, size=written, sha256=checksum))
+    db.session.commit()
+    return {'index': index, 'sha256': checksum}
+
+@videos_bp.route('/videos/uploads/<session_id>/finalize', methods=['POST'])
+def finalize_upload_session(session_id):
+    upload = UploadSession.query.get_or_404(session_id)
+    if upload.status != 'open':
+        return upload_session_state(upload)
+    if upload_session_expired(upload):
+        discard_upload_session(upload)
+        db.session.commit()
+        return {'error': 'Upload session has expired, please start the upload again.'}, 410
+
+    received = upload.chunks.count()
+    if received != upload.total_chunks:
+        return {'error': f'{upload.total_chunks - received} chunk(s) are still missing.', **upload_session_state(upload)}, 409
+
+    new_video = Video(
+        title=upload.title,
+        category=upload.category,
+        description=upload.description,
+        file_path=os.path.join('uploads', 'videos', upload.file_name),
+        status='processing',
+        user_id=upload.user_id
+    )
+    db.session.add(new_video)
+    db.session.flush()
+
+    upload.status = 'completed'
+    upload.video_id = new_video.id
+    db.session.commit()
+
+    # Same probe/thumbnail pipeline as a regular upload
+    enqueue_video_job(new_video)
+    return upload_session_state(upload)
+
+@videos_bp.route('/videos/uploads/<session_id>', methods=['DELETE'])
+def cancel_upload_session(session_id):
+    upload = UploadSession.query.get_or_404(session_id)
+    discard_upload_session(upload)
+    db.session.commit()
+    return {'status': 'cancelled'}
+
+@videos_bp.cli.command('expire-upload-sessions')
+def expire_upload_sessions_command():
+    """Discards every athlete's resumable uploads left open longer than VIDEO_UPLOAD_SESSION_TTL."""
+    expired = expire_upload_sessions()
+    db.session.commit()
+    print(f"Discarded {expired} expired upload session(s).")
+
+@videos_bp.route('/videos/delete/<int:video_id>', methods=['POST'])
+def delete_video(video_id):
+    video_to_delete = Video.query.get_or_404(video_id)
+
+    # Delete the video and thumbnail files
+    for file_path in [video_to_delete.file_path, video_to_delete.thumbnail_path]:
+        if file_path:
+            try:
+                full_path = os.path.join('static', file_path)
+                if os.path.exists(full_path):
+                    os.remove(full_path)
+            except Exception as e:
+                print(f"Error deleting file {file_path}: {e}")
+
+    # Delete the resized thumbnails and scrub sprite
+    if video_to_delete.thumbnail_path:
+        for size in list(current_app.config['THUMBNAIL_SIZES']) + ['sprite', 'vtt']:
+            full_path = os.path.join(current_app.config['THUMBNAIL_UPLOAD_FOLDER'], thumbnail_file_name(video_to_delete, size))
+            if os.path.exists(full_path):
+                os.remove(full_path)
+
+    # Delete any HLS renditions
+    hls_dir = os.path.join(current_app.config['HLS_UPLOAD_FOLDER'], hls_folder_name(video_to_delete))
+    if os.path.isdir(hls_dir):
+        shutil.rmtree(hls_dir, ignore_errors=True)
+
+    db.session.delete(video_to_delete)
+    db.session.commit()
+    flash('Video deleted successfully.', 'success')
+    return redirect(url_for('videos.videos'))
+
+@videos_bp.route('/videos/data/<int:video_id>')
+def get_video_data(video_id):
+    video = Video.query.get_or_404(video_id)
+    has_renditions = video.renditions.first() is not None
+    return {
+        'title': video.title,
+        'description': video.description,
+        'file_url': url_for('videos.stream_video', video_id=video.id),
+        'poster_url': url_for('videos.video_thumbnail', video_id=video.id, size='preview') if video.thumbnail_path else None,
+        'hls_url': url_for('static', filename=f"uploads/hls/{hls_folder_name(video)}/master.m3u8") if has_renditions else None
+    }
+
+class MmapFileSlice:
+    """Iterates over a byte range of a file through an mmap, without copying it into Python."""
+
+    chunk_size = 1024 * 1024  # 1 MB
+
+    def __init__(self, full_path, start, length):
+        self.file = open(full_path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if length > 0 else None
+        self.start = start
+        self.end = start + length
+        self.chunks = None
+
+    def __iter__(self):
+        self.chunks = self.iter_chunks()
+        return self.chunks
+
+    def iter_chunks(self):
+        if self.map is None:
+            return
+        with memoryview(self.map) as view:
+            for offset in range(self.start, self.end, self.chunk_size):
+                chunk = view[offset:min(offset + self.chunk_size, self.end)]
+                try:
+                    yield chunk
+                finally:
+                    # The server has written it by the time we resume (or close us)
+                    chunk.release()
+
+    def close(self):
+        """Called by the server when the response ends, including when the client disconnects mid-range.
+
+        The mmap cannot be closed while memoryviews into it exist, so the
+        suspended generator is closed first to release its views.
+        """
+        try:
+            if self.chunks is not None:
+                self.chunks.close()
+            if self.map is not None:
+                self.map.close()
+        finally:
+            self.file.close()
+
+@videos_bp.route('/videos/stream/<int:video_id>')
+def stream_video(video_id):
+    video = Video.query.get_or_404(video_id)
+    full_path = os.path.join(current_app.config['VIDEO_UPLOAD_FOLDER'], os.path.basename(video.file_path))
+    if not os.path.isfile(full_path):
+        abort(404)
+
+    stat = os.stat(full_path)
+    file_size = stat.st_size
+
+    response = Response(mimetype=mimetypes.guess_type(full_path)[0] or 'application/octet-stream')
+    response.content_length = file_size
+    response.last_modified = datetime.utcfromtimestamp(stat.st_mtime)
+    response.set_etag(f"{stat.st_mtime_ns:x}-{file_size:x}")
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config['VIDEO_STREAM_CACHE_MAX_AGE']
+
+    # Werkzeug evaluates If-None-Match / If-Modified-Since / If-Range / Range
+    # and sets the status (200, 206 or 304) and Content-Range for us
+    response.make_conditional(request, accept_ranges=True, complete_length=file_size)
+
+    if response.status_code == 304 or request.method == 'HEAD':
+        return response
+
+    start, length = 0, file_size
+    if response.status_code == 206:
+        start, stop = response.content_range.start, response.content_range.stop
+        length = stop - start
+        requested_range = request.range.ranges[0] if request.range else None
+        if requested_range and requested_range[1] is None and length > current_app.config['VIDEO_STREAM_MAX_RANGE']:
+            length = current_app.config['VIDEO_STREAM_MAX_RANGE']
+            response.content_range = ContentRange('bytes', start, start + length, file_size)
+        response.content_length = length
+
+    response.response = MmapFileSlice(full_path, start, length)
+    response.direct_passthrough = True
+    return response
+
+def thumbnail_file_name(video, size):
+    """File name of one of a video's thumbnail variants inside the thumbnail folder."""
+    stem = os.path.splitext(os.path.basename(video.thumbnail_path))[0]
+    if size == 'vtt':
+        return f"{stem}_sprite.vtt"
+    return f"{stem}_{size}.jpg"
+
+@videos_bp.route('/thumbs/<int:video_id>/<size>')
+def video_thumbnail(video_id, size):
+    video = Video.query.get_or_404(video_id)
+    if not video.thumbnail_path or size not in list(current_app.config['THUMBNAIL_SIZES']) + ['sprite', 'vtt']:
+        abort(404)
+
+    folder = current_app.config['THUMBNAIL_UPLOAD_FOLDER']
+    file_name = thumbnail_file_name(video, size)
+    full_path = os.path.join(folder, file_name)
+
+    resized = True
+    if not os.path.exists(full_path) and size in current_app.config['THUMBNAIL_SIZES']:
+        # Videos uploaded before sized thumbnails existed: resize once and keep the result
+        try:
+            resize_thumbnail(os.path.join(folder, os.path.basename(video.thumbnail_path)), full_path, current_app.config['THUMBNAIL_SIZES'][size])
+        except Exception as e:
+            print(f"FFmpeg Error: {e}")
+            file_name = os.path.basename(video.thumbnail_path)
+            resized = False
+
+    if not os.path.exists(os.path.join(folder, file_name)):
+        abort(404)
+
+    if not resized:
+        # The full-size original stands in for now; revalidate so the sized image replaces it once it exists
+        response = send_from_directory(folder, file_name, mimetype='image/jpeg', max_age=0)
+        response.cache_control.no_cache = True
+        return response
+
+    response = send_from_directory(
+        folder, file_name,
+        mimetype='text/vtt' if size == 'vtt' else 'image/jpeg',
+        max_age=current_app.config['THUMBNAIL_CACHE_MAX_AGE']
+    )
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+@videos_bp.route('/videos/status/<int:video_id>')
+def get_video_status(video_id):
+    video = Video.query.get_or_404(video_id)
+    latest_job = video.jobs.order_by(VideoJob.id.desc()).first()
+    return {
+        'status': video.status,
+        'duration': video.duration,
+        'size_mb': video.size_mb,
+        'thumbnail_url': url_for('videos.video_thumbnail', video_id=video.id, size='card') if video.thumbnail_path else None,
+        'error': latest_job.error if latest_job and video.status == 'failed' else None
+    }
+
+# --- VIDEOS SECTION END ---
@@ -0,0 +1,129 @@
+"""Streaming export engine behind /export/<dataset> and /health/export."""
+
+import csv
+import io
+import json
+import struct
+import zlib
+from datetime import datetime, date
+
+from flask import Response, abort, stream_with_context, g
+from sqlalchemy import select
+
+from extensions import db
+from models import HealthRecord, Event, Goal, Challenge, UserChallenge
+
+# --- Streaming export engine ---
+# Exports are generated row by row from a streamed cursor, so the whole table
+# never sits in memory and the download starts before the query finishes.
+
+EXPORT_BATCH_SIZE = 500
+
+def export_datasets(profile):
+    """Maps each exportable dataset to its (column names, select statement)."""
+    user_id = profile.id if profile else None
+    return {
+        'health': (
+            ['date', 'weight_kg', 'body_fat_pct', 'notes'],
+            select(HealthRecord.date, HealthRecord.weight, HealthRecord.body_fat, HealthRecord.notes)
+            .filter(HealthRecord.user_id == user_id)
+            .order_by(HealthRecord.date.desc(), HealthRecord.id.desc())
+        ),
+        'goals': (
+            ['title', 'status', 'target_date', 'completed_date', 'current_progress', 'target_progress', 'progress_unit', 'notes'],
+            select(Goal.title, Goal.status, Goal.target_date, Goal.completed_date, Goal.current_progress,
+                   Goal.target_progress, Goal.progress_unit, Goal.notes)
+            .filter(Goal.user_id == user_id)
+            .order_by(Goal.target_date, Goal.id)
+        ),
+        'events': (
+            ['title', 'category', 'start_time', 'status'],
+            select(Event.title, Event.category, Event.start_time, Event.status)
+            .filter(Event.user_id == user_id)
+            .order_by(Event.start_time, Event.id)
+        ),
+        'challenges': (
+            ['title', 'level_requirement', 'xp_reward', 'status', 'started_at'],
+            select(Challenge.title, Challenge.level_requirement, Challenge.xp_reward, UserChallenge.status, UserChallenge.started_at)
+            .join(Challenge, UserChallenge.challenge_id == Challenge.id)
+            .filter(UserChallenge.user_id == user_id)
+            .order_by(Challenge.level_requirement, UserChallenge.id)
+        ),
+    }
+
+def export_value(value):
+    """Converts a column value into something csv/json can write."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def stream_export_rows(statement):
+    """Yields plain tuples from a server-side cursor, EXPORT_BATCH_SIZE rows at a time."""
+    result = db.session.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    for partition in result.partitions():
+        for row in partition:
+            yield tuple(export_value(value) for value in row)
+
+def export_csv(columns, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        # csv.writer handles quoting of commas, quotes and newlines in notes
+        writer.writerow(['' if value is None else value for value in row])
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def export_ndjson(columns, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row))) + '\n'
+
+def export_columnar(columns, rows):
+    """Compact columnar binary: a header, then zlib-compressed column groups.
+
+    Layout: b'CALXCOL1', a length-prefixed JSON header with the column names, then
+    one length-prefixed block per EXPORT_BATCH_SIZE rows holding
+    zlib(JSON {"rows": n, "columns": [[...], ...]}). A zero length ends the stream.
+    Lengths are 4-byte big-endian unsigned ints.
+    """
+    header = json.dumps({'columns': columns}).encode('utf-8')
+    yield b'CALXCOL1' + struct.pack('>I', len(header)) + header
+
+    def pack_group(group):
+        payload = json.dumps({'rows': len(group), 'columns': [list(values) for values in zip(*group)]})
+        block = zlib.compress(payload.encode('utf-8'))
+        return struct.pack('>I', len(block)) + block
+
+    group = []
+    for row in rows:
+        group.append(row)
+        if len(group) == EXPORT_BATCH_SIZE:
+            yield pack_group(group)
+            group = []
+    if group:
+        yield pack_group(group)
+    yield struct.pack('>I', 0)
+
+EXPORT_FORMATS = {
+    'csv': (export_csv, 'text/csv', 'csv'),
+    'ndjson': (export_ndjson, 'application/x-ndjson', 'ndjson'),
+    'columnar': (export_columnar, 'application/octet-stream', 'calxcol'),
+}
+
+def export_response(dataset, export_format):
+    """Builds a streamed download of one dataset in the requested format."""
+    datasets = export_datasets(g.user)
+    if dataset not in datasets or export_format not in EXPORT_FORMATS:
+        abort(404)
+
+    columns, statement = datasets[dataset]
+    writer, mimetype, extension = EXPORT_FORMATS[export_format]
+    file_name = f"{dataset}_data_{datetime.utcnow().strftime('%Y-%m-%d')}.{extension}"
+    return Response(
+        stream_with_context(writer(columns, stream_export_rows(statement))),
+        mimetype=mimetype,
+        headers={"Content-disposition": f"attachment; filename={file_name}"}
+    )
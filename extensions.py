@@ -0,0 +1,7 @@
+"""Flask extensions, created unbound and attached to each app in create_app()."""
+
+from flask_migrate import Migrate
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+migrate = Migrate()
@@ -0,0 +1,262 @@
+"""Vectorized trend analytics for the weight and body-fat history.
+
+Series are passed as NumPy arrays ordered by day: `days` holds day numbers
+(date.toordinal()) and `values` the measurements. Missing measurements are
+simply absent, so moving averages run over observations rather than calendar
+days.
+"""
+import math
+
+import numpy as np
+
+# Chunk length for the closed-form EMA. decay ** -EMA_CHUNK must stay finite,
+# which holds for every span >= 2 at this size.
+EMA_CHUNK = 128
+
+
+def ema(values, span):
+    """Exponential moving average (alpha = 2 / (span + 1)), seeded with the first value."""
+    values = np.asarray(values, dtype=float)
+    if span <= 1 or len(values) == 0:
+        return values.copy()
+
+    alpha = 2.0 / (span + 1)
+    decay = 1.0 - alpha
+    powers = decay ** np.arange(1, EMA_CHUNK + 1)
+    out = np.empty_like(values)
+    previous = values[0]
+    # Within a chunk, y_k = decay^k * (previous + alpha * sum_j x_j / decay^j)
+    for start in range(0, len(values), EMA_CHUNK):
+        chunk = values[start:start + EMA_CHUNK]
+        scale = powers[:len(chunk)]
+        out[start:start + len(chunk)] = scale * (previous + alpha * np.cumsum(chunk / scale))
+        previous = out[start + len(chunk) - 1]
+    return out
+
+
+def ema_step(previous, value, span):
+    """One EMA update, matching ema() for an appended value."""
+    if span <= 1:
+        return value
+    alpha = 2.0 / (span + 1)
+    return previous + alpha * (value - previous)
+
+
+def weekly_aggregates(days, values):
+    """Mean/min/max/count per Monday-based week. Returns a dict of equal-length arrays."""
+    days = np.asarray(days, dtype=np.int64)
+    values = np.asarray(values, dtype=float)
+    if len(days) == 0:
+        empty = np.array([], dtype=float)
+        return {'week_start': np.array([], dtype=np.int64), 'mean': empty, 'min': empty, 'max': empty, 'count': np.array([], dtype=np.int64)}
+
+    # Ordinal day 1 (0001-01-01) is a Monday
+    weeks = (days - 1) // 7
+    week_ids, starts, counts = np.unique(weeks, return_index=True, return_counts=True)
+    sums = np.add.reduceat(values, starts)
+    return {
+        'week_start': week_ids * 7 + 1,
+        'mean': sums / counts,
+        'min': np.minimum.reduceat(values, starts),
+        'max': np.maximum.reduceat(values, starts),
+        'count': counts,
+    }
+
+
+def linear_trend(days, values):
+    """Least-squares line through the series. Returns (slope per day, intercept at day 0) or None."""
+    days = np.asarray(days, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if len(days) < 2:
+        return None
+    origin = days[0]
+    x = days - origin
+    n = len(x)
+    sx, sy = x.sum(), values.sum()
+    denominator = n * np.dot(x, x) - sx * sx
+    if denominator == 0:
+        return None
+    slope = (n * np.dot(x, values) - sx * sy) / denominator
+    intercept = (sy - slope * sx) / n - slope * origin
+    return float(slope), float(intercept)
+
+
+def loess(days, values, frac=0.3, points=60, counts=None):
+    """Locally weighted linear regression (tricube kernel) evaluated on an even grid.
+
+    Fitting on at most `points` grid days keeps the work at points x len(days)
+    instead of len(days) squared. `counts` weights each observation, which lets
+    callers smooth weekly means instead of every daily value. Returns (grid
+    days, fitted values).
+    """
+    days = np.asarray(days, dtype=float)
+    values = np.asarray(values, dtype=float)
+    counts = np.ones_like(values) if counts is None else np.asarray(counts, dtype=float)
+    n = len(days)
+    if n < 3:
+        return days.copy(), values.copy()
+
+    grid = np.linspace(days[0], days[-1], min(points, n))
+    distances = np.abs(grid[:, None] - days[None, :])
+    k = max(3, int(math.ceil(frac * n)))
+    bandwidth = np.partition(distances, k - 1, axis=1)[:, k - 1]
+    bandwidth = np.where(bandwidth > 0, bandwidth, 1.0)
+    # Tricube kernel; plain products are much cheaper than float ** 3 here
+    u = np.minimum(distances / bandwidth[:, None], 1.0)
+    weights = 1 - u * u * u
+    weights = weights * weights * weights * counts
+
+    # Weighted linear fit around each grid point, centred on the grid day
+    x = days[None, :] - grid[:, None]
+    wx = weights * x
+    sw = weights.sum(axis=1)
+    swx = wx.sum(axis=1)
+    swy = weights @ values
+    swxx = (wx * x).sum(axis=1)
+    swxy = wx @ values
+    denominator = sw * swxx - swx * swx
+    safe = np.where(denominator != 0, denominator, 1.0)
+    fitted = np.where(denominator != 0, (swxx * swy - swx * swxy) / safe, swy / np.where(sw > 0, sw, 1.0))
+    return grid, fitted
+
+
+def project_target_day(days, values, target, window=90):
+    """Day number at which the recent linear trend reaches `target`, or None.
+
+    Only the last `window` days are fitted. Returns None when the trend is flat,
+    heads away from the target, or the target has already been passed.
+    """
+    days = np.asarray(days, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if len(days) < 2 or target is None:
+        return None
+    recent = days >= days[-1] - window
+    fit = linear_trend(days[recent], values[recent])
+    if fit is None or fit[0] == 0:
+        return None
+    slope, intercept = fit
+    current = slope * days[-1] + intercept
+    if (target - current) * slope <= 0:
+        return None
+    return int(math.ceil((target - intercept) / slope))
+
+
+class TrendState:
+    """Batch-computed trend data with an O(1) fast path for appended measurements.
+
+    Arrays live in buffers that double when full, and the moving averages and
+    regression sums are carried forward, so append() never revisits history.
+    """
+
+    def __init__(self, days, values, spans=(7, 30)):
+        days = np.asarray(days, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        self.spans = tuple(spans)
+        self.size = len(days)
+        capacity = max(16, self.size * 2)
+        self._days = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty(capacity, dtype=float)
+        self._days[:self.size] = days
+        self._values[:self.size] = values
+        self._emas = {}
+        for span in self.spans:
+            self._emas[span] = np.empty(capacity, dtype=float)
+            self._emas[span][:self.size] = ema(values, span)
+
+        # Regression sums use x relative to the first day to keep them well conditioned
+        self.origin = int(days[0]) if self.size else 0
+        x = (days - self.origin).astype(float)
+        self._n = self.size
+        self._sx = float(x.sum())
+        self._sy = float(values.sum())
+        self._sxx = float(np.dot(x, x))
+        self._sxy = float(np.dot(x, values))
+
+    @property
+    def days(self):
+        return self._days[:self.size]
+
+    @property
+    def values(self):
+        return self._values[:self.size]
+
+    def ema(self, span):
+        return self._emas[span][:self.size]
+
+    def can_append(self, day):
+        return self.size == 0 or day >= self._days[self.size - 1]
+
+    def append(self, day, value):
+        """Adds a measurement dated on or after the last one. Returns False if it is out of order."""
+        if not self.can_append(day):
+            return False
+        if self.size == 0:
+            self.origin = int(day)
+        if self.size == len(self._days):
+            self._grow()
+
+        index = self.size
+        self._days[index] = day
+        self._values[index] = value
+        for span in self.spans:
+            previous = self._emas[span][index - 1] if index else value
+            self._emas[span][index] = ema_step(previous, value, span)
+        self.size += 1
+
+        x = float(day - self.origin)
+        self._n += 1
+        self._sx += x
+        self._sy += value
+        self._sxx += x * x
+        self._sxy += x * value
+        return True
+
+    def _grow(self):
+        capacity = len(self._days) * 2
+        self._days = np.resize(self._days, capacity)
+        self._values = np.resize(self._values, capacity)
+        for span in self.spans:
+            self._emas[span] = np.resize(self._emas[span], capacity)
+
+    def linear_trend(self):
+        """(slope per day, intercept at day 0) from the running sums, or None."""
+        denominator = self._n * self._sxx - self._sx * self._sx
+        if self._n < 2 or denominator == 0:
+            return None
+        slope = (self._n * self._sxy - self._sx * self._sy) / denominator
+        intercept = (self._sy - slope * self._sx) / self._n - slope * self.origin
+        return float(slope), float(intercept)
+
+
+def lttb(xs, ys, threshold):
+    """Largest-triangle-three-buckets downsampling. Returns the indices of the kept points.
+
+    The first and last points are always kept. Between them, each bucket keeps
+    the point that forms the largest triangle with the previously kept point
+    and the mean of the next bucket.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    bounds = (np.floor(np.arange(threshold - 1) * every) + 1).astype(np.int64)
+    bounds[-1] = n - 1
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = bounds[bucket], bounds[bucket + 1]
+        # Mean of the following bucket (the last point for the final bucket)
+        next_end = bounds[bucket + 2] if bucket + 2 < len(bounds) else n
+        average_x = xs[end:next_end].mean()
+        average_y = ys[end:next_end].mean()
+        areas = np.abs(
+            (xs[previous] - average_x) * (ys[start:end] - ys[previous])
+            - (xs[previous] - xs[start:end]) * (average_y - ys[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+    return kept
@@ -0,0 +1,84 @@
+"""Small helpers shared by several blueprints."""
+
+import base64
+import json
+from datetime import datetime
+
+from flask import render_template, request, url_for
+from sqlalchemy import and_, or_, literal
+
+# --- Helper function to format seconds into MM:SS or HH:MM:SS ---
+def format_duration(seconds):
+    seconds = int(seconds)
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    seconds = seconds % 60
+    if hours > 0:
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+    else:
+        return f"{minutes:02}:{seconds:02}"
+
+# --- Keyset (cursor) pagination helpers ---
+# Pages continue from the sort key of the last row shown instead of using
+# OFFSET, so deep pages cost the same as the first one.
+
+def encode_cursor(values):
+    """Packs the sort-key values of the last row on a page into an opaque token."""
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor, columns):
+    """Unpacks a cursor token for the given columns; returns None if it is missing or invalid."""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if len(values) != len(columns):
+            return None
+        return [datetime.fromisoformat(v) if col.type.python_type is datetime else col.type.python_type(v)
+                for col, v in zip(columns, values)]
+    except (ValueError, TypeError):
+        return None
+
+def keyset_page(query, columns, cursor, page_size):
+    """Returns (items, next_cursor) for the page after `cursor`, ordering by `columns` descending.
+
+    The last column must be unique (normally the primary key) so the order is total.
+    """
+    query = query.order_by(*[col.desc() for col in columns])
+    values = decode_cursor(cursor, columns)
+    if values:
+        # (a, b) < (va, vb)  ->  a < va OR (a = va AND b < vb)
+        values = [literal(value, col.type) for col, value in zip(columns, values)]
+        query = query.filter(or_(*[
+            and_(*[col == value for col, value in zip(columns[:i], values[:i])], columns[i] < values[i])
+            for i in range(len(columns))
+        ]))
+
+    items = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = encode_cursor([getattr(items[-1], col.key) for col in columns])
+    return items, next_cursor
+
+def paginated_cards_json(template_name, item_name, items, next_cursor, category_filter):
+    """JSON variant of a paginated card grid, used for infinite scroll."""
+    return {
+        'html': ''.join(render_template(template_name, **{item_name: item}) for item in items),
+        'next_cursor': next_cursor,
+        'next_url': url_for(request.endpoint, category=category_filter, cursor=next_cursor, format='json') if next_cursor else None,
+        'next_page_url': url_for(request.endpoint, category=category_filter, cursor=next_cursor) if next_cursor else None
+    }
+
+# --- Date helpers ---
+
+def is_supported_month(year, month):
+    """True if month_window() can represent the month: December 9999 would end past datetime.max."""
+    return 1 <= month <= 12 and 1 <= year and (year, month) <= (9999, 11)
+
+def month_window(year, month):
+    """Returns the [start, end) datetimes of a calendar month, usable as a sargable range."""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
@@ -0,0 +1,84 @@
+"""In-memory ranked index of athletes for the global leaderboard.
+
+Athletes are ordered by level, then XP (both highest first), then id, so every
+athlete has a distinct position. The ordering keys live in a sorted list: an
+athlete's rank is a bisect, and moving an athlete after an XP change is a
+bisect plus one list delete and insert, instead of an ORDER BY over
+user_profile for every view.
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+
+
+def rank_key(user_id, level, xp):
+    return (-level, -xp, user_id)
+
+
+class RankedIndex:
+    """Sorted (level, XP) ranking of athletes. Safe to share between threads."""
+
+    def __init__(self, rows=()):
+        self.lock = threading.Lock()
+        self.keys = []
+        self.by_user = {}
+        self.loaded_at = None
+        if rows:
+            self.load(rows)
+
+    def load(self, rows):
+        """Replaces the contents with (user_id, level, xp) rows."""
+        by_user = {user_id: rank_key(user_id, level, xp) for user_id, level, xp in rows}
+        keys = sorted(by_user.values())
+        with self.lock:
+            self.by_user, self.keys = by_user, keys
+            self.loaded_at = time.monotonic()
+
+    def age(self):
+        """Seconds since the last load, or None if never loaded."""
+        return None if self.loaded_at is None else time.monotonic() - self.loaded_at
+
+    def update(self, user_id, level, xp):
+        """Adds an athlete or moves them to their new position."""
+        key = rank_key(user_id, level, xp)
+        with self.lock:
+            old = self.by_user.get(user_id)
+            if old == key:
+                return
+            if old is not None:
+                del self.keys[bisect_left(self.keys, old)]
+            insort(self.keys, key)
+            self.by_user[user_id] = key
+
+    def remove(self, user_id):
+        with self.lock:
+            old = self.by_user.pop(user_id, None)
+            if old is not None:
+                del self.keys[bisect_left(self.keys, old)]
+
+    def rank(self, user_id):
+        """1-based position of the athlete, or None if they are not ranked."""
+        with self.lock:
+            key = self.by_user.get(user_id)
+            return None if key is None else bisect_left(self.keys, key) + 1
+
+    def top(self, count):
+        """[(rank, user_id, level, xp)] for the first `count` athletes."""
+        with self.lock:
+            return self._entries(0, count)
+
+    def around(self, user_id, radius):
+        """[(rank, user_id, level, xp)] for the athlete and up to `radius` neighbours on each side."""
+        with self.lock:
+            key = self.by_user.get(user_id)
+            if key is None:
+                return []
+            position = bisect_left(self.keys, key)
+            return self._entries(max(0, position - radius), position + radius + 1)
+
+    def _entries(self, start, stop):
+        return [(start + offset + 1, user_id, -level, -xp)
+                for offset, (level, xp, user_id) in enumerate(self.keys[start:stop])]
+
+    def __len__(self):
+        return len(self.keys)
@@ -0,0 +1,31 @@
+"""unique user badge per athlete
+
+Revision ID: 2331ab157261
+Revises: 55c303f812bf
+Create Date: 2026-10-18 09:13:53.161957
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2331ab157261'
+down_revision = '55c303f812bf'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Racing requests could award a badge twice; keep the earliest award of each
+    op.execute(
+        "DELETE FROM user_badge WHERE id NOT IN "
+        "(SELECT MIN(id) FROM user_badge GROUP BY user_id, badge_id)"
+    )
+
+    with op.batch_alter_table('user_badge', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_user_badge_user_id_badge_id', ['user_id', 'badge_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('user_badge', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_user_badge_user_id_badge_id', type_='unique')
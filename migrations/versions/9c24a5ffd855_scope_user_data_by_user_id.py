@@ -0,0 +1,84 @@
+"""scope user data by user_id
+
+Revision ID: 9c24a5ffd855
+Revises: faeaf718faa6
+Create Date: 2026-10-18 08:56:04.282252
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c24a5ffd855'
+down_revision = 'faeaf718faa6'
+branch_labels = None
+depends_on = None
+
+# (table, indexes dropped, indexes created) for each table that gains user_id
+TENANT_TABLES = [
+    ('event',
+     [('ix_event_start_time_category_status', ['start_time', 'category', 'status'])],
+     [('ix_event_user_id_start_time_category_status', ['user_id', 'start_time', 'category', 'status'])]),
+    ('health_plan_item', [], [('ix_health_plan_item_user_id', ['user_id'])]),
+    ('health_record',
+     [('ix_health_record_date', ['date'])],
+     [('ix_health_record_user_id_date', ['user_id', 'date'])]),
+    ('schedule_item',
+     [('ix_schedule_item_category', ['category']), ('ix_schedule_item_status', ['status'])],
+     [('ix_schedule_item_user_id_category', ['user_id', 'category']), ('ix_schedule_item_user_id_status', ['user_id', 'status'])]),
+    ('sticky_note', [], [('ix_sticky_note_user_id', ['user_id'])]),
+    ('training_plan',
+     [('ix_training_plan_end_date_start_date', ['end_date', 'start_date'])],
+     [('ix_training_plan_user_id_end_date_start_date', ['user_id', 'end_date', 'start_date'])]),
+    ('workout', [], []),
+    ('health_summary', [], []),
+]
+
+
+def workout_name_unique():
+    """Name of the original unnamed UNIQUE(name) on workout, plus the batch naming convention to find it."""
+    if op.get_bind().dialect.name == 'sqlite':
+        return 'uq_workout_name', {'uq': 'uq_%(table_name)s_%(column_0_name)s'}
+    return 'workout_name_key', {}
+
+
+def upgrade():
+    for table, old_indexes, new_indexes in TENANT_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('user_id', sa.Integer(), nullable=True))
+            for name, _ in old_indexes:
+                batch_op.drop_index(name)
+            for name, columns in new_indexes:
+                batch_op.create_index(name, columns, unique=False)
+            batch_op.create_foreign_key(f'fk_{table}_user_id_user_profile', 'user_profile', ['user_id'], ['id'])
+
+        # Existing rows belong to the first (until now, only) athlete
+        op.execute(f"UPDATE {table} SET user_id = (SELECT MIN(id) FROM user_profile) WHERE user_id IS NULL")
+
+    # Workout names become unique per athlete instead of globally
+    old_unique, naming_convention = workout_name_unique()
+    with op.batch_alter_table('workout', schema=None, naming_convention=naming_convention) as batch_op:
+        batch_op.drop_constraint(old_unique, type_='unique')
+        batch_op.create_unique_constraint('uq_workout_user_id_name', ['user_id', 'name'])
+
+    with op.batch_alter_table('health_summary', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_health_summary_user_id', ['user_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('health_summary', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_health_summary_user_id', type_='unique')
+
+    with op.batch_alter_table('workout', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_workout_user_id_name', type_='unique')
+        batch_op.create_unique_constraint('uq_workout_name', ['name'])
+
+    for table, old_indexes, new_indexes in reversed(TENANT_TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(f'fk_{table}_user_id_user_profile', type_='foreignkey')
+            for name, _ in new_indexes:
+                batch_op.drop_index(name)
+            for name, columns in old_indexes:
+                batch_op.create_index(name, columns, unique=False)
+            batch_op.drop_column('user_id')
@@ -0,0 +1,26 @@
+"""add athlete password hash
+
+Revision ID: a74eb19c1e7b
+Revises: 2331ab157261
+Create Date: 2026-10-18 09:26:09.163462
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a74eb19c1e7b'
+down_revision = '2331ab157261'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user_profile', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('password_hash', sa.String(length=255), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('user_profile', schema=None) as batch_op:
+        batch_op.drop_column('password_hash')
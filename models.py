@@ -0,0 +1,487 @@
+"""Database models. Every model lives here so Alembic and the blueprints share one set."""
+
+import uuid
+from datetime import datetime
+
+from flask import g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, declared_attr, with_loader_criteria
+
+from extensions import db
+
+# --- Tenant scoping ---
+# Models mixing in UserOwned hold one athlete's rows in a user_id column. During a
+# request every ORM SELECT/UPDATE/DELETE touching them is limited to g.user (see
+# scope_queries_to_current_user below), so routes never see another athlete's data.
+# CLI commands and background jobs run outside a request and are not filtered, and
+# neither are statements run with the `all_users` execution option, for writes that
+# name their athletes explicitly (e.g. linking challenges for a newly created athlete).
+
+class UserOwned:
+    @declared_attr
+    def user_id(cls):
+        return db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+
+@event.listens_for(Session, 'do_orm_execute')
+def scope_queries_to_current_user(execute_state):
+    """Adds `user_id = g.user.id` to every ORM statement on a UserOwned model during a request."""
+    if execute_state.is_column_load or not has_request_context() or g.get('user') is None:
+        return
+    if not (execute_state.is_select or execute_state.is_update or execute_state.is_delete):
+        return
+    if execute_state.execution_options.get('all_users'):
+        return
+    user_id = g.user.id
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(UserOwned, lambda cls: cls.user_id == user_id, include_aliases=True)
+    )
+
+# --- UserProfile MODEL ---
+class UserProfile(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    height = db.Column(db.Float, nullable=True)  # in cm
+    age = db.Column(db.Integer, nullable=True)
+    gender = db.Column(db.String(50), nullable=True)
+    level = db.Column(db.Integer, nullable=False, default=1)
+    experience_points = db.Column(db.Integer, nullable=False, default=0)
+    name = db.Column(db.String(100), nullable=True)
+    api_token_hash = db.Column(db.String(64), nullable=True) # sha256 of the bearer token
+    password_hash = db.Column(db.String(255), nullable=True) # set at sign-up or with `flask set-password`
+
+    # Relationship to access challenges created by this user
+    created_challenges = db.relationship('Challenge', backref='creator', lazy='dynamic')
+    goals = db.relationship('Goal', backref='user', lazy='dynamic')
+    motivation_items = db.relationship('MotivationItem', backref='user', lazy='dynamic')
+    videos = db.relationship('Video', backref='user', lazy='dynamic')
+
+    __table_args__ = (
+        db.UniqueConstraint('api_token_hash', name='uq_user_profile_api_token_hash'),
+        # Sign-in and sign-up look athletes up by name
+        db.Index('ix_user_profile_name', 'name'),
+    )
+
+    def __repr__(self):
+        return f'<UserProfile {self.id}>'
+
+# --- Define HealthRecord Model ---
+class HealthRecord(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    date = db.Column(db.Date, nullable=False, default=datetime.utcnow)
+    weight = db.Column(db.Float, nullable=True) # in kg
+    body_fat = db.Column(db.Float, nullable=True) # as percentage
+    notes = db.Column(db.Text, nullable=True)
+
+    __table_args__ = (db.Index('ix_health_record_user_id_date', 'user_id', 'date'),)
+
+    def __repr__(self):
+        return f'<HealthRecord {self.date}>'
+
+# --- Define HealthSummary Model (precomputed /health stats, one row per athlete) ---
+class HealthSummary(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    record_count = db.Column(db.Integer, nullable=False, default=0)
+    latest_record_id = db.Column(db.Integer, nullable=True)
+    latest_date = db.Column(db.Date, nullable=True)
+    latest_weight = db.Column(db.Float, nullable=True)
+    latest_body_fat = db.Column(db.Float, nullable=True)
+    avg_weight_7d = db.Column(db.Float, nullable=True) # averages over the days up to latest_date
+    avg_weight_30d = db.Column(db.Float, nullable=True)
+    bmi = db.Column(db.Float, nullable=True)
+    chart_series = db.Column(db.Text, nullable=False, default='[]') # JSON [[iso date, weight, record id], ...]
+    # Bumped by every change other than adding a new latest record; trend caches rebuild when it moves
+    history_revision = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (db.UniqueConstraint('user_id', name='uq_health_summary_user_id'),)
+
+    def __repr__(self):
+        return f'<HealthSummary {self.latest_date}: {self.record_count} records>'
+
+class Workout(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    difficulty = db.Column(db.String(50), nullable=False)
+    sets = db.Column(db.Integer, nullable=False)
+    reps = db.Column(db.String(50), nullable=False) # String to handle "12/Leg"
+    rest = db.Column(db.String(50), nullable=False)
+    instructions = db.Column(db.Text, nullable=False)
+
+    # Workout names are unique per athlete
+    __table_args__ = (db.UniqueConstraint('user_id', 'name', name='uq_workout_user_id_name'),)
+
+    def __repr__(self):
+        return f'<Workout {self.name}>'
+
+# --- Define Event Model ---
+class Event(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(150), nullable=False)
+    category = db.Column(db.String(50), nullable=False) # e.g., 'workout', 'rest'
+    start_time = db.Column(db.DateTime, nullable=False)
+    status = db.Column(db.String(50), nullable=False, default='scheduled') # New column
+
+    __table_args__ = (db.Index('ix_event_user_id_start_time_category_status', 'user_id', 'start_time', 'category', 'status'),)
+
+    def __repr__(self):
+        return f'<Event {self.title}>'
+
+# --- Define ScheduleItem Model ---
+class ScheduleItem(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(150), nullable=False)
+    details = db.Column(db.Text, nullable=True)
+    day_of_week = db.Column(db.String(20), nullable=False) # e.g., 'Monday', 'Tuesday'
+    time = db.Column(db.Time, nullable=False)
+    category = db.Column(db.String(50), nullable=False) # e.g., 'workout', 'rest'
+    status = db.Column(db.String(50), nullable=False, default='scheduled')
+
+    __table_args__ = (
+        db.Index('ix_schedule_item_user_id_status', 'user_id', 'status'),
+        db.Index('ix_schedule_item_user_id_category', 'user_id', 'category'),
+    )
+
+    def __repr__(self):
+        return f'<ScheduleItem {self.title}>'
+
+# --- Define TrainingPlan Model ---
+class TrainingPlan(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(150), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    start_date = db.Column(db.Date, nullable=False)
+    end_date = db.Column(db.Date, nullable=False)
+    status = db.Column(db.String(50), nullable=False, default='upcoming') # upcoming, pending, completed
+
+    # Interval index for overlap lookups: plans that ended before a window are
+    # skipped by the index, so old history does not slow down the plan calendar
+    __table_args__ = (db.Index('ix_training_plan_user_id_end_date_start_date', 'user_id', 'end_date', 'start_date'),)
+
+    def __repr__(self):
+        return f'<TrainingPlan {self.title}>'
+
+# --- Define StickyNote Model ---
+class StickyNote(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    color = db.Column(db.String(20), nullable=False, default='yellow')
+
+    __table_args__ = (db.Index('ix_sticky_note_user_id', 'user_id'),)
+
+    def __repr__(self):
+        return f'<StickyNote {self.title}>'
+
+# --- Define HealthPlanItem Model ---
+class HealthPlanItem(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    status = db.Column(db.String(50), nullable=False, default='pending') # 'pending' or 'completed'
+
+    __table_args__ = (db.Index('ix_health_plan_item_user_id', 'user_id'),)
+
+    def __repr__(self):
+        return f'<HealthPlanItem {self.title}>'
+
+# --- NEW GOAL MODELS START HERE ---
+
+class Goal(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    status = db.Column(db.String(50), nullable=False, default='pending') # 'pending', 'in_progress', 'completed'
+    target_date = db.Column(db.Date, nullable=False)
+    completed_date = db.Column(db.DateTime, nullable=True)
+    
+    current_progress = db.Column(db.Float, nullable=False, default=0)
+    target_progress = db.Column(db.Float, nullable=False, default=100)
+    progress_unit = db.Column(db.String(50), nullable=True) # e.g., 'reps', 'seconds', '%'
+
+    notes = db.Column(db.Text, nullable=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+
+    media = db.relationship('GoalMedia', backref='goal', lazy='dynamic', cascade="all, delete-orphan")
+
+    __table_args__ = (
+        db.Index('ix_goal_user_id_status', 'user_id', 'status'),
+        db.Index('ix_goal_user_id_target_date', 'user_id', 'target_date'),
+    )
+
+    def __repr__(self):
+        return f'<Goal {self.title}>'
+
+class GoalMedia(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    goal_id = db.Column(db.Integer, db.ForeignKey('goal.id'), nullable=False)
+    file_path = db.Column(db.String(300), nullable=False)
+    media_type = db.Column(db.String(50), nullable=False) # 'image' or 'video'
+    upload_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    # For the Before/After gallery feature
+    is_before_photo = db.Column(db.Boolean, default=False)
+    is_after_photo = db.Column(db.Boolean, default=False)
+
+    __table_args__ = (
+        # The before/after gallery on /goals
+        db.Index('ix_goal_media_goal_id_is_before_photo', 'goal_id', 'is_before_photo'),
+        db.Index('ix_goal_media_goal_id_is_after_photo', 'goal_id', 'is_after_photo'),
+    )
+
+    def __repr__(self):
+        return f'<GoalMedia {self.file_path} for Goal {self.goal_id}>'
+
+class MotivationItem(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    category = db.Column(db.String(50), nullable=False) # 'video', 'book', 'quote', etc.
+    author = db.Column(db.String(150), nullable=True)
+    source_url = db.Column(db.String(500), nullable=True)
+    cover_image_path = db.Column(db.String(300), nullable=True)
+    is_favorite = db.Column(db.Boolean, default=False, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_motivation_item_user_id_category_is_favorite', 'user_id', 'category', 'is_favorite'),
+        db.Index('ix_motivation_item_user_id_is_favorite', 'user_id', 'is_favorite'),
+    )
+
+    def __repr__(self):
+        return f'<MotivationItem {self.title}>'
+
+# --- Define Challenge Model ---
+class Challenge(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    level_requirement = db.Column(db.Integer, nullable=False, default=1)
+    xp_reward = db.Column(db.Integer, nullable=False, default=50)
+    task_details = db.Column(db.String(300), nullable=False)
+    time_limit = db.Column(db.String(50), nullable=True)
+    is_user_created = db.Column(db.Boolean, default=False, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+    
+    # New columns for milestone/badge system
+    is_milestone_challenge = db.Column(db.Boolean, default=False, nullable=False)
+    awards_badge_id = db.Column(db.Integer, db.ForeignKey('badge.id'), nullable=True)
+    
+    badge_to_award = db.relationship('Badge')
+
+    def __repr__(self):
+        return f'<Challenge {self.title}>'
+
+# --- Define UserChallenge (Association) Model ---
+class UserChallenge(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=False)
+    challenge_id = db.Column(db.Integer, db.ForeignKey('challenge.id'), nullable=False)
+    status = db.Column(db.String(50), nullable=False, default='locked') # locked, unlocked, active, completed
+    started_at = db.Column(db.DateTime, nullable=True) # New column
+
+    user = db.relationship('UserProfile', backref=db.backref('challenges', lazy='dynamic'))
+    challenge = db.relationship('Challenge', backref=db.backref('user_links', lazy='dynamic'))
+
+    __table_args__ = (db.Index('ix_user_challenge_user_id_status', 'user_id', 'status'),)
+
+    def __repr__(self):
+        return f'<UserChallenge User {self.user_id} - Challenge {self.challenge_id}: {self.status}>'
+
+# --- Define Badge Model ---
+class Badge(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False)
+    description = db.Column(db.String(255), nullable=False)
+    icon = db.Column(db.String(50), nullable=False, default='fa-shield-alt') # e.g., fa-shield-alt, fa-trophy
+    color = db.Column(db.String(50), nullable=False, default='#c0c0c0') # e.g., Hex color code
+    challenges_required = db.Column(db.Integer, nullable=False, default=1)
+
+    def __repr__(self):
+        return f'<Badge {self.name}>'
+
+# --- Define UserBadge (Association) Model ---
+class UserBadge(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=False)
+    badge_id = db.Column(db.Integer, db.ForeignKey('badge.id'), nullable=False)
+    date_earned = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    user = db.relationship('UserProfile', backref=db.backref('earned_badges', lazy='dynamic'))
+    badge = db.relationship('Badge')
+
+    __table_args__ = (db.UniqueConstraint('user_id', 'badge_id', name='uq_user_badge_user_id_badge_id'),)
+
+    def __repr__(self):
+        return f'<UserBadge User {self.user_id} earned {self.badge.name}>'
+
+# --- Define Tournament Models (single-elimination brackets) ---
+class Tournament(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    required_level = db.Column(db.Integer, nullable=False, default=1)
+    status = db.Column(db.String(20), nullable=False, default='registration') # registration, in_progress, completed
+    rounds = db.Column(db.Integer, nullable=True) # set when the bracket is generated
+    created_by = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=False)
+    winner_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    creator = db.relationship('UserProfile', foreign_keys=[created_by])
+    winner = db.relationship('UserProfile', foreign_keys=[winner_id])
+    entries = db.relationship('TournamentEntry', backref='tournament', lazy='dynamic', cascade='all, delete-orphan')
+    matches = db.relationship('Match', backref='tournament', lazy='dynamic', cascade='all, delete-orphan')
+
+    __table_args__ = (db.Index('ix_tournament_status_created_at', 'status', 'created_at'),)
+
+    def __repr__(self):
+        return f'<Tournament {self.name}: {self.status}>'
+
+class TournamentEntry(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=False)
+    seed = db.Column(db.Integer, nullable=True) # 1 = strongest, set when the bracket is generated
+    joined_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    user = db.relationship('UserProfile')
+
+    __table_args__ = (
+        db.UniqueConstraint('tournament_id', 'user_id', name='uq_tournament_entry_tournament_id_user_id'),
+        db.Index('ix_tournament_entry_user_id', 'user_id'),
+    )
+
+    def __repr__(self):
+        return f'<TournamentEntry Tournament {self.tournament_id} - User {self.user_id}>'
+
+class Match(db.Model):
+    __tablename__ = 'tournament_match'
+
+    id = db.Column(db.Integer, primary_key=True)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id'), nullable=False)
+    round = db.Column(db.Integer, nullable=False) # 1 = first round
+    position = db.Column(db.Integer, nullable=False) # 0-based slot within the round
+    player1_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+    player2_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+    winner_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+    status = db.Column(db.String(20), nullable=False, default='pending') # pending, completed, bye
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    player1 = db.relationship('UserProfile', foreign_keys=[player1_id])
+    player2 = db.relationship('UserProfile', foreign_keys=[player2_id])
+
+    __table_args__ = (db.UniqueConstraint('tournament_id', 'round', 'position', name='uq_tournament_match_tournament_id_round_position'),)
+
+    def __repr__(self):
+        return f'<Match Tournament {self.tournament_id} R{self.round}#{self.position}: {self.status}>'
+
+# --- Define TournamentStats Model (per-athlete counters, updated as results come in) ---
+class TournamentStats(db.Model):
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), primary_key=True)
+    tournaments_entered = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    tournaments_won = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    matches_played = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    match_wins = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    current_streak = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    best_streak = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    def __repr__(self):
+        return f'<TournamentStats User {self.user_id}: {self.match_wins}/{self.matches_played}>'
+
+# --- REPLACE THE Video MODEL WITH THIS UPDATED VERSION ---
+
+# --- REPLACE THE Video MODEL WITH THIS UPDATED VERSION ---
+class Video(UserOwned, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    category = db.Column(db.String(50), nullable=False)
+    
+    file_path = db.Column(db.String(300), nullable=False)
+    thumbnail_path = db.Column(db.String(300), nullable=True)
+    duration = db.Column(db.String(20), nullable=True) # e.g., "12:45"
+    size_mb = db.Column(db.Float, nullable=True) # To store file size in MB
+    
+    upload_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    views = db.Column(db.Integer, default=0)
+    likes = db.Column(db.Integer, default=0)
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=True)
+    status = db.Column(db.String(20), nullable=False, default='ready') # processing, ready, failed
+    width = db.Column(db.Integer, nullable=True)
+    height = db.Column(db.Integer, nullable=True)
+
+    jobs = db.relationship('VideoJob', backref='video', lazy='dynamic', cascade="all, delete-orphan")
+    renditions = db.relationship('VideoRendition', backref='video', lazy='dynamic', cascade="all, delete-orphan")
+
+    __table_args__ = (
+        db.Index('ix_video_user_id_category_upload_date', 'user_id', 'category', 'upload_date'),
+        db.Index('ix_video_user_id_upload_date', 'user_id', 'upload_date'),
+    )
+
+    def __repr__(self):
+        return f'<Video {self.title}>'    
+
+# --- Define VideoJob Model (background probe/thumbnail jobs) ---
+class VideoJob(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    video_id = db.Column(db.Integer, db.ForeignKey('video.id'), nullable=False)
+    kind = db.Column(db.String(20), nullable=False, default='probe') # probe, hls
+    status = db.Column(db.String(20), nullable=False, default='queued') # queued, completed, failed
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<VideoJob {self.id} for Video {self.video_id}: {self.status}>'
+
+# --- Define UploadSession Model (resumable chunked video uploads) ---
+class UploadSession(UserOwned, db.Model):
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    user_id = db.Column(db.Integer, db.ForeignKey('user_profile.id'), nullable=False)
+    title = db.Column(db.String(200), nullable=False)
+    category = db.Column(db.String(50), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    file_name = db.Column(db.String(300), nullable=False) # unique name inside the video upload folder
+    total_size = db.Column(db.BigInteger, nullable=False)
+    chunk_size = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='open') # open, completed
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    video_id = db.Column(db.Integer, db.ForeignKey('video.id'), nullable=True)
+
+    chunks = db.relationship('UploadChunk', backref='session', lazy='dynamic', cascade="all, delete-orphan")
+
+    @property
+    def total_chunks(self):
+        return max(1, -(-self.total_size // self.chunk_size))
+
+    def expected_chunk_size(self, index):
+        if index == self.total_chunks - 1:
+            return self.total_size - index * self.chunk_size
+        return self.chunk_size
+
+    def __repr__(self):
+        return f'<UploadSession {self.id}: {self.status}>'
+
+class UploadChunk(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    session_id = db.Column(db.String(32), db.ForeignKey('upload_session.id'), nullable=False)
+    index = db.Column(db.Integer, nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    sha256 = db.Column(db.String(64), nullable=False)
+
+    __table_args__ = (db.UniqueConstraint('session_id', 'index'),)
+
+    def __repr__(self):
+        return f'<UploadChunk {self.index} of {self.session_id}>'
+
+# --- Define VideoRendition Model (HLS ladder entries) ---
+class VideoRendition(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    video_id = db.Column(db.Integer, db.ForeignKey('video.id'), nullable=False)
+    name = db.Column(db.String(20), nullable=False) # e.g., '720p'
+    width = db.Column(db.Integer, nullable=False)
+    height = db.Column(db.Integer, nullable=False)
+    bandwidth = db.Column(db.Integer, nullable=False) # bits per second, as advertised in the master playlist
+    playlist_path = db.Column(db.String(300), nullable=False)
+
+    def __repr__(self):
+        return f'<VideoRendition {self.name} for Video {self.video_id}>'
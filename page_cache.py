@@ -0,0 +1,181 @@
+"""Per-athlete cache of rendered pages, invalidated when their models are committed."""
+
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from datetime import date
+
+from flask import current_app, request, g, session, has_request_context, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models import UserOwned, UserProfile, Workout, ScheduleItem, StickyNote, MotivationItem, Challenge, UserChallenge, Badge, UserBadge, Tournament, TournamentEntry, Match, TournamentStats
+
+# --- Page cache ---
+# GET pages whose data only changes through this app's own writes are cached as
+# rendered HTML, per athlete and section. Every key embeds generation counters for
+# (section, athlete), (section, everyone), (all sections, athlete) and (all, all).
+# Committing a change to a model listed in PAGE_CACHE_SECTIONS bumps the matching
+# counters, so stale entries are never read again and simply age out. The
+# in-process LRU only sees writes made by its own worker; set PAGE_CACHE_URL to a
+# Redis-compatible server to share entries and counters between workers.
+
+class LRUPageCache:
+    """Bounded in-process cache. Counters are kept apart so eviction never resets them."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_counters(self, names):
+        with self.lock:
+            return [self.counters.get(name, 0) for name in names]
+
+    def incr(self, names):
+        with self.lock:
+            for name in names:
+                self.counters[name] = self.counters.get(name, 0) + 1
+
+class RedisPageCache:
+    """Entries and counters kept in a Redis-compatible server shared by all workers."""
+
+    def __init__(self, url, ttl):
+        import redis # optional; only needed when PAGE_CACHE_URL is set
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def get(self, key):
+        value = self.client.get(key)
+        return value.decode('utf-8') if value is not None else None
+
+    def set(self, key, value):
+        self.client.set(key, value.encode('utf-8'), ex=self.ttl)
+
+    def get_counters(self, names):
+        return [int(value or 0) for value in self.client.mget(names)]
+
+    def incr(self, names):
+        pipeline = self.client.pipeline(transaction=False)
+        for name in names:
+            pipeline.incr(name)
+        pipeline.execute()
+
+def create_page_cache(config):
+    if config['PAGE_CACHE_URL']:
+        return RedisPageCache(config['PAGE_CACHE_URL'], config['PAGE_CACHE_TTL'])
+    return LRUPageCache(config['PAGE_CACHE_SIZE'])
+
+# Cached sections each model's rows appear on. '*' means every section.
+PAGE_CACHE_SECTIONS = {
+    Workout: ('workouts',),
+    ScheduleItem: ('schedule',),
+    StickyNote: ('schedule',),
+    MotivationItem: ('motivation',),
+    Challenge: ('tournament',),
+    UserChallenge: ('tournament',),
+    Badge: ('tournament',),
+    UserBadge: ('tournament',),
+    Tournament: ('tournament',),
+    TournamentEntry: ('tournament',),
+    Match: ('tournament',),
+    TournamentStats: ('tournament',),
+    # Name, level and XP show up in the sidebar and the tournament header
+    UserProfile: ('*',),
+}
+
+# Sections that also show other athletes' rows, so a change invalidates them for everyone
+PAGE_CACHE_SHARED_SECTIONS = {
+    # The global rank and leaderboard on /tournament
+    UserProfile: ('tournament',),
+}
+
+def page_cache_counter(section, owner):
+    return f"page-gen:{section}:{owner}"
+
+def page_cache_changes(model, instance=None, owner=None):
+    """(section, owner) pairs touched by a change to `instance`, or to unknown rows of `model`.
+
+    Bulk statements can name the athlete whose rows they change with the
+    `page_cache_owner` execution option; otherwise every athlete's pages are hit.
+    """
+    sections = PAGE_CACHE_SECTIONS.get(model, ())
+    if instance is None:
+        if owner is None:
+            owner = g.user.id if has_request_context() and g.get('user') and issubclass(model, UserOwned) else '*'
+    elif isinstance(instance, UserProfile):
+        owner = instance.id
+    elif isinstance(instance, UserOwned):
+        owner = instance.user_id
+    else:
+        owner = '*'
+    shared = PAGE_CACHE_SHARED_SECTIONS.get(model, ())
+    return {(section, owner) for section in sections} | {(section, '*') for section in shared}
+
+@event.listens_for(Session, 'after_flush')
+def collect_page_cache_changes(session, flush_context):
+    pending = session.info.setdefault('page_cache_changes', set())
+    for instance in itertools.chain(session.new, session.dirty, session.deleted):
+        pending |= page_cache_changes(type(instance), instance)
+
+@event.listens_for(Session, 'do_orm_execute')
+def collect_bulk_page_cache_changes(execute_state):
+    """ORM bulk INSERT/UPDATE/DELETE statements bypass the flush, so record them here."""
+    if not (execute_state.is_insert or execute_state.is_update or execute_state.is_delete) or execute_state.bind_mapper is None:
+        return
+    pending = execute_state.session.info.setdefault('page_cache_changes', set())
+    pending |= page_cache_changes(execute_state.bind_mapper.class_, owner=execute_state.execution_options.get('page_cache_owner'))
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_page_cache(session):
+    changes = session.info.pop('page_cache_changes', None)
+    if changes and has_app_context() and 'page_cache' in current_app.extensions:
+        current_app.extensions['page_cache'].incr([page_cache_counter(section, owner) for section, owner in changes])
+
+@event.listens_for(Session, 'after_rollback')
+def discard_page_cache_changes(session):
+    session.info.pop('page_cache_changes', None)
+
+def cached_page(section):
+    """Serves a GET view's rendered HTML from the page cache.
+
+    Requests with pending flash messages bypass the cache, and a response is only
+    stored if rendering it left the session untouched (no flash consumed or added).
+    Non-HTML results such as JSON pages pass through uncached.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if '_flashes' in session:
+                return view(*args, **kwargs)
+
+            cache = current_app.extensions['page_cache']
+            owner = g.user.id
+            counters = cache.get_counters([page_cache_counter(s, o) for s in (section, '*') for o in (owner, '*')])
+            key = f"page:{section}:{owner}:{'.'.join(map(str, counters))}:{date.today().isoformat()}:{request.full_path}"
+            body = cache.get(key)
+            if body is not None:
+                return body, {'X-Page-Cache': 'hit'}
+
+            result = view(*args, **kwargs)
+            if isinstance(result, str) and not session.modified:
+                cache.set(key, result)
+            return result
+        return wrapper
+    return decorator
@@ -1,8 +1,12 @@
 # --- seed_goals.py ---
 
-from app import app, db, UserProfile, Goal, GoalMedia
+from app import create_app
+from extensions import db
+from models import UserProfile, Goal, GoalMedia
 from datetime import date, datetime
 
+app = create_app()
+
 def seed_goals():
     """Seeds the database with initial goals if they don't exist."""
     with app.app_context():
@@ -1,6 +1,10 @@
-from app import app, db, Plan
+from app import create_app
+from extensions import db
+from models import Plan
 from datetime import date
 
+app = create_app()
+
 def seed_data():
     with app.app_context():
         # Check if plans already exist to avoid duplicates
@@ -0,0 +1,66 @@
+"""XP and level progression for the tournament.
+
+Reaching level L takes xp_for_level(L) total XP, a curve that grows 10% per
+level. The thresholds are precomputed once into LEVEL_XP, so resolving an XP
+total to a level is a bisect over the table rather than a walk over levels,
+and a large reward can cross any number of levels in one step.
+"""
+from bisect import bisect_right
+
+# Highest level in the table. Far beyond what the seeded rewards can reach
+# (about level 35 with every milestone), and XP totals above the last
+# threshold resolve to it.
+MAX_LEVEL = 200
+
+
+def level_threshold(level):
+    """Total XP required to reach `level`: 1000, growing 10% per level, truncated to whole XP."""
+    return int(1000 * (1.1 ** (level - 1)))
+
+
+# LEVEL_XP[L - 1] is the least (integer) XP that reaches level L. XP totals are
+# whole numbers and the level-up check has always been `xp >= int(threshold)`,
+# so 1100 XP reaches level 2 even though 1000 * 1.1 is 1100.0000000000002.
+LEVEL_XP = [level_threshold(level) for level in range(1, MAX_LEVEL + 1)]
+
+
+def xp_for_level(level):
+    """Calculates the total XP required to reach a certain level."""
+    if 1 <= level <= MAX_LEVEL:
+        return LEVEL_XP[level - 1]
+    return level_threshold(level)
+
+
+def level_for_xp(xp):
+    """Highest level whose threshold is covered by `xp` (at least 1), in O(log n)."""
+    return max(1, bisect_right(LEVEL_XP, xp))
+
+
+def level_after_xp(level, xp):
+    """Level after an XP change. Never lower than `level`, because custom challenges promote without XP."""
+    return max(level, level_for_xp(xp))
+
+
+def level_progress(level, xp):
+    """XP bar figures for `level`: (XP needed for the next level, percent of the way there)."""
+    current, following = xp_for_level(level), xp_for_level(level + 1)
+    percentage = round((xp - current) / (following - current) * 100)
+    return following, min(100, max(0, percentage))
+
+
+def upcoming_levels(level, count=3):
+    """[(level, total XP)] for the next `count` levels."""
+    return [(next_level, xp_for_level(next_level)) for next_level in range(level + 1, level + 1 + count)]
+
+
+def rank_title(level):
+    """Display rank for a level, from "Bronze III" up to "Platinum I"."""
+    rank = "Bronze"
+    if level >= 10: rank = "Silver"
+    if level >= 20: rank = "Gold"
+    if level >= 30: rank = "Platinum"
+    sub_rank_tier = (level % 10)
+    if sub_rank_tier < 3: sub_rank = "III"
+    elif sub_rank_tier < 7: sub_rank = "II"
+    else: sub_rank = "I"
+    return f"{rank} {sub_rank}"
@@ -1,4 +1,8 @@
-from app import app, db, UserProfile, MotivationItem
+from app import create_app
+from extensions import db
+from models import UserProfile, MotivationItem
+
+app = create_app()
 
 def seed_motivation():
     """Seeds the database with initial motivation items if they don't exist."""
@@ -1,6 +1,11 @@
-from app import app, db, Workout, Event
+from app import create_app
+from extensions import db
+from models import Workout, Event
+from blueprints.athletes import default_user
 from datetime import datetime
 
+app = create_app()
+
 # --- Workout Data (unchanged) ---
 pushups_instructions = """
 - Start in plank position with hands shoulder-width apart
@@ -34,9 +39,14 @@ initial_events = [
 
 def seed_data():
     with app.app_context():
+        # Everything is seeded for the first athlete
+        owner = default_user()
+
         # Seed Workouts
         if Workout.query.first() is None:
             print("Seeding workouts...")
+            for workout in initial_workouts:
+                workout.user_id = owner.id
             db.session.bulk_save_objects(initial_workouts)
             db.session.commit()
             print("Workouts seeded successfully.")
@@ -46,6 +56,8 @@ def seed_data():
         # Seed Events
         if Event.query.first() is None:
             print("Seeding events...")
+            for event in initial_events:
+                event.user_id = owner.id
             db.session.bulk_save_objects(initial_events)
             db.session.commit()
             print("Events seeded successfully.")
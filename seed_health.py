@@ -1,6 +1,11 @@
-from app import app, db, UserProfile, HealthRecord, HealthPlanItem
+from app import create_app
+from extensions import db
+from models import UserProfile, HealthRecord, HealthPlanItem
+from blueprints.athletes import default_user
 from datetime import date
 
+app = create_app()
+
 def seed_health_data():
     """Seeds the UserProfile, HealthRecord, and HealthPlanItem tables."""
     with app.app_context():
@@ -14,6 +19,7 @@ def seed_health_data():
             print("User profile seeded successfully.")
         else:
             print("User profile already seeded.")
+        owner = default_user()
 
         # --- 2. Seed Health Records ---
         if HealthRecord.query.first() is None:
@@ -26,6 +32,8 @@ def seed_health_data():
                 HealthRecord(date=date(2025, 9, 1), weight=77.0, body_fat=15.5, notes='Started new program, feeling good'),
                 HealthRecord(date=date(2025, 8, 15), weight=77.5, body_fat=15.8, notes='Feeling strong'),
             ]
+            for record in initial_health_records:
+                record.user_id = owner.id
             db.session.bulk_save_objects(initial_health_records)
             db.session.commit()
             print("Health records seeded successfully.")
@@ -41,6 +49,8 @@ def seed_health_data():
                 HealthPlanItem(title='Update Health Profile', description='Review and update basic health information', status='completed'),
                 HealthPlanItem(title='Track Daily Water Intake', description='Maintain 3L water intake daily', status='pending'),
             ]
+            for item in initial_health_plan_items:
+                item.user_id = owner.id
             db.session.bulk_save_objects(initial_health_plan_items)
             db.session.commit()
             print("Health plan items seeded successfully.")
@@ -1,6 +1,11 @@
-from app import app, db, TrainingPlan
+from app import create_app
+from extensions import db
+from models import TrainingPlan
+from blueprints.athletes import default_user
 from datetime import date
 
+app = create_app()
+
 def seed_plan_data():
     """Seeds the TrainingPlan table with initial data."""
     with app.app_context():
@@ -49,6 +54,9 @@ def seed_plan_data():
             )
         ]
 
+        owner = default_user()
+        for plan in initial_plans:
+            plan.user_id = owner.id
         db.session.bulk_save_objects(initial_plans)
         db.session.commit()
         print("Training plans seeded successfully.")
@@ -1,6 +1,11 @@
-from app import app, db, ScheduleItem, StickyNote
+from app import create_app
+from extensions import db
+from models import ScheduleItem, StickyNote
+from blueprints.athletes import default_user
 from datetime import time
 
+app = create_app()
+
 # --- ScheduleItem Data ---
 initial_schedule_items = [
     ScheduleItem(title="Upper Body", details="Push-ups, Pull-ups, Dips", day_of_week="Monday", time=time(18, 30), category="workout", status="completed"),
@@ -26,9 +31,14 @@ initial_sticky_notes = [
 def seed_schedule_data():
     """Seeds only the ScheduleItem and StickyNote tables."""
     with app.app_context():
+        # Everything is seeded for the first athlete
+        owner = default_user()
+
         # Seed ScheduleItems
         if ScheduleItem.query.first() is None:
             print("Seeding schedule items...")
+            for item in initial_schedule_items:
+                item.user_id = owner.id
             db.session.bulk_save_objects(initial_schedule_items)
             db.session.commit()
             print("Schedule items seeded successfully.")
@@ -38,6 +48,8 @@ def seed_schedule_data():
         # Seed StickyNotes
         if StickyNote.query.first() is None:
             print("Seeding sticky notes...")
+            for note in initial_sticky_notes:
+                note.user_id = owner.id
             db.session.bulk_save_objects(initial_sticky_notes)
             db.session.commit()
             print("Sticky notes seeded successfully.")
@@ -1,4 +1,9 @@
-from app import app, db, UserProfile, Challenge, UserChallenge, Badge
+from app import create_app
+from extensions import db
+from models import Challenge, Badge
+from blueprints.tournament import link_system_challenges
+
+app = create_app()
 
 def seed_tournament_data():
     """Seeds all tables related to the tournament and gamification features."""
@@ -48,25 +53,14 @@ def seed_tournament_data():
             print("Milestone challenges seeded successfully.")
 
         # --- 3. Seed UserChallenge links for system challenges ---
-        user = UserProfile.query.first()
-        if user:
-            system_challenges = Challenge.query.filter_by(is_user_created=False).all()
-            existing_links = {uc.challenge_id for uc in UserChallenge.query.filter_by(user_id=user.id).all()}
-            
-            new_links = []
-            for challenge in system_challenges:
-                if challenge.id not in existing_links:
-                    new_links.append(UserChallenge(user_id=user.id, challenge_id=challenge.id, status='locked'))
-            
-            if new_links:
-                print("Seeding new UserChallenge links...")
-                db.session.bulk_save_objects(new_links)
-                db.session.commit()
-                print(f"{len(new_links)} new user-challenge links created.")
-            else:
-                print("UserChallenge links are up to date.")
+        # Every athlete gets the catalogue; links are created locked and the ones
+        # within each athlete's level are unlocked straight away
+        linked = link_system_challenges()
+        db.session.commit()
+        if linked:
+            print(f"{linked} new user-challenge links created.")
         else:
-            print("User not found, cannot seed UserChallenge links.")
+            print("UserChallenge links are up to date.")
 
 if __name__ == '__main__':
     seed_tournament_data()
@@ -1,6 +1,10 @@
-from app import app, db, UserProfile, Video
+from app import create_app
+from extensions import db
+from models import UserProfile, Video
 from datetime import datetime
 
+app = create_app()
+
 def seed_videos():
     """Seeds the database with initial video metadata if it doesn't exist."""
     with app.app_context():
@@ -0,0 +1,38 @@
+"""Times the trend engine on ten years of synthetic daily weigh-ins."""
+
+import timeit
+from datetime import date
+
+import numpy as np
+
+from health_trends import TrendState, weekly_aggregates, linear_trend, loess, project_target_day
+
+
+def main():
+    rng = np.random.default_rng(0)
+    days = np.arange(3650) + date(2015, 1, 1).toordinal()
+    values = 80 - 0.002 * np.arange(3650) + rng.normal(0, 0.4, 3650)
+    state = TrendState(days, values)
+    appended = TrendState(days[:-1000], values[:-1000])
+    tail = list(zip(days[-1000:].tolist(), values[-1000:].tolist()))
+    weekly = weekly_aggregates(days, values)
+
+    timings = {
+        'batch build (2 EMAs + sums)': (lambda: TrendState(days, values), 200),
+        'weekly aggregates': (lambda: weekly_aggregates(days, values), 200),
+        'linear trend (batch)': (lambda: linear_trend(days, values), 200),
+        'linear trend (running sums)': (lambda: state.linear_trend(), 10000),
+        'loess (weekly means, 60-point grid)': (lambda: loess(weekly['week_start'] + 3, weekly['mean'], counts=weekly['count']), 200),
+        'goal projection': (lambda: project_target_day(days, values, 70.0), 200),
+    }
+    for name, (function, number) in timings.items():
+        print(f"{name:<36} {timeit.timeit(function, number=number) / number * 1e6:9.1f} us")
+
+    started = timeit.default_timer()
+    for day, value in tail:
+        appended.append(day, value)
+    print(f"{'incremental append':<36} {(timeit.default_timer() - started) / len(tail) * 1e6:9.1f} us")
+
+
+if __name__ == '__main__':
+    main()
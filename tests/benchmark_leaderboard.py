@@ -0,0 +1,71 @@
+"""Times the ranked leaderboard index against the ORDER BY it replaces.
+
+The index is filled with synthetic athletes; the ORDER BY runs over the real
+user_profile table and is skipped when it is empty.
+"""
+
+import argparse
+import random
+import time
+import timeit
+
+from sqlalchemy import func, select
+
+from app import create_app
+from extensions import db
+from leaderboard import RankedIndex
+from models import UserProfile
+
+
+def benchmark_index(athletes=100000, lookups=10000, seed=0):
+    """Times loading, updating and querying an index of `athletes` random rows.
+
+    Returns {operation: microseconds per call}, with 'load' in milliseconds.
+    """
+    rng = random.Random(seed)
+    rows = [(user_id, rng.randint(1, 40), rng.randint(0, 50000)) for user_id in range(1, athletes + 1)]
+    index = RankedIndex()
+    started = time.perf_counter()
+    index.load(rows)
+    results = {'load (ms)': (time.perf_counter() - started) * 1000}
+
+    user_ids = [rng.randint(1, athletes) for _ in range(lookups)]
+    for name, operation in (
+        ('rank', lambda user_id: index.rank(user_id)),
+        ('around', lambda user_id: index.around(user_id, 5)),
+        ('update', lambda user_id: index.update(user_id, rng.randint(1, 40), rng.randint(0, 50000))),
+    ):
+        started = time.perf_counter()
+        for user_id in user_ids:
+            operation(user_id)
+        results[f'{name} (us)'] = (time.perf_counter() - started) / lookups * 1e6
+    return results
+
+
+def benchmark_order_by(runs=100):
+    """Microseconds to rank the first athlete with an ORDER BY over user_profile, or None without athletes."""
+    user_id = db.session.query(func.min(UserProfile.id)).scalar()
+    if user_id is None:
+        return None
+    ordered = select(UserProfile.id).order_by(UserProfile.level.desc(), UserProfile.experience_points.desc(), UserProfile.id)
+    elapsed = timeit.timeit(lambda: db.session.execute(ordered).scalars().all().index(user_id), number=runs)
+    return elapsed / runs * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--athletes', type=int, default=100000, help='Synthetic athletes in the index.')
+    args = parser.parse_args()
+
+    for name, value in benchmark_index(args.athletes).items():
+        print(f"index {name}: {value:.2f}")
+
+    app = create_app()
+    with app.app_context():
+        elapsed = benchmark_order_by()
+        if elapsed is not None:
+            print(f"ORDER BY scan over {db.session.query(func.count(UserProfile.id)).scalar()} athletes (us): {elapsed:.2f}")
+
+
+if __name__ == '__main__':
+    main()
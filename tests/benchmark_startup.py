@@ -0,0 +1,76 @@
+"""Times `import app`, then create_app() plus the first request to /, in fresh interpreters.
+
+The request is signed in as the only athlete of a throwaway database, so it
+times the dashboard rather than the redirect to /login, and the script exits
+non-zero unless it succeeds.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# Repository root, where each fresh interpreter imports the app from
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = (
+    "import sys, timeit\n"
+    "started = timeit.default_timer()\n"
+    "import app\n"
+    "imported = timeit.default_timer()\n"
+    "from models import UserProfile\n"
+    "application = app.create_app()\n"
+    "client = application.test_client()\n"
+    "with application.app_context():\n"
+    "    user_id = UserProfile.query.with_entities(UserProfile.id).limit(1).scalar()\n"
+    "with client.session_transaction() as client_session:\n"
+    "    client_session['user_id'] = user_id\n"
+    "status = client.get('/').status_code\n"
+    "served = timeit.default_timer()\n"
+    "print(imported - started, served - started, status, 'ffmpeg' in sys.modules, 'numpy' in sys.modules)\n"
+)
+
+
+def create_database(path):
+    """Creates the schema and one athlete in a throwaway SQLite file, leaving the configured database alone."""
+    from app import create_app
+    from extensions import db
+    from models import UserProfile
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}'})
+    with app.app_context():
+        db.create_all()
+        db.session.add(UserProfile(name='Benchmark', level=1, experience_points=0))
+        db.session.commit()
+        db.engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to time.')
+    runs = parser.parse_args().runs
+
+    import_times, first_request_times = [], []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'benchmark.db')
+        create_database(path)
+        environment = dict(os.environ, DATABASE_URL=f'sqlite:///{path}')
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, '-c', SCRIPT], cwd=ROOT, env=environment,
+                                    capture_output=True, text=True, check=True).stdout.split()
+            import_times.append(float(output[0]))
+            first_request_times.append(float(output[1]))
+            status, ffmpeg_loaded, numpy_loaded = output[2:5]
+            if status != '200':
+                raise SystemExit(f"The first request returned {status}, not 200; its timing would be an error page's.")
+
+    import_times.sort()
+    first_request_times.sort()
+    print(f"import app:          median {import_times[runs // 2] * 1000:.0f} ms (min {import_times[0] * 1000:.0f} ms)")
+    print(f"app + first request: median {first_request_times[runs // 2] * 1000:.0f} ms (min {first_request_times[0] * 1000:.0f} ms), status {status}")
+    print(f"loaded at first request: ffmpeg={ffmpeg_loaded}, numpy={numpy_loaded}")
+
+
+if __name__ == '__main__':
+    main()
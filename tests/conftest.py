@@ -0,0 +1,42 @@
+import pytest
+
+from app import create_app
+from extensions import db
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'UPLOAD_FOLDER': str(tmp_path / 'uploads' / 'goals'),
+        'MOTIVATION_UPLOAD_FOLDER': str(tmp_path / 'uploads' / 'motivation'),
+        'VIDEO_UPLOAD_FOLDER': str(tmp_path / 'uploads' / 'videos'),
+        'THUMBNAIL_UPLOAD_FOLDER': str(tmp_path / 'uploads' / 'thumbnails'),
+        'HLS_UPLOAD_FOLDER': str(tmp_path / 'uploads' / 'hls'),
+    })
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+PASSWORD = 'correct horse battery'
+
+
+def sign_up(client, name, password=PASSWORD):
+    return client.post('/athletes/add', data={'name': name, 'password': password})
+
+
+@pytest.fixture
+def anonymous_client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def client(app):
+    """A client signed in as a freshly created athlete."""
+    client = app.test_client()
+    sign_up(client, 'Tester')
+    return client
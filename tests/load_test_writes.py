@@ -0,0 +1,78 @@
+"""Hammers /health/add and /calendar/add from concurrent writers and reports latency and errors.
+
+The rows belong to a throwaway athlete that is removed afterwards. See tests/README.md.
+"""
+
+import argparse
+import threading
+import timeit
+from datetime import timedelta, date
+
+from app import create_app
+from extensions import db
+from models import UserProfile, HealthRecord, HealthSummary, Event
+
+
+def load_test_writes(app, writers, requests_per_writer):
+    athlete = UserProfile(name='Load test', level=1, experience_points=0)
+    db.session.add(athlete)
+    db.session.commit()
+    athlete_id = athlete.id
+
+    latencies, failures = [], []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(writers)
+
+    def writer(index):
+        client = app.test_client()
+        with client.session_transaction() as client_session:
+            client_session['user_id'] = athlete_id
+        start_barrier.wait()
+        for n in range(requests_per_writer):
+            day = date(2000, 1, 1) + timedelta(days=index * requests_per_writer + n)
+            if n % 2:
+                url, form = '/health/add', {'date': day.isoformat(), 'weight': '80'}
+            else:
+                url, form = '/calendar/add', {'title': 'Load test', 'category': 'workout', 'start_time': f'{day.isoformat()}T10:00'}
+            started = timeit.default_timer()
+            response = client.post(url, data=form)
+            elapsed = timeit.default_timer() - started
+            with lock:
+                latencies.append(elapsed)
+                if response.status_code != 302:
+                    failures.append(f'{url}: {response.status_code}')
+
+    started = timeit.default_timer()
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total = timeit.default_timer() - started
+
+    for model in (HealthRecord, Event, HealthSummary):
+        model.query.filter_by(user_id=athlete_id).delete()
+    db.session.delete(db.session.get(UserProfile, athlete_id))
+    db.session.commit()
+
+    latencies.sort()
+    print(f"backend: {db.engine.dialect.name}; {writers} writers x {requests_per_writer} requests")
+    print(f"{len(latencies)} requests in {total:.2f}s ({len(latencies) / total:.0f} req/s), {len(failures)} failed")
+    print(f"latency p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+    for failure in failures[:10]:
+        print(f"  {failure}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=8, help='Concurrent writer threads.')
+    parser.add_argument('--requests', dest='requests_per_writer', type=int, default=50, help='Requests per writer.')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        load_test_writes(app, args.writers, args.requests_per_writer)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+import app as app_module
+from app import create_app
+
+
+def test_importing_the_module_builds_no_app():
+    assert not hasattr(app_module, 'app')
+
+
+def test_each_app_keeps_its_own_state(app, tmp_path):
+    other = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'other.db'}"})
+    for name in ('page_cache', 'leaderboard', 'health_trend_cache', 'health_chart_cache'):
+        assert app.extensions[name] is not other.extensions[name]
+    assert app.extensions['video_executor'] is None and other.extensions['video_executor'] is None
@@ -0,0 +1,110 @@
+import os
+
+from flask_migrate import upgrade
+from sqlalchemy import text
+
+from app import create_app
+from extensions import db
+from models import Challenge, HealthRecord, UserChallenge, UserProfile
+
+from .conftest import PASSWORD, sign_up
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def test_anonymous_requests_must_sign_in(anonymous_client):
+    response = anonymous_client.get('/workouts')
+    assert response.status_code == 302
+    assert response.headers['Location'].startswith('/login')
+    assert anonymous_client.get('/api/leaderboard').status_code == 401
+
+
+def test_no_fallback_to_another_athletes_profile(app, client, anonymous_client):
+    # An athlete exists, but a fresh visitor still gets the sign-in page rather than their data
+    response = anonymous_client.get('/tournament')
+    assert response.status_code == 302
+    with anonymous_client.session_transaction() as client_session:
+        assert 'user_id' not in client_session
+
+
+def test_anonymous_visitor_cannot_mint_a_token(app, client, anonymous_client):
+    anonymous_client.post('/athletes/token', data={'password': PASSWORD})
+    with app.app_context():
+        assert UserProfile.query.filter_by(name='Tester').one().api_token_hash is None
+
+
+def test_token_minting_needs_the_password(app, client):
+    client.post('/athletes/token', data={'password': 'wrong password'})
+    with app.app_context():
+        assert UserProfile.query.filter_by(name='Tester').one().api_token_hash is None
+    client.post('/athletes/token', data={'password': PASSWORD})
+    with app.app_context():
+        assert UserProfile.query.filter_by(name='Tester').one().api_token_hash is not None
+
+
+def test_switching_athlete_needs_their_password(app, client, anonymous_client):
+    sign_up(anonymous_client, 'Other')
+    client.post('/logout')
+
+    client.post('/login', data={'name': 'Other', 'password': 'wrong password'})
+    with client.session_transaction() as client_session:
+        assert 'user_id' not in client_session
+
+    response = client.post('/login', data={'name': 'Other', 'password': PASSWORD, 'next': '//example.com/'})
+    assert response.headers['Location'] == '/'
+    with app.app_context(), client.session_transaction() as client_session:
+        assert client_session['user_id'] == UserProfile.query.filter_by(name='Other').one().id
+
+
+def test_sign_up_links_system_challenges(app, anonymous_client):
+    with app.app_context():
+        db.session.add_all([
+            Challenge(title='Starter', task_details='Train', level_requirement=1),
+            Challenge(title='Later', task_details='Train', level_requirement=10),
+        ])
+        db.session.commit()
+
+    sign_up(anonymous_client, 'Newcomer')
+    with app.app_context():
+        athlete = UserProfile.query.filter_by(name='Newcomer').one()
+        links = {link.challenge.title: link.status for link in UserChallenge.query.filter_by(user_id=athlete.id)}
+    assert links == {'Starter': 'unlocked', 'Later': 'locked'}
+
+
+def test_sign_up_while_signed_in_unlocks_the_new_athletes_challenges(app, client):
+    with app.app_context():
+        db.session.add_all([
+            Challenge(title='Starter', task_details='Train', level_requirement=1),
+            Challenge(title='Later', task_details='Train', level_requirement=10),
+        ])
+        db.session.commit()
+
+    # Created from the athletes page by 'Tester', whose rows the request is scoped to
+    sign_up(client, 'Second')
+    with app.app_context():
+        athlete = UserProfile.query.filter_by(name='Second').one()
+        links = {link.challenge.title: link.status for link in UserChallenge.query.filter_by(user_id=athlete.id)}
+    assert links == {'Starter': 'unlocked', 'Later': 'locked'}
+
+
+def test_profile_from_before_sign_in_can_sign_in_after_upgrade(tmp_path):
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'old.db'}"})
+    with app.app_context():
+        # The last revision before athletes had names, with the single profile it served
+        upgrade(directory=MIGRATIONS, revision='47574e527bf1')
+        db.session.execute(text("INSERT INTO user_profile (id, level, experience_points) VALUES (1, 3, 1250)"))
+        db.session.execute(text("INSERT INTO health_record (date, weight) VALUES ('2024-01-01', 80)"))
+        db.session.commit()
+        upgrade(directory=MIGRATIONS)
+        assert db.session.get(UserProfile, 1).name == 'Athlete 1'
+        db.engine.dispose()
+
+    result = app.test_cli_runner().invoke(args=['set-password', '1', '--name', 'Veteran', '--password', PASSWORD])
+    assert result.exit_code == 0, result.output
+
+    client = app.test_client()
+    client.post('/login', data={'name': 'Veteran', 'password': PASSWORD})
+    with client.session_transaction() as client_session:
+        assert client_session['user_id'] == 1
+    with app.app_context():
+        assert HealthRecord.query.filter_by(user_id=1).count() == 1
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from helpers import is_supported_month, month_window
+
+
+def test_last_supported_month_is_november_9999():
+    assert month_window(9999, 11) == (datetime(9999, 11, 1), datetime(9999, 12, 1))
+    assert not is_supported_month(9999, 12)
+    assert not is_supported_month(2026, 13)
+
+
+def test_calendar_page_at_the_upper_edge(client):
+    assert client.get('/calendar?year=9999&month=11').status_code == 200
+    # Out of range, so the current month is shown instead
+    assert client.get('/calendar?year=9999&month=12').status_code == 200
+
+
+def test_calendar_api_at_the_upper_edge(client):
+    response = client.get('/api/calendar?from=9999-12-01&to=9999-12-31')
+    assert response.status_code == 200
+    assert response.get_json()['days'] == {}
+    assert client.get('/api/calendar?from=9999-12-31&to=9999-12-01').status_code == 400
+
+
+def test_health_calendar_at_the_upper_edge(client):
+    assert client.get('/health?year=9999&month=11').status_code == 200
+    # Out of range, so the current month is shown instead
+    assert client.get('/health?year=9999&month=12').status_code == 200
+    assert client.get('/api/health/calendar?year=9999&month=11').get_json()['days'] == {}
+    assert client.get('/api/health/calendar?year=9999&month=12').status_code == 400
+
+
+def test_plans_api_at_the_upper_edge(client):
+    assert client.get('/api/plans?from=9999-12-01&to=9999-12-31').get_json()['plans'] == []
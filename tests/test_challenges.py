@@ -0,0 +1,93 @@
+import threading
+
+from blueprints.tournament import apply_level_change, sync_challenge_links
+from extensions import db
+from models import Badge, Challenge, UserBadge, UserChallenge, UserProfile
+from progression import level_after_xp
+
+
+def make_athlete(level):
+    athlete = UserProfile(name='Athlete', level=level, experience_points=0)
+    db.session.add(athlete)
+    db.session.flush()
+    return athlete
+
+
+def make_challenge(level_requirement, milestone=False):
+    challenge = Challenge(title=f'Level {level_requirement}', task_details='Train', level_requirement=level_requirement,
+                          is_milestone_challenge=milestone)
+    db.session.add(challenge)
+    db.session.flush()
+    return challenge
+
+
+def statuses(athlete):
+    return {link.challenge.level_requirement: link.status for link in UserChallenge.query.filter_by(user_id=athlete.id)}
+
+
+def test_level_change_links_and_unlocks_reached_milestones(app):
+    with app.app_context():
+        athlete = make_athlete(30)
+        make_challenge(25, milestone=True)
+        make_challenge(40, milestone=True)
+        assert apply_level_change(athlete) == (1, 1)
+        assert statuses(athlete) == {25: 'unlocked'}
+
+
+def test_links_created_later_are_unlocked_without_a_level_up(app):
+    with app.app_context():
+        athlete = make_athlete(30)
+        reached, not_reached = make_challenge(20), make_challenge(35)
+        db.session.add_all([UserChallenge(user_id=athlete.id, challenge_id=challenge.id, status='locked')
+                            for challenge in (reached, not_reached)])
+        unlocked, _ = sync_challenge_links([athlete.id])
+        assert unlocked == 1
+        assert statuses(athlete) == {20: 'unlocked', 35: 'locked'}
+
+
+def test_concurrent_completions_lose_no_xp_and_award_the_badge_once(app):
+    # Every challenge is a milestone worth 100 XP that awards the same badge, and
+    # each one is posted three times from different threads (double-clicks, other tabs)
+    threads, challenges, clicks, xp_reward = 4, 12, 3, 100
+    with app.app_context():
+        athlete = make_athlete(1)
+        badge = Badge(name='Milestones', description='Every milestone')
+        db.session.add(badge)
+        db.session.flush()
+        links = []
+        for n in range(challenges):
+            challenge = Challenge(title=f'Milestone {n}', task_details='Train', level_requirement=1, xp_reward=xp_reward,
+                                  is_milestone_challenge=True, awards_badge_id=badge.id)
+            db.session.add(challenge)
+            db.session.flush()
+            links.append(UserChallenge(user_id=athlete.id, challenge_id=challenge.id, status='unlocked'))
+        db.session.add_all(links)
+        db.session.commit()
+        athlete_id, badge_id = athlete.id, badge.id
+        # Consecutive entries go to different threads, so each challenge's clicks race each other
+        work = [link.id for link in links for _ in range(clicks)]
+
+    statuses_seen = []
+    start_barrier = threading.Barrier(threads)
+
+    def client_thread(index):
+        client = app.test_client()
+        with client.session_transaction() as client_session:
+            client_session['user_id'] = athlete_id
+        start_barrier.wait()
+        for user_challenge_id in work[index::threads]:
+            statuses_seen.append(client.post(f'/challenges/complete/{user_challenge_id}').status_code)
+
+    workers = [threading.Thread(target=client_thread, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert set(statuses_seen) == {302}
+    with app.app_context():
+        athlete = db.session.get(UserProfile, athlete_id)
+        assert athlete.experience_points == challenges * xp_reward
+        assert athlete.level == level_after_xp(1, challenges * xp_reward)
+        assert UserChallenge.query.filter_by(user_id=athlete_id, status='completed').count() == challenges
+        assert UserBadge.query.filter_by(user_id=athlete_id, badge_id=badge_id).count() == 1
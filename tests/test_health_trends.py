@@ -0,0 +1,70 @@
+import pytest
+
+import blueprints.health as health_module
+from app import create_app
+from models import HealthRecord
+
+
+@pytest.fixture
+def rebuilds(monkeypatch):
+    """Counts full loads of an athlete's trend arrays."""
+    calls = []
+    load = health_module.load_health_trend_states
+
+    def counting_load(user, summary):
+        calls.append(user.id)
+        return load(user, summary)
+    monkeypatch.setattr(health_module, 'load_health_trend_states', counting_load)
+    return calls
+
+
+def add_record(client, day, weight):
+    assert client.post('/health/add', data={'date': day, 'weight': weight}).status_code == 302
+
+
+def trend_points(client):
+    return client.get('/api/health/trends').get_json()['points']
+
+
+def test_new_records_extend_the_cached_trends(client, rebuilds):
+    add_record(client, '2026-01-01', '80')
+    assert trend_points(client) == 1
+    for points, day in enumerate(('2026-01-02', '2026-01-03'), start=2):
+        add_record(client, day, '79.5')
+        assert trend_points(client) == points
+    assert len(rebuilds) == 1
+
+
+def test_records_added_by_another_worker_are_appended(app, client, rebuilds):
+    add_record(client, '2026-01-01', '80')
+    assert trend_points(client) == 1
+
+    # A second app on the same database stands in for another worker process
+    other_worker = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': app.config['SQLALCHEMY_DATABASE_URI']})
+    other_client = other_worker.test_client()
+    with client.session_transaction() as client_session, other_client.session_transaction() as other_session:
+        other_session['user_id'] = client_session['user_id']
+    add_record(other_client, '2026-01-02', '79')
+
+    assert trend_points(client) == 2
+    assert len(rebuilds) == 1 # fetched by id and appended, not reloaded
+
+
+def test_rewriting_history_rebuilds_the_trends(app, client, rebuilds):
+    for day in ('2026-01-01', '2026-01-02'):
+        add_record(client, day, '80')
+    assert trend_points(client) == 2
+    with app.app_context():
+        first_id = HealthRecord.query.order_by(HealthRecord.date).first().id
+
+    client.post(f'/health/edit/{first_id}', data={'date': '2026-01-01', 'weight': '81'})
+    report = client.get('/api/health/trends').get_json()
+    assert report['points'] == 2 and report['weekly'][0]['max'] == 81
+    add_record(client, '2025-12-31', '82') # backdated
+    assert trend_points(client) == 3
+    assert len(rebuilds) == 3
+
+
+def test_trend_caches_are_bounded(app, client):
+    assert app.extensions['health_trend_cache'].max_entries == app.config['HEALTH_TREND_CACHE_SIZE']
+    assert app.extensions['health_chart_cache'].max_entries == app.config['HEALTH_CHART_CACHE_SIZE']
@@ -0,0 +1,73 @@
+import random
+
+import progression
+from progression import MAX_LEVEL, level_after_xp, level_for_xp
+
+
+def original_threshold(level):
+    # Copied from the code the table replaced rather than calling level_threshold(),
+    # so a change to how the table is built cannot make this check agree with itself
+    return int(1000 * (1.1 ** (level - 1)))
+
+
+def stepwise_level(level, xp):
+    # The replaced rule (`xp >= xp_for_level(level + 1)`, one level per check), repeated until it stops
+    while level < MAX_LEVEL and xp >= original_threshold(level + 1):
+        level += 1
+    return level
+
+
+def check_table(samples=100000, seed=0):
+    """Checks the table against the original level-up rule, written out independently of it.
+
+    Returns a list of failure descriptions (empty when every property holds).
+    """
+    failures = []
+    for level in range(1, MAX_LEVEL + 1):
+        if progression.xp_for_level(level) != original_threshold(level):
+            failures.append(f"threshold for level {level}: {progression.xp_for_level(level)} != {original_threshold(level)}")
+
+    rng = random.Random(seed)
+    top = original_threshold(MAX_LEVEL) + 1000
+    edges = [original_threshold(level) + delta for level in range(1, MAX_LEVEL + 1) for delta in (-1, 0, 1)]
+    previous_xp, previous_level = -1, 0
+    for xp in sorted(edges + [rng.randrange(0, top) for _ in range(samples)] + [rng.randrange(0, 100000) for _ in range(samples)]):
+        if xp < 0:
+            continue
+        level = level_for_xp(xp)
+        start = rng.randint(1, level)
+        if level_after_xp(start, xp) != stepwise_level(start, xp):
+            failures.append(f"xp {xp} from level {start}: {level_after_xp(start, xp)} != {stepwise_level(start, xp)}")
+        if level < previous_level and xp >= previous_xp:
+            failures.append(f"level decreased between xp {previous_xp} and {xp}")
+        in_bracket = progression.xp_for_level(level) <= xp and (level == MAX_LEVEL or xp < progression.xp_for_level(level + 1))
+        if xp >= progression.LEVEL_XP[0] and not in_bracket:
+            failures.append(f"xp {xp} is outside the thresholds of level {level}")
+        previous_xp, previous_level = xp, level
+        if len(failures) >= 20:
+            break
+    return failures
+
+
+def test_level_boundaries_match_the_original_check():
+    # The original check was `xp >= int(1000 * 1.1 ** (level - 1))`
+    assert level_for_xp(999) == 1
+    assert level_for_xp(1099) == 1
+    assert level_for_xp(1100) == 2
+    assert level_for_xp(1209) == 2
+    assert level_for_xp(1210) == 3
+
+
+def test_large_reward_crosses_several_levels():
+    assert level_after_xp(1, 5000) == 17
+
+
+def test_table_matches_the_original_rule():
+    assert check_table(samples=20000) == []
+
+
+def test_check_detects_a_shifted_threshold(monkeypatch):
+    shifted = list(progression.LEVEL_XP)
+    shifted[1] += 1 # level 2 at 1101 XP
+    monkeypatch.setattr(progression, 'LEVEL_XP', shifted)
+    assert check_table(samples=1000)
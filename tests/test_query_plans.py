@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from extensions import db
+from models import Challenge, UserChallenge
+
+from .conftest import PASSWORD, sign_up
+
+TODAY = date.today()
+
+# Pages and API endpoints hit on every visit
+HOT_ROUTES = [
+    '/',
+    '/workouts',
+    '/goals',
+    '/videos',
+    '/videos?category=tutorial',
+    '/motivation',
+    '/motivation?category=quote',
+    '/tournament',
+    '/api/leaderboard',
+    '/calendar',
+    f'/api/calendar?from={TODAY}&to={TODAY + timedelta(days=30)}',
+    '/plan',
+    f'/api/plans?from={TODAY}&to={TODAY + timedelta(days=30)}',
+    '/schedule',
+    '/health',
+    '/api/health/trends',
+    '/api/health/chart',
+    f'/api/health/calendar?year={TODAY.year}&month={TODAY.month}',
+]
+
+# Linking a new athlete to the whole challenge catalogue reads every challenge on purpose
+CATALOGUE_LINK = 'INSERT INTO user_challenge (user_id, challenge_id, status) SELECT user_profile.id, challenge.id'
+
+
+def capture_statements(engine, label, run):
+    """Runs `run()` and returns its result with [(label, sql, parameters)] for every statement it sent to the database."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            captured.append((label, statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        result = run()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return result, captured
+
+
+def query_plan(connection, statement, parameters):
+    return [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()]
+
+
+def test_hot_routes_use_an_index(app, anonymous_client):
+    """EXPLAIN QUERY PLAN (SQLite) must not show a whole-table SCAN for the SQL behind any hot route."""
+    with app.app_context():
+        # Worth a level-up, so completing it runs the unlock that follows a level change
+        db.session.add(Challenge(title='Starter', task_details='Train', level_requirement=1, xp_reward=5000))
+        db.session.commit()
+        engine = db.engine
+
+    client = anonymous_client
+    requests = [('sign-up', lambda: sign_up(client, 'Tester'), 302)]
+    requests += [(route, lambda route=route: client.get(route), 200) for route in HOT_ROUTES]
+    requests += [
+        ('complete challenge', lambda: client.post('/challenges/complete/1'), 302),
+        ('sign-in', lambda: client.post('/login', data={'name': 'Tester', 'password': PASSWORD}), 302),
+    ]
+    statements = []
+    for label, request, status in requests:
+        response, captured = capture_statements(engine, label, request)
+        assert response.status_code == status, label
+        statements += captured
+    with app.app_context():
+        assert UserChallenge.query.one().status == 'completed'
+
+    full_scans = {}
+    with engine.connect() as connection:
+        for label, statement, parameters in statements:
+            if not statement.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE', 'INSERT INTO USER_CHALLENGE')):
+                continue
+            # Statements without a filter (e.g. loading the leaderboard) read the whole table on purpose
+            if 'WHERE' not in statement or statement.startswith(CATALOGUE_LINK):
+                continue
+            details = query_plan(connection, statement, parameters)
+            if any(detail.startswith('SCAN') for detail in details):
+                full_scans.setdefault(label, []).append((statement, details))
+    assert full_scans == {}
@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from blueprints.videos import MmapFileSlice
+from extensions import db
+from models import UserProfile, Video
+
+
+def write_clip(path, size):
+    data = os.urandom(size)
+    path.write_bytes(data)
+    return data
+
+
+def test_slice_yields_the_requested_range(tmp_path):
+    chunk = MmapFileSlice.chunk_size
+    data = write_clip(tmp_path / 'clip.mp4', 3 * chunk)
+    body = MmapFileSlice(str(tmp_path / 'clip.mp4'), 10, 2 * chunk + 5)
+    try:
+        assert b''.join(bytes(part) for part in body) == data[10:10 + 2 * chunk + 5]
+    finally:
+        body.close()
+    assert body.file.closed
+
+
+def test_close_after_partial_read(tmp_path):
+    """A client that disconnects mid-range leaves the generator suspended on a view into the mmap."""
+    write_clip(tmp_path / 'clip.mp4', 3 * MmapFileSlice.chunk_size)
+    body = MmapFileSlice(str(tmp_path / 'clip.mp4'), 0, 3 * MmapFileSlice.chunk_size)
+    chunks = iter(body)
+    first = next(chunks)
+    body.close()
+    with pytest.raises(ValueError):
+        bytes(first) # released along with the mmap
+    assert body.map.closed
+    assert body.file.closed
+
+
+def test_aborted_range_response_closes_cleanly(app, client):
+    write_clip(Path(app.config['VIDEO_UPLOAD_FOLDER']) / 'clip.mp4', 3 * MmapFileSlice.chunk_size)
+    with app.app_context():
+        athlete = UserProfile.query.filter_by(name='Tester').one()
+        video = Video(title='Clip', category='skills', file_path='uploads/videos/clip.mp4', user_id=athlete.id)
+        db.session.add(video)
+        db.session.commit()
+        video_id = video.id
+
+    response = client.get(f'/videos/stream/{video_id}', headers={'Range': 'bytes=100-'}, buffered=False)
+    assert response.status_code == 206
+    next(response.response)
+    response.close()
+
+
+def test_unresized_thumbnail_fallback_is_not_cached(app, client, monkeypatch):
+    def failing_resize(source_path, target_path, width):
+        raise RuntimeError('ffmpeg failed')
+    monkeypatch.setattr('blueprints.videos.resize_thumbnail', failing_resize)
+    write_clip(Path(app.config['THUMBNAIL_UPLOAD_FOLDER']) / 'clip.jpg', 100)
+    with app.app_context():
+        athlete = UserProfile.query.filter_by(name='Tester').one()
+        video = Video(title='Clip', category='skills', file_path='uploads/videos/clip.mp4',
+                      thumbnail_path='uploads/thumbnails/clip.jpg', user_id=athlete.id)
+        db.session.add(video)
+        db.session.commit()
+        video_id = video.id
+
+    response = client.get(f'/thumbs/{video_id}/card')
+    assert response.status_code == 200
+    assert response.cache_control.no_cache and not response.cache_control.immutable
@@ -0,0 +1,77 @@
+import hashlib
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from extensions import db
+from models import UploadSession
+
+
+@pytest.fixture
+def start_upload(app, client):
+    app.config['VIDEO_UPLOAD_CHUNK_SIZE'] = 4
+
+    def start(total_size=10):
+        return client.post('/videos/uploads', data={
+            'title': 'Clip', 'category': 'skills', 'filename': 'clip.mp4', 'total_size': total_size
+        })
+    return start
+
+
+def put_chunk(client, session_id, index, body, checksum=None):
+    headers = {'X-Chunk-SHA256': checksum or hashlib.sha256(body).hexdigest()}
+    return client.put(f'/videos/uploads/{session_id}/chunks/{index}', data=body, headers=headers)
+
+
+def upload_path(app, session_id):
+    with app.app_context():
+        upload = db.session.get(UploadSession, session_id)
+        return os.path.join(app.config['VIDEO_UPLOAD_FOLDER'], upload.file_name)
+
+
+@pytest.mark.parametrize('total_size', [-1, 0, 500 * 1024 * 1024 + 1])
+def test_total_size_is_bounded(start_upload, total_size):
+    response = start_upload(total_size)
+    assert response.status_code == 400
+
+
+def test_bad_resend_keeps_the_received_chunk(app, client, start_upload):
+    session_id = start_upload().get_json()['session_id']
+    assert put_chunk(client, session_id, 0, b'good').status_code == 200
+
+    response = put_chunk(client, session_id, 0, b'evil', checksum=hashlib.sha256(b'good').hexdigest())
+    assert response.status_code == 422
+
+    with open(upload_path(app, session_id), 'rb') as f:
+        assert f.read(4) == b'good'
+    assert client.get(f'/videos/uploads/{session_id}').get_json()['received_chunks'] == [0]
+
+
+def test_chunks_land_at_their_offset_without_staging_files(app, client, start_upload):
+    session_id = start_upload().get_json()['session_id']
+    for index, body in ((2, b'89'), (0, b'0123'), (1, b'4567')):
+        assert put_chunk(client, session_id, index, body).status_code == 200
+
+    with open(upload_path(app, session_id), 'rb') as f:
+        assert f.read() == b'0123456789'
+    assert os.listdir(app.config['VIDEO_UPLOAD_FOLDER']) == [os.path.basename(upload_path(app, session_id))]
+
+
+def test_open_sessions_are_limited(app, start_upload):
+    for _ in range(app.config['VIDEO_UPLOAD_MAX_OPEN_SESSIONS']):
+        assert start_upload().status_code == 201
+    assert start_upload().status_code == 409
+
+
+def test_expired_session_is_discarded(app, client, start_upload):
+    session_id = start_upload().get_json()['session_id']
+    path = upload_path(app, session_id)
+    with app.app_context():
+        upload = db.session.get(UploadSession, session_id)
+        upload.created_at = datetime.utcnow() - timedelta(seconds=app.config['VIDEO_UPLOAD_SESSION_TTL'] + 1)
+        db.session.commit()
+
+    assert put_chunk(client, session_id, 0, b'late').status_code == 410
+    assert client.get(f'/videos/uploads/{session_id}').status_code == 404
+    assert not os.path.exists(path)